@@ -7,6 +7,7 @@ PARAM_DIR = CONFIG_DIR / "params"
 
 # Parameters paths
 DATASET_PARAMS_FILE = PARAM_DIR / "dataset_params.yaml"
+KERAS_PARAMS_FILE = PARAM_DIR / "keras_params.yaml"
 
 DATA_DIR = PROJ_ROOT / "data"
 ARTIFACTS_DIR = PROJ_ROOT / "artifacts"
@@ -18,9 +19,11 @@ FIGURES_DIR = REPORTS_DIR / "figures"
 RAW_DATA_DIR = DATA_DIR / "raw"
 MAIN_RAW_FILE = RAW_DATA_DIR / "raw_dataset.csv"
 TEST_RAW_FILE = RAW_DATA_DIR / "test_raw_dataset.csv"
+FEATURE_STORE_DIR = DATA_DIR / "feature_store"
 
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 MAIN_PROCESSED_FILE = PROCESSED_DATA_DIR / "processed_dataset.csv"
+CHECKPOINTS_DIR = PROCESSED_DATA_DIR / "checkpoints"
 
 PROCESSED_DATA_TRAIN_DIR = PROCESSED_DATA_DIR / "train"
 X_PROCESSED_DATA_TRAIN_FILE = PROCESSED_DATA_TRAIN_DIR / "X_train.npy"
@@ -43,3 +46,5 @@ MAIN_PREPROCESSOR_FILE = PREPROCESSOR_DIR / "main_preprocessor.pkl"
 
 POSTPROCESSOR_DIR = ARTIFACTS_DIR / "postprocessors"
 MAIN_POSTPROCESSOR_FILE = POSTPROCESSOR_DIR / "main_postprocessor.pkl"
+
+PREPARED_CONFIGS_DIR = ARTIFACTS_DIR / "prepared_configs"
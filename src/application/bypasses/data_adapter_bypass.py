@@ -2,7 +2,13 @@ from src.domain.entities.stages.selected_data import SelectedData
 from src.domain.entities.stages.model_input_data import ModelInputData
 from src.domain.entities.stages.model_output_data import ModelOutputData
 from src.domain.entities.stages.predicted_data import PredictedData
-from domain.interfaces.strategies.i_model_adapter import IModelAdapter
+from domain.interfaces.strategies.i_model_adapter import (
+    IModelAdapter,
+    TransformationConfig,
+    TransformationSummary,
+    InverseConfig,
+    InverseSummary,
+)
 
 
 class DataAdapterBypass(IModelAdapter):
@@ -11,12 +17,22 @@ class DataAdapterBypass(IModelAdapter):
     Useful for testing, composition, or bypassing selection logic in pipelines.
     """
 
-    def fit(self, data: SelectedData) -> None:
+    def prepare_transform(self, data: SelectedData) -> TransformationSummary:
         # Mock metadata output
-        pass
+        return TransformationSummary(
+            config=TransformationConfig(params={}), observations={}
+        )
 
-    def transform(self, data: SelectedData) -> ModelInputData:
-        return ModelInputData(data.data)
+    def transform(
+        self, data: SelectedData, config: TransformationConfig = None
+    ) -> ModelInputData:
+        return data.to_stage(ModelInputData)
 
-    def inverse_transform(self, data: ModelOutputData) -> PredictedData:
-        return PredictedData(data.data)
+    def prepare_inverse(self, output: ModelOutputData) -> InverseSummary:
+        # Mock metadata output
+        return InverseSummary(config=InverseConfig(params={}), observations={})
+
+    def inverse_transform(
+        self, data: ModelOutputData, config: InverseConfig = None
+    ) -> PredictedData:
+        return data.to_stage(PredictedData)
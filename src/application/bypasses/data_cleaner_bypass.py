@@ -1,6 +1,10 @@
 from src.domain.entities.stages.raw_data import RawData
 from src.domain.entities.stages.cleaned_data import CleanedData
-from domain.interfaces.strategies.i_feature_cleaner import IFeatureCleaner
+from domain.interfaces.strategies.i_feature_cleaner import (
+    IFeatureCleaner,
+    CleaningConfig,
+    CleaningSummary,
+)
 
 
 class DataCleanerBypass(IFeatureCleaner):
@@ -9,9 +13,9 @@ class DataCleanerBypass(IFeatureCleaner):
     Useful for testing, composition, or bypassing selection logic in pipelines.
     """
 
-    def fit(self, data: RawData) -> None:
+    def prepare(self, data: RawData) -> CleaningSummary:
         # Mock metadata output
-        pass
+        return CleaningSummary(config=CleaningConfig(), issues={})
 
-    def clean(self, data: RawData) -> CleanedData:
-        CleanedData(data.data)
+    def clean(self, data: RawData, config: CleaningConfig = None) -> CleanedData:
+        return data.to_stage(CleanedData)
@@ -1,6 +1,10 @@
-from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
 from src.domain.entities.stages.selected_data import SelectedData
-from domain.interfaces.strategies.i_feature_selector import IFeatureSelector
+from domain.interfaces.strategies.i_feature_selector import (
+    IFeatureSelector,
+    SelectionConfig,
+    SelectionSummary,
+)
 
 
 class DataSelectorBypass(IFeatureSelector):
@@ -9,10 +13,10 @@ class DataSelectorBypass(IFeatureSelector):
     Useful for testing, composition, or bypassing selection logic in pipelines.
     """
 
-    def fit(self, data: RawData) -> None:
+    def prepare(self, data: CleanedData) -> SelectionSummary:
         # Mock metadata output
-        pass
+        return SelectionSummary(config=SelectionConfig(details={}), observations={})
 
-    def select(self, data: SelectedData) -> SelectedData:
+    def select(self, data: CleanedData, config: SelectionConfig = None) -> SelectedData:
         # Pass-through — no transformation applied
-        return SelectedData(data.data)
+        return data.to_stage(SelectedData)
@@ -1,6 +1,13 @@
 from src.domain.entities.stages.model_input_data import ModelInputData
 from src.domain.entities.stages.model_output_data import ModelOutputData
-from src.domain.interfaces.strategies.i_model import IModel
+from src.domain.enums.problem_type import ProblemType
+from src.domain.interfaces.strategies.i_model import (
+    IModel,
+    TrainingConfig,
+    TrainingSummary,
+    PredictionConfig,
+    PredictionSummary,
+)
 
 
 class ModelBypass(IModel):
@@ -9,9 +16,24 @@ class ModelBypass(IModel):
     Useful for testing, composition, or bypassing selection logic in pipelines.
     """
 
-    def train(self, data: ModelInputData) -> None:
+    def prepare_training(
+        self, problem_type: ProblemType, data: ModelInputData
+    ) -> TrainingSummary:
         # Mock metadata output
+        return TrainingSummary(config=TrainingConfig(params={}), observations={})
+
+    def train(
+        self,
+        problem_type: ProblemType,
+        data: ModelInputData,
+        config: TrainingConfig = None,
+    ) -> None:
         pass
 
-    def predict(self, data: ModelInputData) -> ModelOutputData:
-        return ModelOutputData(data.data)
+    def prepare_prediction(self, data: ModelInputData) -> PredictionSummary:
+        return PredictionSummary(config=PredictionConfig(params={}), diagnostics={})
+
+    def predict(
+        self, data: ModelInputData, config: PredictionConfig = None
+    ) -> ModelOutputData:
+        return data.to_stage(ModelOutputData)
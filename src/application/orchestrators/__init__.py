@@ -1,6 +1,20 @@
 from .end2end_prediction_flow import End2EndPredictionFlow
 from .enrichment_flow import EnrichmentFlow
+from .partitioned_enrichment_flow import PartitionedEnrichmentFlow
+from .lazy_enrichment_flow import LazyEnrichmentFlow, QueryPlan
+from .pipeline import Pipeline
+from .train_flow import TrainFlow
+from .walk_forward_backtest import BacktestResult, WalkForwardBacktest, plan_folds
 
-# from .train_flow import TrainFlow
-
-__all__ = ["End2EndPredictionFlow", "EnrichmentFlow", "TrainFlow"]
+__all__ = [
+    "End2EndPredictionFlow",
+    "EnrichmentFlow",
+    "PartitionedEnrichmentFlow",
+    "LazyEnrichmentFlow",
+    "QueryPlan",
+    "Pipeline",
+    "TrainFlow",
+    "WalkForwardBacktest",
+    "BacktestResult",
+    "plan_folds",
+]
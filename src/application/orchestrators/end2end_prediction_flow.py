@@ -1,34 +1,55 @@
+from typing import Optional
+
 from src.domain.entities.stages.raw_data import RawData
 from src.domain.entities.stages.predicted_data import PredictedData
 
 from domain.interfaces.strategies.i_feature_cleaner import IFeatureCleaner
 from domain.interfaces.strategies.i_feature_selector import IFeatureSelector
-from domain.interfaces.strategies.i_model_adapter import IDataAdapter
+from domain.interfaces.strategies.i_model_adapter import IModelAdapter
 from src.domain.interfaces.strategies.i_model import IModel
+from src.domain.interfaces.repositories import IPreparedConfigStore
 
 from src.application.bypasses.data_cleaner_bypass import DataCleanerBypass
 from src.application.bypasses.data_selector_bypass import DataSelectorBypass
 from src.application.bypasses.data_adapter_bypass import DataAdapterBypass
 from src.application.bypasses.model_bypass import ModelBypass
+from src.application.services.prepared_configs import PreparedConfigResolver
 
 
 class End2EndPredictionFlow:
     """
     Application use case for executing prediction using a trained model
     and an associated data adapter for transformation.
+
+    Cleaning, selection, transformation and inverse configs are resolved through
+    a PreparedConfigResolver: pass config_store plus the training data fingerprint
+    as config_key to load them instead of re-preparing on every scoring batch.
     """
 
     def __init__(
         self,
         cleaner: IFeatureCleaner = None,
         selector: IFeatureSelector = None,
-        adapter: IDataAdapter = None,
+        adapter: IModelAdapter = None,
         model: IModel = None,
+        config_store: IPreparedConfigStore = None,
+        config_key: Optional[str] = None,
     ) -> None:
         self.cleaner = cleaner or DataCleanerBypass()
         self.selector = selector or DataSelectorBypass()
         self.adapter = adapter or DataAdapterBypass()
         self.model = model or ModelBypass()
+        self.configs = PreparedConfigResolver(config_store, config_key)
+
+    def preload(self) -> None:
+        """
+        Load every stored config up front so the first request only runs apply steps.
+        Requires config_store and config_key.
+        """
+        self.configs.preload("cleaning", self.cleaner)
+        self.configs.preload("selection", self.selector)
+        self.configs.preload("transformation", self.adapter)
+        self.configs.preload("inverse", self.adapter)
 
     def execute(self, data: RawData) -> PredictedData:
         """
@@ -40,11 +61,41 @@ class End2EndPredictionFlow:
         Returns:
             PredictedData: Final transformed prediction.
         """
+        fingerprint = self.configs.fingerprint(data)
+
+        cleaning_config = self.configs.resolve(
+            "cleaning",
+            self.cleaner,
+            fingerprint,
+            lambda: self.cleaner.prepare(data).config,
+        )
+        cleaned_data = self.cleaner.clean(data, cleaning_config)
+
+        selection_config = self.configs.resolve(
+            "selection",
+            self.selector,
+            fingerprint,
+            lambda: self.selector.prepare(cleaned_data).config,
+        )
+        selected_data = self.selector.select(cleaned_data, selection_config)
+
+        transformation_config = self.configs.resolve(
+            "transformation",
+            self.adapter,
+            fingerprint,
+            lambda: self.adapter.prepare_transform(selected_data).config,
+        )
+        input_data = self.adapter.transform(selected_data, transformation_config)
+
+        prediction = self.model.prepare_prediction(input_data)
+        output_data = self.model.predict(input_data, prediction.config)
 
-        cleaned_data = self.cleaner.clean(data)
-        selected_data = self.selector.select(cleaned_data)
-        input_data = self.adapter.transform(selected_data)
-        output_data = self.model.predict(input_data)
-        predicted_data = self.adapter.inverse_transform(output_data)
+        inverse_config = self.configs.resolve(
+            "inverse",
+            self.adapter,
+            fingerprint,
+            lambda: self.adapter.prepare_inverse(output_data).config,
+        )
+        predicted_data = self.adapter.inverse_transform(output_data, inverse_config)
 
         return predicted_data
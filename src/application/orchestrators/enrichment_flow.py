@@ -1,24 +1,36 @@
+from typing import Optional
+
 from src.domain.entities.stages.raw_data import RawData
 from src.domain.entities.stages.selected_data import SelectedData
 
 from domain.interfaces.strategies.i_feature_cleaner import IFeatureCleaner
 from domain.interfaces.strategies.i_feature_selector import IFeatureSelector
+from src.domain.interfaces.repositories import IPreparedConfigStore
 
 from src.application.bypasses.data_cleaner_bypass import DataCleanerBypass
 from src.application.bypasses.data_selector_bypass import DataSelectorBypass
+from src.application.services.prepared_configs import PreparedConfigResolver
 
 
 class EnrichmentFlow:
     """
-    Application use case for executing prediction using a trained model
-    and an associated data adapter for transformation.
+    Application use case that cleans raw data and selects the relevant features,
+    running each strategy through its prepare → apply steps.
+
+    With a config_store, prepared configs are persisted by data fingerprint and
+    reused on later runs, so only the apply steps execute.
     """
 
     def __init__(
-        self, cleaner: IFeatureCleaner = None, selector: IFeatureSelector = None
+        self,
+        cleaner: IFeatureCleaner = None,
+        selector: IFeatureSelector = None,
+        config_store: IPreparedConfigStore = None,
+        config_key: Optional[str] = None,
     ) -> None:
         self.cleaner = cleaner or DataCleanerBypass()
         self.selector = selector or DataSelectorBypass()
+        self.configs = PreparedConfigResolver(config_store, config_key)
 
     def execute(self, data: RawData) -> SelectedData:
         """
@@ -30,8 +42,22 @@ class EnrichmentFlow:
         Returns:
             SelectedData: Selected data.
         """
-
-        cleaned_data = self.cleaner.clean(data)
-        selected_data = self.selector.select(cleaned_data)
+        fingerprint = self.configs.fingerprint(data)
+
+        cleaning_config = self.configs.resolve(
+            "cleaning",
+            self.cleaner,
+            fingerprint,
+            lambda: self.cleaner.prepare(data).config,
+        )
+        cleaned_data = self.cleaner.clean(data, cleaning_config)
+
+        selection_config = self.configs.resolve(
+            "selection",
+            self.selector,
+            fingerprint,
+            lambda: self.selector.prepare(cleaned_data).config,
+        )
+        selected_data = self.selector.select(cleaned_data, selection_config)
 
         return selected_data
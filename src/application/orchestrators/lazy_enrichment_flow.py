@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.domain.interfaces.repositories import IScanQuery
+
+from src.application.orchestrators.enrichment_flow import EnrichmentFlow
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    What a lazy run needs from the raw sources.
+
+    Attributes:
+        columns: Raw columns to materialize, or None for every column.
+        start: Earliest observation to load (inclusive), or None.
+        end: Latest observation to load (inclusive), or None.
+    """
+
+    columns: Optional[Tuple[str, ...]] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @property
+    def is_projected(self) -> bool:
+        return self.columns is not None
+
+
+class LazyEnrichmentFlow:
+    """
+    Builds a query plan from the stages' declared column needs and pushes it down
+    to the raw sources before running an EnrichmentFlow.
+
+    The plan is derived backwards from the prepared configs: the selector's
+    SelectionConfig names the columns it keeps, the cleaner maps those onto the
+    raw columns it must read, and the targets are always added. Only those columns,
+    within [start, end], are requested from each IScanQuery source.
+
+    Pushdown needs the configs prepared on a previous full run, so the wrapped flow
+    must have a config_store and a config_key (the training data fingerprint).
+    Without them the plan falls back to loading every column.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[IScanQuery],
+        flow: EnrichmentFlow = None,
+        *,
+        targets: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> None:
+        self.sources = list(sources)
+        self.flow = flow or EnrichmentFlow()
+        self.targets = list(targets or [])
+        self.start = start
+        self.end = end
+
+    def plan(self) -> QueryPlan:
+        """
+        Resolve the columns each stage declares, from the last stage backwards.
+        """
+        try:
+            selection = self.flow.configs.preload("selection", self.flow.selector)
+            cleaning = self.flow.configs.preload("cleaning", self.flow.cleaner)
+        except (KeyError, ValueError):
+            return QueryPlan(start=self.start, end=self.end)
+
+        needed = self.flow.selector.required_columns(selection)
+        needed = self.flow.cleaner.required_columns(cleaning, needed)
+        if needed is None:
+            return QueryPlan(start=self.start, end=self.end)
+
+        columns: List[str] = list(dict.fromkeys([*needed, *self.targets]))
+        return QueryPlan(columns=tuple(columns), start=self.start, end=self.end)
+
+    def materialize(self, plan: QueryPlan) -> RawData:
+        """
+        Load only what the plan asks for from every source and join on the index.
+        """
+        frames = []
+        for source in self.sources:
+            datasets = source.scan(columns=plan.columns, start=plan.start, end=plan.end)
+            frames.extend(df for df in datasets.values() if df is not None)
+        if not frames:
+            raise ValueError("No source returned data for the query plan")
+
+        frame = pd.concat(frames, axis=1).sort_index()
+        if plan.is_projected:
+            frame = frame[[c for c in plan.columns if c in frame.columns]]
+
+        targets = [t for t in self.targets if t in frame.columns]
+        features = [c for c in frame.columns if c not in targets] or list(frame.columns)
+        return RawData(
+            data=frame,
+            schema=DatasetSchema(columns=features, targets=targets or None),
+            metadata={"query_plan": plan},
+        )
+
+    def execute(self) -> SelectedData:
+        """
+        Plan, materialize the projected raw data and run the enrichment flow on it.
+
+        Returns:
+            SelectedData: Selected data, identical to an eager run restricted to the
+                          planned columns and date range.
+        """
+        return self.flow.execute(self.materialize(self.plan()))
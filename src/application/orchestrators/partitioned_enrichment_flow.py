@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.stages.selected_data import SelectedData
+from domain.interfaces.strategies.i_feature_cleaner import (
+    CleaningConfig,
+    IFeatureCleaner,
+)
+
+from src.application.orchestrators.enrichment_flow import EnrichmentFlow
+from src.application.orchestrators.partitioning import (
+    TIME,
+    PartitionSpec,
+    partition_schema,
+    plan_partitions,
+    reassemble,
+    split,
+)
+
+
+@dataclass(frozen=True)
+class _SharedBlock:
+    """
+    Handle to a 2-D numeric block living in a named shared memory segment.
+    Only this handle (a few bytes) is pickled to the workers.
+    """
+
+    name: str
+    shape: tuple[int, int]
+    dtype: str
+    order: str
+
+
+@dataclass(frozen=True)
+class _SharedTask:
+    block: _SharedBlock
+    rows: slice
+    cols: slice
+    columns: tuple[str, ...]
+    index: pd.Index
+    template: RawData  # entity fields with an empty payload
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = SharedMemory(name=name)
+        # The parent owns (and unlinks) the segment; stop this process's
+        # resource tracker from reclaiming it on exit.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _detached(result: CleanedData, matrix: np.ndarray) -> CleanedData:
+    # A result may still be a view of the partition (e.g. columns the flow did
+    # not touch); copy it out before the segment is unmapped under it.
+    data = result.data
+    if isinstance(data, pd.DataFrame):
+        aliased = any(
+            np.may_share_memory(data.iloc[:, j].to_numpy(), matrix)
+            for j in range(data.shape[1])
+        )
+    else:
+        aliased = isinstance(data, np.ndarray) and np.may_share_memory(data, matrix)
+    if not aliased:
+        return result
+    return result.to_stage(type(result), data=data.copy(), identity=result.identity)
+
+
+def _run_shared(
+    cleaner: IFeatureCleaner, config: CleaningConfig, task: _SharedTask
+) -> CleanedData:
+    block = task.block
+    shm = _attach(block.name)
+    try:
+        matrix = np.ndarray(
+            block.shape, dtype=np.dtype(block.dtype), buffer=shm.buf, order=block.order
+        )
+        frame = pd.DataFrame(
+            matrix[task.rows, task.cols],
+            index=task.index,
+            columns=list(task.columns),
+            copy=False,
+        )
+        result = cleaner.clean(task.template.to_stage(RawData, data=frame), config)
+        return _detached(result, matrix)
+    finally:
+        # Segments are attached per task and unmapped when it ends, so pool
+        # workers do not keep one mapping per run for their whole lifetime.
+        matrix = frame = None
+        shm.close()
+
+
+def _run_pickled(
+    cleaner: IFeatureCleaner, config: CleaningConfig, part: RawData
+) -> CleanedData:
+    return cleaner.clean(part, config)
+
+
+class PartitionedEnrichmentFlow:
+    """
+    Runs the clean step of an EnrichmentFlow on each partition of a RawData
+    payload in a process pool.
+
+    The cleaning config is prepared once on the whole payload (through the flow's
+    config store when it has one), so every partition is imputed and clipped with
+    the same statistics; the workers only run clean(). The cleaned parts are
+    reassembled and the selector is prepared and applied once on the result, so
+    the output has one column set and one schema, exactly as a serial run.
+
+    The payload is split by time range (one partition per period) or by ticker
+    (one partition per column prefix); ticker partitions need a column-wise
+    cleaner, which cleans the configured columns each part carries. Homogeneous
+    numeric frames are copied once into a shared memory block laid out so that
+    every partition is a contiguous slice; workers rebuild their partition as a
+    view over that block instead of receiving a pickled copy, and unmap it when
+    their task ends. Frames with mixed or non-numeric dtypes fall back to
+    pickling each partition.
+    """
+
+    def __init__(
+        self,
+        flow: EnrichmentFlow = None,
+        *,
+        partition_by: str = TIME,
+        freq: str = "Y",
+        separator: str = "_",
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.flow = flow or EnrichmentFlow()
+        self.partition_by = partition_by
+        self.freq = freq
+        self.separator = separator
+        self.max_workers = max_workers or os.cpu_count()
+
+    def execute(self, data: RawData) -> SelectedData:
+        """
+        Prepares the cleaner on the whole payload, cleans the partitions in
+        parallel, reassembles them in partition order and runs selection once.
+
+        Args:
+            data (RawData): Raw input data whose payload is a pandas DataFrame.
+
+        Returns:
+            SelectedData: Selected data with metadata["partitions"] listing the parts.
+        """
+        frame = data.data
+        if not isinstance(frame, pd.DataFrame):
+            raise TypeError("PartitionedEnrichmentFlow requires a DataFrame payload")
+
+        flow = self.flow
+        fingerprint = flow.configs.fingerprint(data)
+        config = flow.configs.resolve(
+            "cleaning",
+            flow.cleaner,
+            fingerprint,
+            lambda: flow.cleaner.prepare(data).config,
+        )
+
+        specs = plan_partitions(
+            frame, by=self.partition_by, freq=self.freq, separator=self.separator
+        )
+        if len(specs) <= 1 or self.max_workers <= 1:
+            parts = [flow.cleaner.clean(part, config) for part in split(data, specs)]
+        elif self._is_shareable(frame):
+            parts = self._execute_shared(data, specs, config)
+        else:
+            parts = self._execute_pickled(data, specs, config)
+        cleaned = reassemble(parts, source=data, stage=CleanedData)
+
+        selection = flow.configs.resolve(
+            "selection",
+            flow.selector,
+            fingerprint,
+            lambda: flow.selector.prepare(cleaned).config,
+        )
+        return flow.selector.select(cleaned, selection)
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _is_shareable(frame: pd.DataFrame) -> bool:
+        dtypes = set(frame.dtypes)
+        return len(dtypes) == 1 and np.issubdtype(dtypes.pop(), np.number)
+
+    def _execute_pickled(
+        self, data: RawData, specs: Sequence[PartitionSpec], config: CleaningConfig
+    ) -> List[CleanedData]:
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(_run_pickled, self.flow.cleaner, config, part)
+                for part in split(data, specs)
+            ]
+            return [f.result() for f in futures]
+
+    def _execute_shared(
+        self, data: RawData, specs: Sequence[PartitionSpec], config: CleaningConfig
+    ) -> List[CleanedData]:
+        frame: pd.DataFrame = data.data
+        # Row partitions are contiguous in C order; column partitions are made
+        # contiguous by writing their columns side by side in Fortran order.
+        if self.partition_by == TIME:
+            order, columns = "C", list(frame.columns)
+        else:
+            order, columns = "F", [c for spec in specs for c in spec.columns]
+        values = frame[columns].to_numpy()
+
+        shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+        shared = None
+        try:
+            block = _SharedBlock(shm.name, values.shape, values.dtype.str, order)
+            shared = np.ndarray(
+                values.shape, dtype=values.dtype, buffer=shm.buf, order=order
+            )
+            shared[...] = values
+            del values
+
+            tasks = []
+            offset = 0
+            for spec in specs:
+                width = len(spec.columns)
+                cols = (
+                    slice(0, width)
+                    if self.partition_by == TIME
+                    else slice(offset, offset + width)
+                )
+                offset += width
+                tasks.append(
+                    _SharedTask(
+                        block=block,
+                        rows=spec.rows,
+                        cols=cols,
+                        columns=spec.columns,
+                        index=frame.index[spec.rows],
+                        template=self._template(data, spec),
+                    )
+                )
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [
+                    pool.submit(_run_shared, self.flow.cleaner, config, t)
+                    for t in tasks
+                ]
+                return [f.result() for f in futures]
+        finally:
+            del shared
+            shm.close()
+            shm.unlink()
+
+    @staticmethod
+    def _template(data: RawData, spec: PartitionSpec) -> RawData:
+        empty: Any = pd.DataFrame(columns=list(spec.columns))
+        return data.to_stage(
+            RawData,
+            data=empty,
+            schema=partition_schema(data.schema, spec.columns),
+            partition_info=spec.info,
+        )
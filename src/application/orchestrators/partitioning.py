@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Type
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.base import BaseDataEntity
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.value_objects import DatasetSchema
+
+TIME = "time"
+TICKER = "ticker"
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """
+    Positional description of one partition of a tabular RawData payload.
+
+    Attributes:
+        order: Position of the partition in the reassembled output.
+        kind: "time" (row range) or "ticker" (column group).
+        rows: Row slice [start, stop) into the source frame.
+        columns: Column labels of the partition, in source order.
+        label: Human-readable range or ticker name.
+    """
+
+    order: int
+    kind: str
+    rows: slice
+    columns: tuple[str, ...]
+    label: str
+
+    @property
+    def info(self) -> str:
+        """
+        Value stored in BaseDataEntity.partition_info, e.g. "time:0:2021-01-04/2021-12-30".
+        """
+        return f"{self.kind}:{self.order}:{self.label}"
+
+
+def parse_partition_info(info: str) -> tuple[str, int, str]:
+    """
+    Split a partition_info string into (kind, order, label).
+    """
+    kind, order, label = info.split(":", 2)
+    return kind, int(order), label
+
+
+def ticker_of(column: str, separator: str = "_") -> str:
+    """
+    Loaders prefix every column with the series name (e.g. "IndBovespa_Close",
+    "SELIC_Anual_valor"), so the ticker is everything before the last separator.
+    """
+    head, sep, _ = column.rpartition(separator)
+    return head if sep else column
+
+
+def plan_time_partitions(frame: pd.DataFrame, freq: str = "Y") -> List[PartitionSpec]:
+    """
+    Split a frame indexed by a sorted DatetimeIndex into contiguous row ranges,
+    one per period of the given pandas period alias (default: one per year).
+    """
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise TypeError("time partitioning requires a DatetimeIndex")
+    if not frame.index.is_monotonic_increasing:
+        raise ValueError("time partitioning requires a sorted index")
+
+    codes = frame.index.to_period(freq).asi8
+    # Row positions where the period changes mark the partition boundaries.
+    starts = [0] + (np.flatnonzero(np.diff(codes)) + 1).tolist()
+    stops = starts[1:] + [len(codes)]
+
+    columns = tuple(frame.columns)
+    specs = []
+    for order, (start, stop) in enumerate(zip(starts, stops)):
+        first = frame.index[start].date().isoformat()
+        last = frame.index[stop - 1].date().isoformat()
+        specs.append(
+            PartitionSpec(order, TIME, slice(start, stop), columns, f"{first}/{last}")
+        )
+    return specs
+
+
+def plan_ticker_partitions(
+    frame: pd.DataFrame, separator: str = "_"
+) -> List[PartitionSpec]:
+    """
+    Group columns by ticker prefix, keeping first-appearance order of the tickers.
+    """
+    groups: Dict[str, List[str]] = {}
+    for column in frame.columns:
+        groups.setdefault(ticker_of(str(column), separator), []).append(column)
+
+    rows = slice(0, len(frame))
+    return [
+        PartitionSpec(order, TICKER, rows, tuple(columns), ticker)
+        for order, (ticker, columns) in enumerate(groups.items())
+    ]
+
+
+def plan_partitions(
+    frame: pd.DataFrame, by: str = TIME, freq: str = "Y", separator: str = "_"
+) -> List[PartitionSpec]:
+    if by == TIME:
+        return plan_time_partitions(frame, freq=freq)
+    if by == TICKER:
+        return plan_ticker_partitions(frame, separator=separator)
+    raise ValueError(f"Unknown partitioning '{by}', expected '{TIME}' or '{TICKER}'")
+
+
+def partition_schema(
+    schema: Optional[DatasetSchema], columns: Sequence[str]
+) -> Optional[DatasetSchema]:
+    """
+    Restrict a schema to the columns present in one partition.
+    """
+    if schema is None:
+        return None
+    present = set(columns)
+    kept = [c for c in schema.columns if c in present] or list(columns)
+    targets = [t for t in (schema.targets or []) if t in present] or None
+    feature_types = (
+        {c: t for c, t in schema.feature_types.items() if c in present}
+        if schema.feature_types
+        else None
+    )
+    return DatasetSchema(
+        columns=kept,
+        targets=targets,
+        feature_types=feature_types,
+        constraints=schema.constraints,
+        description=schema.description,
+        version=schema.version,
+    )
+
+
+def split(data: RawData, specs: Sequence[PartitionSpec]) -> List[RawData]:
+    """
+    Materialize each partition as its own RawData with partition_info set.
+    """
+    frame: pd.DataFrame = data.data
+    return [
+        data.to_stage(
+            RawData,
+            data=frame.iloc[spec.rows][list(spec.columns)],
+            schema=partition_schema(data.schema, spec.columns),
+            partition_info=spec.info,
+        )
+        for spec in specs
+    ]
+
+
+def reassemble(
+    parts: Sequence[BaseDataEntity],
+    source: Optional[RawData] = None,
+    stage: Type[BaseDataEntity] = SelectedData,
+) -> BaseDataEntity:
+    """
+    Stitch partition outputs back together in partition order, as a stage entity:
+    time partitions are stacked along rows (and must share their columns), ticker
+    partitions are joined along columns.
+    """
+    if not parts:
+        raise ValueError("Nothing to reassemble")
+
+    ordered = sorted(parts, key=lambda p: parse_partition_info(p.partition_info)[1])
+    kinds = {parse_partition_info(p.partition_info)[0] for p in ordered}
+    if len(kinds) != 1:
+        raise ValueError(f"Cannot reassemble mixed partition kinds: {sorted(kinds)}")
+
+    axis = 0 if kinds.pop() == TIME else 1
+    if axis == 0:
+        expected = list(ordered[0].data.columns)
+        for part in ordered[1:]:
+            if list(part.data.columns) != expected:
+                raise ValueError(
+                    f"Partition {part.partition_info} has columns "
+                    f"{list(part.data.columns)}, expected {expected}"
+                )
+    frame = pd.concat([p.data for p in ordered], axis=axis)
+
+    targets: List[str] = []
+    feature_types: Dict[str, str] = {}
+    for part in ordered:
+        if part.schema is not None:
+            targets += [t for t in part.schema.targets or [] if t not in targets]
+            feature_types.update(part.schema.feature_types or {})
+    template = ordered[0].schema or (source.schema if source else None)
+    schema = DatasetSchema(
+        columns=[c for c in frame.columns if c not in targets],
+        targets=targets or None,
+        feature_types=feature_types or None,
+        constraints=template.constraints if template else None,
+        description=template.description if template else None,
+        version=template.version if template else None,
+    )
+
+    base = source if source is not None else ordered[0]
+    return base.to_stage(
+        stage,
+        data=frame,
+        schema=schema,
+        partition_info=None,
+        metadata={
+            **dict(base.metadata),
+            "partitions": [p.partition_info for p in ordered],
+        },
+    )
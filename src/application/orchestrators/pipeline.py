@@ -1,16 +1,91 @@
-from typing import Any, Callable
+import hashlib
+from typing import Any, Callable, Optional
+
+from src.domain.interfaces.repositories import CheckpointKey, ICheckpointStore
+from src.application.services.fingerprint import (
+    data_fingerprint,
+    strategy_fingerprint,
+)
 
 
 class Pipeline:
-    def __init__(self):
-        self._stages: list[Callable[[Any], Any]] = []
+    """
+    Ordered chain of stages, each a callable taking the previous stage's output.
+
+    With a checkpoint_store, every stage output is persisted under the run's
+    lineage id. A restarted run on the same input looks for the last stage with a
+    valid checkpoint (same lineage, same input fingerprint, same stage sequence up
+    to that point), loads it and resumes from the following stage. A stage is
+    identified by its name and by the class and parameters of the strategy that
+    drives it (the stage callable itself when no strategy is given), so changing a
+    strategy's parameters invalidates its checkpoint and every later one.
+    """
 
-    def add_stage(self, stage: Callable[[Any], Any]) -> "Pipeline":
-        self._stages.append(stage)
+    def __init__(
+        self,
+        checkpoint_store: Optional[ICheckpointStore] = None,
+        run_id: Optional[str] = None,
+    ):
+        self._stages: list[tuple[str, Callable[[Any], Any], Any]] = []
+        self.checkpoint_store = checkpoint_store
+        self.run_id = run_id
+        self.resumed_from: Optional[str] = None
+
+    def add_stage(
+        self,
+        stage: Callable[[Any], Any],
+        name: Optional[str] = None,
+        strategy: Any = None,
+    ) -> "Pipeline":
+        name = name or getattr(stage, "__name__", None) or f"stage{len(self._stages)}"
+        self._stages.append((name, stage, strategy if strategy is not None else stage))
         return self
 
     def run(self, data: Any) -> Any:
-        result = data
-        for stage in self._stages:
+        if self.checkpoint_store is None:
+            result = data
+            for _, stage, _ in self._stages:
+                result = stage(result)
+            return result
+
+        keys = self._checkpoint_keys(data)
+        start, result = self._resume(keys, data)
+        for position in range(start, len(self._stages)):
+            _, stage, _ = self._stages[position]
             result = stage(result)
+            self.checkpoint_store.save_checkpoint(keys[position], result)
         return result
+
+    # ------------ Helpers ------------
+
+    def _checkpoint_keys(self, data: Any) -> list[CheckpointKey]:
+        input_fingerprint = data_fingerprint(data)
+        lineage_id = (
+            self.run_id or getattr(data, "lineage_id", None) or input_fingerprint
+        )
+
+        keys = []
+        chain = hashlib.sha256(input_fingerprint.encode("utf-8"))
+        for position, (name, _, strategy) in enumerate(self._stages):
+            kind = type(strategy)
+            identity = f"{kind.__module__}.{kind.__qualname__}"
+            params = strategy_fingerprint(strategy)
+            chain.update(f"/{name}/{identity}#{params}".encode("utf-8"))
+            keys.append(
+                CheckpointKey(
+                    lineage_id=lineage_id,
+                    stage=name,
+                    position=position,
+                    input_fingerprint=chain.hexdigest()[:32],
+                )
+            )
+        return keys
+
+    def _resume(self, keys: list[CheckpointKey], data: Any) -> tuple[int, Any]:
+        self.resumed_from = None
+        for position in reversed(range(len(keys))):
+            output = self.checkpoint_store.load_checkpoint(keys[position])
+            if output is not None:
+                self.resumed_from = keys[position].stage
+                return position + 1, output
+        return 0, data
@@ -0,0 +1,126 @@
+from typing import Optional
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.enums.problem_type import ProblemType
+
+from domain.interfaces.strategies.i_feature_cleaner import IFeatureCleaner
+from domain.interfaces.strategies.i_feature_selector import IFeatureSelector
+from domain.interfaces.strategies.i_model_adapter import IModelAdapter
+from src.domain.interfaces.strategies.i_model import IModel, TrainingSummary
+from src.domain.interfaces.repositories import ICheckpointStore, IPreparedConfigStore
+
+from src.application.bypasses.data_cleaner_bypass import DataCleanerBypass
+from src.application.bypasses.data_selector_bypass import DataSelectorBypass
+from src.application.bypasses.data_adapter_bypass import DataAdapterBypass
+from src.application.bypasses.model_bypass import ModelBypass
+from src.application.orchestrators.pipeline import Pipeline
+from src.application.services.prepared_configs import PreparedConfigResolver
+
+
+class TrainFlow:
+    """
+    Application use case for training a model from raw data:
+    clean → select → adapt → train, each strategy through prepare → apply.
+
+    With a checkpoint_store the cleaned, selected and model-input entities are
+    checkpointed, so a run that fails while training resumes straight at the model
+    stage. With a config_store the prepared configs are saved under the raw data
+    fingerprint, which End2EndPredictionFlow then uses as its config_key; the
+    inverse config is prepared on the model output for the last rows of the
+    training input so inference never needs to prepare it.
+    """
+
+    def __init__(
+        self,
+        cleaner: IFeatureCleaner = None,
+        selector: IFeatureSelector = None,
+        adapter: IModelAdapter = None,
+        model: IModel = None,
+        config_store: IPreparedConfigStore = None,
+        checkpoint_store: ICheckpointStore = None,
+        run_id: Optional[str] = None,
+        inverse_sample_rows: int = 32,
+    ) -> None:
+        self.cleaner = cleaner or DataCleanerBypass()
+        self.selector = selector or DataSelectorBypass()
+        self.adapter = adapter or DataAdapterBypass()
+        self.model = model or ModelBypass()
+        self.configs = PreparedConfigResolver(config_store)
+        self.checkpoint_store = checkpoint_store
+        self.run_id = run_id
+        self.inverse_sample_rows = inverse_sample_rows
+
+    def execute(self, problem_type: ProblemType, data: RawData) -> TrainingSummary:
+        """
+        Prepares the data, then prepares and trains the model (mutated in place).
+
+        Args:
+            problem_type (ProblemType): Kind of learning problem.
+            data (RawData): Raw training data.
+
+        Returns:
+            TrainingSummary: Training config and observations from prepare_training.
+        """
+        fingerprint = self.configs.fingerprint(data)
+
+        def clean(raw: RawData) -> CleanedData:
+            config = self.configs.resolve(
+                "cleaning",
+                self.cleaner,
+                fingerprint,
+                lambda: self.cleaner.prepare(raw).config,
+            )
+            return self.cleaner.clean(raw, config)
+
+        def select(cleaned: CleanedData) -> SelectedData:
+            config = self.configs.resolve(
+                "selection",
+                self.selector,
+                fingerprint,
+                lambda: self.selector.prepare(cleaned).config,
+            )
+            return self.selector.select(cleaned, config)
+
+        def adapt(selected: SelectedData) -> ModelInputData:
+            config = self.configs.resolve(
+                "transformation",
+                self.adapter,
+                fingerprint,
+                lambda: self.adapter.prepare_transform(selected).config,
+            )
+            return self.adapter.transform(selected, config)
+
+        pipeline = (
+            Pipeline(checkpoint_store=self.checkpoint_store, run_id=self.run_id)
+            .add_stage(clean, name="cleaned", strategy=self.cleaner)
+            .add_stage(select, name="selected", strategy=self.selector)
+            .add_stage(adapt, name="model_input", strategy=self.adapter)
+        )
+        input_data = pipeline.run(data)
+
+        summary = self.model.prepare_training(problem_type, input_data)
+        self.model.train(problem_type, input_data, summary.config)
+
+        if self.configs.store is not None:
+            self.configs.resolve(
+                "inverse",
+                self.adapter,
+                fingerprint,
+                lambda: self._prepare_inverse(input_data),
+            )
+        return summary
+
+    def _prepare_inverse(self, input_data: ModelInputData):
+        payload = input_data.data
+        tail = (
+            payload.iloc[-self.inverse_sample_rows :]
+            if hasattr(payload, "iloc")
+            else payload[-self.inverse_sample_rows :]
+        )
+        sample = input_data.to_stage(ModelInputData, data=tail)
+        prediction = self.model.prepare_prediction(sample)
+        output = self.model.predict(sample, prediction.config)
+        return self.adapter.prepare_inverse(output).config
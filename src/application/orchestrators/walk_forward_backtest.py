@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.enums.problem_type import ProblemType
+from domain.interfaces.strategies.i_model_adapter import (
+    IModelAdapter,
+    TransformationConfig,
+)
+from src.domain.interfaces.strategies.i_model import IModel
+
+WINDOWS = ("expanding", "rolling")
+
+
+@dataclass(frozen=True)
+class Fold:
+    """
+    Row positions of one walk-forward fold (end positions are exclusive).
+    """
+
+    number: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass(frozen=True)
+class FoldResult:
+    """
+    Metrics and predictions (with the matching actuals) of one fold.
+    """
+
+    fold: Fold
+    metrics: Dict[str, float]
+    predictions: pd.DataFrame
+    warm_started: bool
+    duration: float
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """
+    Fold results of a walk-forward run, in fold order.
+    """
+
+    folds: List[FoldResult]
+
+    def metrics(self) -> pd.DataFrame:
+        """
+        One row per fold: positions, metrics, warm start flag and duration.
+        """
+        return pd.DataFrame(
+            [
+                {
+                    **vars(r.fold),
+                    **r.metrics,
+                    "warm_started": r.warm_started,
+                    "duration": r.duration,
+                }
+                for r in self.folds
+            ]
+        ).set_index("number")
+
+    def predictions(self) -> pd.DataFrame:
+        return pd.concat([r.predictions for r in self.folds])
+
+
+def plan_folds(
+    rows: int,
+    initial_train: int,
+    step: int,
+    window: str = "expanding",
+    max_folds: Optional[int] = None,
+) -> List[Fold]:
+    """
+    Rolling-origin folds: each origin moves `step` rows forward and tests on the
+    next `step` rows. Expanding windows keep the first row; rolling windows keep
+    the training length fixed at initial_train.
+    """
+    if window not in WINDOWS:
+        raise ValueError(f"Unknown window '{window}'; expected one of {WINDOWS}")
+    if initial_train < 1 or step < 1:
+        raise ValueError("initial_train and step must be positive")
+
+    folds = []
+    for number, origin in enumerate(range(initial_train, rows, step)):
+        if max_folds is not None and number >= max_folds:
+            break
+        start = 0 if window == "expanding" else origin - initial_train
+        folds.append(Fold(number, start, origin, origin, min(origin + step, rows)))
+    return folds
+
+
+def forecast_metrics(actual: np.ndarray, forecast: np.ndarray) -> Dict[str, float]:
+    """
+    MAE, RMSE and MAPE (over non-zero actuals) pooled across targets.
+    """
+    error = forecast - actual
+    valid = ~np.isnan(error)
+    nonzero = valid & (actual != 0)
+    return {
+        "n": int(valid.sum()),
+        "mae": float(np.abs(error[valid]).mean()) if valid.any() else np.nan,
+        "rmse": float(np.sqrt((error[valid] ** 2).mean())) if valid.any() else np.nan,
+        "mape": (
+            float(np.abs(error[nonzero] / actual[nonzero]).mean())
+            if nonzero.any()
+            else np.nan
+        ),
+    }
+
+
+class WalkForwardBacktest:
+    """
+    Rolling-origin evaluation of an IModelAdapter + IModel pair.
+
+    Each fold trains on rows [train_start, origin) and predicts rows
+    [origin, origin + step). Folds read positional slices of the same frame, so no
+    fold copies the data. As the origin moves the adapter config is updated with
+    just the rows entering (and, for rolling windows, leaving) the training range
+    through IModelAdapter.update_transform, falling back to a full prepare when
+    the adapter cannot update incrementally.
+
+    The first fold always runs first. If its model supports IModel.warm_start and
+    warm_start is set, each later fold's model starts from the previous fold's and
+    folds run in order; otherwise the remaining folds are independent and run in
+    parallel on a thread pool.
+
+    `horizon` (at least 1) is the lead between the last input row and the row it
+    forecasts: the test input for rows [origin, origin + step) ends `horizon` rows
+    earlier, so the input never holds the targets being predicted. For windowed
+    models, `context` rows before each test range are added to its input
+    (sequence_length - 1). Predictions are read from the tail of the
+    PredictedData, which is how windowed models align their output; a model
+    returning fewer rows than the test range is an error.
+    """
+
+    def __init__(
+        self,
+        adapter: IModelAdapter,
+        model_factory: Callable[[], IModel],
+        *,
+        initial_train: int,
+        step: int,
+        problem_type: ProblemType = ProblemType.FORECASTING,
+        window: str = "expanding",
+        context: int = 0,
+        horizon: int = 1,
+        warm_start: bool = True,
+        max_workers: Optional[int] = None,
+        max_folds: Optional[int] = None,
+    ) -> None:
+        if horizon < 1:
+            raise ValueError(
+                "horizon must be at least 1; with 0 the test input holds the "
+                "targets it is asked to forecast"
+            )
+        if initial_train < context + horizon:
+            raise ValueError("initial_train must cover context + horizon rows")
+        self.adapter = adapter
+        self.model_factory = model_factory
+        self.initial_train = initial_train
+        self.step = step
+        self.problem_type = problem_type
+        self.window = window
+        self.context = context
+        self.horizon = horizon
+        self.warm_start = warm_start
+        self.max_workers = max_workers
+        self.max_folds = max_folds
+
+    def execute(self, data: SelectedData) -> BacktestResult:
+        """
+        Run every fold.
+
+        Args:
+            data (SelectedData): Time-ordered frame with schema.targets.
+
+        Returns:
+            BacktestResult: Per-fold metrics and predictions.
+        """
+        frame: pd.DataFrame = data.data
+        if data.schema is None or not data.schema.targets:
+            raise ValueError("Backtesting needs schema.targets")
+        folds = plan_folds(
+            len(frame), self.initial_train, self.step, self.window, self.max_folds
+        )
+        if not folds:
+            raise ValueError(
+                f"{len(frame)} rows leave no test range after {self.initial_train}"
+            )
+        configs = self._fold_configs(data, folds)
+
+        first, previous = self._run_fold(data, folds[0], configs[0], None)
+        results: List[FoldResult] = [first]
+        rest = list(zip(folds[1:], configs[1:]))
+        if self.warm_start and self._supports_warm_start(previous):
+            for fold, config in rest:
+                result, previous = self._run_fold(data, fold, config, previous)
+                results.append(result)
+        elif rest:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                runs = pool.map(lambda args: self._run_fold(data, *args, None)[0], rest)
+                results.extend(runs)
+        return BacktestResult(folds=results)
+
+    # ------------ Helpers ------------
+
+    def _slice(self, data: SelectedData, start: int, stop: int) -> SelectedData:
+        return data.to_stage(SelectedData, data=data.data.iloc[start:stop])
+
+    def _fold_configs(
+        self, data: SelectedData, folds: List[Fold]
+    ) -> List[TransformationConfig]:
+        first = folds[0]
+        configs = [
+            self.adapter.prepare_transform(
+                self._slice(data, first.train_start, first.train_end)
+            ).config
+        ]
+        for previous, fold in zip(folds, folds[1:]):
+            added = self._slice(data, previous.train_end, fold.train_end)
+            removed = (
+                self._slice(data, previous.train_start, fold.train_start)
+                if fold.train_start > previous.train_start
+                else None
+            )
+            try:
+                summary = self.adapter.update_transform(configs[-1], added, removed)
+            except NotImplementedError:
+                summary = self.adapter.prepare_transform(
+                    self._slice(data, fold.train_start, fold.train_end)
+                )
+            configs.append(summary.config)
+        return configs
+
+    @staticmethod
+    def _supports_warm_start(model: IModel) -> bool:
+        method = getattr(type(model), "warm_start", None)
+        return method is not None and method is not IModel.warm_start
+
+    def _run_fold(
+        self,
+        data: SelectedData,
+        fold: Fold,
+        config: TransformationConfig,
+        previous: Optional[IModel],
+    ) -> Tuple[FoldResult, IModel]:
+        started = time.perf_counter()
+        model = self.model_factory()
+        warm = previous is not None and model.warm_start(previous)
+
+        train_input = self.adapter.transform(
+            self._slice(data, fold.train_start, fold.train_end), config
+        )
+        summary = model.prepare_training(self.problem_type, train_input)
+        model.train(self.problem_type, train_input, summary.config)
+
+        lead = self.horizon
+        test_input = self.adapter.transform(
+            self._slice(
+                data,
+                fold.test_start - lead - self.context,
+                fold.test_end - lead,
+            ),
+            config,
+        )
+        prediction = model.prepare_prediction(test_input)
+        output = model.predict(test_input, prediction.config)
+        predicted = self.adapter.inverse_transform(
+            output, self.adapter.prepare_inverse(output).config
+        )
+
+        targets = list(data.schema.targets)
+        n_test = fold.test_end - fold.test_start
+        actual = data.data[targets].iloc[fold.test_start : fold.test_end]
+        forecast = np.asarray(predicted.data, dtype=np.float64).reshape(
+            len(predicted.data), -1
+        )
+        if len(forecast) < n_test:
+            raise ValueError(
+                f"Fold {fold.number}: the model returned {len(forecast)} rows for "
+                f"{n_test} test rows; check that context covers its input window"
+            )
+        forecast = forecast[-n_test:]
+
+        frame = pd.DataFrame(forecast, index=actual.index, columns=targets)
+        frame = frame.join(actual.add_suffix("_actual"))
+        frame.insert(0, "fold", fold.number)
+        result = FoldResult(
+            fold=fold,
+            metrics=forecast_metrics(actual.to_numpy(np.float64), forecast),
+            predictions=frame,
+            warm_started=warm,
+            duration=time.perf_counter() - started,
+        )
+        return result, model
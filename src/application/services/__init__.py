@@ -0,0 +1,4 @@
+from .fingerprint import data_fingerprint
+from .prepared_configs import PreparedConfigResolver
+
+__all__ = ["data_fingerprint", "PreparedConfigResolver"]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import pickle
+from typing import Any, Set
+
+import numpy as np
+import pandas as pd
+
+
+def data_fingerprint(entity: Any) -> str:
+    """
+    Content hash of an entity's payload and schema, used to key prepared configs
+    and checkpoints. Two entities with equal data and schema share a fingerprint
+    regardless of identity, provenance or other metadata.
+
+    Args:
+        entity: A BaseDataEntity (or a bare payload).
+
+    Returns:
+        str: Hex digest (sha256, truncated to 32 chars).
+    """
+    data = getattr(entity, "data", entity)
+    digest = hashlib.sha256()
+    _update(digest, data)
+
+    schema = getattr(entity, "schema", None)
+    if schema is not None:
+        digest.update(repr((schema.columns, schema.targets)).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def strategy_fingerprint(strategy: Any) -> str:
+    """
+    Hash of a strategy's parameters, used with its class name to key prepared
+    configs and checkpoints. Parameters are the public instance attributes set by
+    the constructor, hashed recursively through nested strategies; underscore
+    attributes hold fitted state or caches and are left out.
+
+    Args:
+        strategy: Any strategy instance.
+
+    Returns:
+        str: Hex digest (sha256, truncated to 16 chars).
+    """
+    digest = hashlib.sha256()
+    _update_params(digest, strategy, set())
+    return digest.hexdigest()[:16]
+
+
+def _update_params(digest: "hashlib._Hash", value: Any, seen: Set[int]) -> None:
+    if value is None or isinstance(value, (str, bytes, bool, int, float)):
+        digest.update(repr(value).encode("utf-8"))
+    elif isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        _update(digest, value)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode("utf-8"))
+            _update_params(digest, value[key], seen)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode("utf-8"))
+        for item in value:
+            _update_params(digest, item, seen)
+    elif isinstance(value, (set, frozenset)):
+        _update_params(digest, sorted(value, key=repr), seen)
+    elif (
+        isinstance(value, type)
+        or inspect.isroutine(value)
+        or not hasattr(value, "__dict__")
+    ):
+        kind = value if isinstance(value, type) else type(value)
+        name = getattr(value, "__qualname__", None) or repr(value)
+        digest.update(f"{kind.__module__}.{name}".encode("utf-8"))
+    elif id(value) not in seen:
+        seen.add(id(value))
+        kind = type(value)
+        digest.update(f"{kind.__module__}.{kind.__qualname__}".encode("utf-8"))
+        params = {k: v for k, v in vars(value).items() if not k.startswith("_")}
+        _update_params(digest, params, seen)
+
+
+def _update(digest: "hashlib._Hash", data: Any) -> None:
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode("utf-8"))
+        digest.update(repr([str(t) for t in data.dtypes]).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, pd.Series):
+        digest.update(str(data.name).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(f"{data.dtype.str}{data.shape}".encode("utf-8"))
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, dict):
+        for key in sorted(data, key=str):
+            digest.update(str(key).encode("utf-8"))
+            _update(digest, data[key])
+    else:
+        digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+from src.application.services.fingerprint import (
+    data_fingerprint,
+    strategy_fingerprint,
+)
+from src.domain.interfaces.repositories import (
+    IPreparedConfigStore,
+    PreparedConfigKey,
+)
+
+
+class PreparedConfigResolver:
+    """
+    Resolves the config for each prepare → apply step of a flow.
+
+    Without a store every call runs prepare(). With a store, configs are looked up
+    by (stage, strategy class and parameters, fingerprint) and prepare() only runs
+    on a miss; resolved configs are also memoized in-process so a long-lived flow
+    hits disk once.
+
+    When a fixed config_key is given (typically the training data fingerprint at
+    inference time) configs are load-only: a miss raises KeyError instead of
+    preparing on the scoring batch.
+    """
+
+    def __init__(
+        self,
+        store: Optional[IPreparedConfigStore] = None,
+        config_key: Optional[str] = None,
+    ) -> None:
+        self.store = store
+        self.config_key = config_key
+        self._memo: Dict[str, Any] = {}
+
+    def fingerprint(self, data: Any) -> str:
+        """
+        Key under which the configs for data are stored. Only hashes the payload
+        when a store is configured and no fixed config_key was given.
+        """
+        if self.store is None:
+            return ""
+        return self.config_key or data_fingerprint(data)
+
+    def resolve(
+        self, stage: str, strategy: Any, fingerprint: str, prepare: Callable[[], Any]
+    ) -> Any:
+        if self.store is None:
+            return prepare()
+
+        key = PreparedConfigKey.for_strategy(
+            stage,
+            strategy,
+            self.config_key or fingerprint,
+            params=strategy_fingerprint(strategy),
+        )
+        if key.id in self._memo:
+            return self._memo[key.id]
+
+        if self.config_key is not None:
+            config = self.store.load(key)
+            if config is None:
+                raise KeyError(f"No prepared config stored for {key.id}")
+        else:
+            config = self.store.get_or_prepare(key, prepare)
+
+        self._memo[key.id] = config
+        return config
+
+    def preload(self, stage: str, strategy: Any) -> Any:
+        """
+        Load a stored config ahead of the first request; requires a fixed config_key.
+        """
+        if self.store is None or self.config_key is None:
+            raise ValueError("preload requires a config_store and a config_key")
+        return self.resolve(stage, strategy, self.config_key, lambda: None)
+
+    def clear(self) -> None:
+        self._memo.clear()
@@ -5,7 +5,8 @@
 # from .select_data import SelectData
 # from .adapt_data import AdaptData
 # from .train_model import TrainModel
-# from .tune_model import TubeModel
+from .tune_model import TuneModel
+
 # from .predict_data import PredictData
 
 
@@ -16,6 +17,6 @@ __all__ = [
     "SelectData",
     "AdaptData",
     "TrainModel",
-    "TubeModel",
+    "TuneModel",
     "PredictData",
 ]
@@ -9,5 +9,5 @@ class CleanData:
         self.cleaner = cleaner
 
     def execute(self, data: RawData) -> CleanedData:
-        metadata = self.cleaner.fit(self, data)
-        return self.cleaner.clean(data)  # -> CleanedData:
+        summary = self.cleaner.prepare(data)
+        return self.cleaner.clean(data, summary.config)
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.enums.problem_type import ProblemType
+from src.domain.interfaces.strategies.i_model import IModel, TrainingConfig
+from src.infrastructure.config import YamlConfigProvider
+from config.paths import KERAS_PARAMS_FILE, PROJ_ROOT
+from config.logging_config import logger
+
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+)
+
+
+@dataclass(frozen=True)
+class TrialResult:
+    """
+    Outcome of one tuning trial.
+
+    Attributes:
+        trial_id: Position of the trial in the search.
+        params: Sampled hyperparameters.
+        best_val_loss: Lowest validation loss reported (nan if none was reported).
+        epochs: Number of epochs reported.
+        pruned: Whether the pruner stopped the trial early.
+        duration: Wall time of the trial in seconds.
+    """
+
+    trial_id: int
+    params: Dict[str, Any]
+    best_val_loss: float
+    epochs: int
+    pruned: bool
+    duration: float
+
+
+@dataclass(frozen=True)
+class TuningSummary:
+    """
+    Outcome of a search: the best trial and every trial in completion order.
+    """
+
+    best: TrialResult
+    trials: List[TrialResult] = field(default_factory=list)
+    wall_time: float = 0.0
+
+
+class MedianPruner:
+    """
+    Stops a trial whose best validation loss so far is worse than the median of
+    the other trials' best losses at the same epoch.
+
+    Reports live in a mapping shared across worker processes (a Manager dict), so
+    trials running in parallel prune against each other as they progress.
+    """
+
+    def __init__(
+        self,
+        history: Optional[Mapping[int, List[float]]] = None,
+        *,
+        n_startup_trials: int = 4,
+        n_warmup_epochs: int = 5,
+    ) -> None:
+        self.history = history if history is not None else {}
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_epochs = n_warmup_epochs
+
+    def report(self, trial_id: int, epoch: int, value: float) -> bool:
+        """
+        Record a trial's validation loss and return True if it should stop.
+        """
+        losses = list(self.history.get(trial_id, [])) + [value]
+        self.history[trial_id] = losses
+        if epoch < self.n_warmup_epochs or not math.isfinite(value):
+            return not math.isfinite(value)
+
+        peers = [
+            min(h[: epoch + 1])
+            for tid, h in list(self.history.items())
+            if tid != trial_id and len(h) > epoch
+        ]
+        if len(peers) < self.n_startup_trials:
+            return False
+        return min(losses) > float(np.median(peers))
+
+
+def sample_params(space: Mapping[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Draw one point of the search space. Lists are choices, (low, high) tuples are
+    uniform ranges and (low, high, "log") tuples are log-uniform ranges.
+    """
+    params: Dict[str, Any] = {}
+    for name, spec in space.items():
+        if isinstance(spec, list):
+            params[name] = spec[int(rng.integers(len(spec)))]
+        elif isinstance(spec, tuple) and len(spec) == 3 and spec[2] == "log":
+            params[name] = float(np.exp(rng.uniform(np.log(spec[0]), np.log(spec[1]))))
+        elif isinstance(spec, tuple) and len(spec) == 2:
+            low, high = spec
+            if isinstance(low, int) and isinstance(high, int):
+                params[name] = int(rng.integers(low, high + 1))
+            else:
+                params[name] = float(rng.uniform(low, high))
+        else:
+            params[name] = spec
+    return params
+
+
+def default_search_space() -> Dict[str, Any]:
+    """
+    Search around the keras_params.yaml values for the compiler and callback
+    settings that matter most.
+    """
+    base = YamlConfigProvider(KERAS_PARAMS_FILE)
+    lr = float(base.get("learning_rate", 1e-3))
+    patience = int(base.get("early_stop_patience", 16))
+    return {
+        "learning_rate": (lr / 10, lr * 10, "log"),
+        "clipnorm": (0.1, 2.0 * float(base.get("clipnorm", 1.0))),
+        "delta": (0.1, 2.0 * float(base.get("delta", 0.8))),
+        "early_stop_patience": (max(patience // 4, 2), patience),
+        "units": [16, 32, 64],
+    }
+
+
+# ------------ Worker process ------------
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(
+    threads: int,
+    data: ModelInputData,
+    problem_type: ProblemType,
+    pruner: MedianPruner,
+    tracking: Optional[Dict[str, Any]],
+) -> None:
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    _worker.update(
+        data=data, problem_type=problem_type, pruner=pruner, tracking=tracking
+    )
+
+
+def _run_trial(
+    trial_id: int, params: Dict[str, Any], model_factory: Callable[..., IModel]
+) -> TrialResult:
+    data, problem_type = _worker["data"], _worker["problem_type"]
+    pruner: MedianPruner = _worker["pruner"]
+    tracking = _worker["tracking"]
+    started = time.perf_counter()
+    losses: List[float] = []
+    pruned = False
+
+    def epoch_callback(epoch: int, val_loss: float) -> bool:
+        nonlocal pruned
+        losses.append(val_loss)
+        if tracking is not None:
+            import mlflow
+
+            mlflow.log_metric("val_loss", val_loss, step=epoch)
+        pruned = pruner.report(trial_id, epoch, val_loss)
+        return pruned
+
+    def fit() -> None:
+        model = model_factory(**params)
+        summary = model.prepare_training(problem_type, data)
+        config = TrainingConfig(
+            params={**summary.config.params, **params, "epoch_callback": epoch_callback}
+        )
+        model.train(problem_type, data, config)
+
+    if tracking is None:
+        fit()
+    else:
+        import mlflow
+
+        mlflow.set_tracking_uri(tracking["uri"])
+        with mlflow.start_run(
+            experiment_id=tracking["experiment_id"], run_name=f"trial-{trial_id:03d}"
+        ):
+            mlflow.set_tags({"search_id": tracking["search_id"], "trial": trial_id})
+            mlflow.log_params(params)
+            fit()
+            mlflow.set_tag("pruned", pruned)
+            if losses:
+                mlflow.log_metric("best_val_loss", min(losses))
+
+    return TrialResult(
+        trial_id=trial_id,
+        params=params,
+        best_val_loss=min(losses) if losses else float("nan"),
+        epochs=len(losses),
+        pruned=pruned,
+        duration=time.perf_counter() - started,
+    )
+
+
+class TuneModel:
+    """
+    Application use case for hyperparameter search over an IModel.
+
+    Trials run in parallel worker processes (spawned, so each gets a clean
+    TensorFlow runtime) with a fixed number of CPU threads per trial. Models report
+    each epoch's validation loss through TrainingConfig.params["epoch_callback"];
+    a MedianPruner shared across workers stops unpromising trials early. Every
+    trial is logged as an MLflow run (params, per-epoch val_loss, pruned tag) in
+    the local store.
+
+    model_factory must be picklable (a class or module-level function) and is
+    called with the sampled hyperparameters as keyword arguments.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[..., IModel],
+        search_space: Optional[Mapping[str, Any]] = None,
+        *,
+        n_trials: int = 20,
+        max_workers: Optional[int] = None,
+        threads_per_trial: int = 1,
+        n_startup_trials: int = 4,
+        n_warmup_epochs: int = 5,
+        seed: Optional[int] = None,
+        experiment_name: Optional[str] = "tuning",
+        tracking_uri: Optional[str] = None,
+    ) -> None:
+        self.model_factory = model_factory
+        self.search_space = dict(search_space or default_search_space())
+        self.n_trials = n_trials
+        self.threads_per_trial = max(1, threads_per_trial)
+        self.max_workers = max_workers or max(
+            1, (os.cpu_count() or 1) // self.threads_per_trial
+        )
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_epochs = n_warmup_epochs
+        self.seed = seed
+        self.experiment_name = experiment_name
+        self.tracking_uri = tracking_uri
+
+    def execute(self, problem_type: ProblemType, data: ModelInputData) -> TuningSummary:
+        """
+        Run the search and return the best trial.
+
+        Args:
+            problem_type (ProblemType): Kind of learning problem.
+            data (ModelInputData): Training data, shipped once to every worker.
+
+        Returns:
+            TuningSummary: Best trial (lowest best_val_loss) and all trials.
+        """
+        rng = np.random.default_rng(self.seed)
+        trials = [sample_params(self.search_space, rng) for _ in range(self.n_trials)]
+        started = time.perf_counter()
+
+        context = multiprocessing.get_context("spawn")
+        with context.Manager() as manager:
+            pruner = MedianPruner(
+                manager.dict(),
+                n_startup_trials=self.n_startup_trials,
+                n_warmup_epochs=self.n_warmup_epochs,
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, self.n_trials),
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(
+                    self.threads_per_trial,
+                    data,
+                    problem_type,
+                    pruner,
+                    self._tracking(),
+                ),
+            ) as pool:
+                futures = [
+                    pool.submit(_run_trial, i, params, self.model_factory)
+                    for i, params in enumerate(trials)
+                ]
+                results = []
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    logger.info(
+                        f"Trial {result.trial_id}: val_loss={result.best_val_loss:.5g} "
+                        f"epochs={result.epochs} pruned={result.pruned}"
+                    )
+
+        ranked = [r for r in results if math.isfinite(r.best_val_loss)]
+        if not ranked:
+            raise ValueError("No trial reported a validation loss")
+        best = min(ranked, key=lambda r: r.best_val_loss)
+        return TuningSummary(
+            best=best, trials=results, wall_time=time.perf_counter() - started
+        )
+
+    def _tracking(self) -> Optional[Dict[str, Any]]:
+        if self.experiment_name is None:
+            return None
+        from mlflow.tracking import MlflowClient
+
+        uri = self.tracking_uri or (PROJ_ROOT / "mlruns").as_uri()
+        # created here once, so parallel workers never race to create it
+        client = MlflowClient(uri)
+        experiment = client.get_experiment_by_name(self.experiment_name)
+        experiment_id = (
+            experiment.experiment_id
+            if experiment is not None
+            else client.create_experiment(self.experiment_name)
+        )
+        return {
+            "uri": uri,
+            "experiment_id": experiment_id,
+            "search_id": f"{self.experiment_name}-{int(time.time())}",
+        }
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Generic, Mapping, Optional, TypeVar, List, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import Generic, Mapping, Optional, TypeVar, List, Dict, Any, Type
 from types import MappingProxyType
 from uuid import uuid4
 from datetime import datetime
@@ -12,6 +12,7 @@ from src.domain.entities.value_objects import (
 )
 
 T = TypeVar("T")  # Tipo genérico para o payload de dados
+E = TypeVar("E", bound="BaseDataEntity")
 
 
 @dataclass(frozen=True)
@@ -69,6 +70,30 @@ class BaseDataEntity(Generic[T]):
             observation_time=self.observation_time,
         )
 
+    def to_stage(self, stage: Type[E], **overrides) -> E:
+        """
+        Carry this entity's fields over into another pipeline stage type.
+
+        A fresh identity is generated for the new entity unless one is given;
+        any field passed in overrides (e.g. data, schema) replaces the inherited one.
+        """
+        carried = {
+            f.name: getattr(self, f.name) for f in fields(self) if f.name != "identity"
+        }
+        carried.update(overrides)
+        return stage(**carried)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # MappingProxyType is not picklable; ship metadata as a plain dict.
+        state = dict(self.__dict__)
+        state["metadata"] = dict(self.metadata)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        state["metadata"] = MappingProxyType(dict(state.get("metadata") or {}))
+        self.__dict__.update(state)
+
     def validate_against_schema(self) -> ValidationStatus:
         """
         Validate self.data against the attached schema and produce ValidationStatus.
@@ -1,5 +1,22 @@
 from .i_command import ICommand
 from .i_query import IQuery
+from .i_scan_query import IScanQuery
 from .i_config_provider import IConfigProvider
+from .i_checkpoint_store import ICheckpointStore, CheckpointKey
+from .i_prepared_config_store import (
+    IPreparedConfigStore,
+    PreparedConfigKey,
+    PreparedConfigRecord,
+)
 
-__all__ = ["ICommand", "IQuery", "IConfigProvider"]
+__all__ = [
+    "ICommand",
+    "IQuery",
+    "IScanQuery",
+    "IConfigProvider",
+    "ICheckpointStore",
+    "CheckpointKey",
+    "IPreparedConfigStore",
+    "PreparedConfigKey",
+    "PreparedConfigRecord",
+]
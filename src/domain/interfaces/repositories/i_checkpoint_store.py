@@ -0,0 +1,53 @@
+from __future__ import annotations
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .i_command import ICommand
+from .i_query import IQuery
+
+
+@dataclass(frozen=True)
+class CheckpointKey:
+    """
+    Identifies the output of one stage of one run.
+
+    Attributes:
+        lineage_id: Run lineage the checkpoint belongs to.
+        stage: Stage name.
+        position: Zero-based position of the stage in the run.
+        input_fingerprint: Fingerprint of the run input plus the names of all
+                           stages up to and including this one; a different input
+                           or a reshuffled pipeline never matches.
+    """
+
+    lineage_id: str
+    stage: str
+    position: int
+    input_fingerprint: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.lineage_id}/{self.position:02d}-{self.stage}"
+
+
+class ICheckpointStore(ICommand, IQuery):
+    """
+    Repository contract for stage outputs persisted during long multi-stage runs,
+    so that a restarted run can resume after the last completed stage.
+    """
+
+    @abstractmethod
+    def save_checkpoint(self, key: CheckpointKey, output: Any) -> None:
+        pass
+
+    @abstractmethod
+    def load_checkpoint(self, key: CheckpointKey) -> Optional[Any]:
+        """
+        Return the stored output for key, or None when absent or not valid for key.
+        """
+        pass
+
+    def save(self, to_save: Any) -> None:
+        key, output = to_save
+        self.save_checkpoint(key, output)
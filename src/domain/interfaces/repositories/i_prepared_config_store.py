@@ -0,0 +1,84 @@
+from __future__ import annotations
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from .i_command import ICommand
+from .i_query import IQuery
+
+
+@dataclass(frozen=True)
+class PreparedConfigKey:
+    """
+    Identifies a config produced by a strategy's prepare step.
+
+    Attributes:
+        stage: Pipeline step the config drives ("cleaning", "selection",
+               "transformation", "inverse").
+        strategy: Fully qualified name of the strategy class that prepared it.
+        version: Strategy config version; bump it when the config layout changes.
+        fingerprint: Fingerprint of the data the config was prepared on.
+        params: Hash of the strategy's constructor parameters, so a strategy
+                configured differently does not reuse the config.
+    """
+
+    stage: str
+    strategy: str
+    version: str
+    fingerprint: str
+    params: str = ""
+
+    @property
+    def id(self) -> str:
+        key = f"{self.fingerprint}/{self.stage}/{self.strategy}@{self.version}"
+        return f"{key}#{self.params}" if self.params else key
+
+    @classmethod
+    def for_strategy(
+        cls, stage: str, strategy: Any, fingerprint: str, params: str = ""
+    ) -> PreparedConfigKey:
+        kind = type(strategy)
+        return cls(
+            stage=stage,
+            strategy=f"{kind.__module__}.{kind.__qualname__}",
+            version=str(getattr(strategy, "version", None) or "0"),
+            fingerprint=fingerprint,
+            params=params,
+        )
+
+
+@dataclass(frozen=True)
+class PreparedConfigRecord:
+    key: PreparedConfigKey
+    config: Any
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class IPreparedConfigStore(ICommand, IQuery):
+    """
+    Repository contract for configs returned by prepare steps (CleaningConfig,
+    SelectionConfig, TransformationConfig, InverseConfig), so repeated runs on the
+    same data can skip straight to the apply step.
+    """
+
+    @abstractmethod
+    def save(self, to_save: PreparedConfigRecord) -> None:
+        pass
+
+    @abstractmethod
+    def load(self, key: PreparedConfigKey) -> Optional[Any]:
+        """
+        Return the stored config for key, or None when absent or stale.
+        """
+        pass
+
+    def get_or_prepare(self, key: PreparedConfigKey, prepare: Callable[[], Any]) -> Any:
+        """
+        Load the config for key, running and persisting prepare() on a miss.
+        """
+        config = self.load(key)
+        if config is None:
+            config = prepare()
+            self.save(PreparedConfigRecord(key=key, config=config))
+        return config
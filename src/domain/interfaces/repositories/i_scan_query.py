@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Mapping, Optional, Sequence
+
+from .i_query import IQuery
+
+
+class IScanQuery(IQuery):
+    """
+    Query contract for sources that can push a projection and a date range down
+    to the storage or remote API, loading only what the pipeline will use.
+    """
+
+    @abstractmethod
+    def scan(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Mapping[str, Any]:
+        """
+        Load only the given columns (all when None) observed within [start, end].
+        Returns the same mapping layout as get_by_id.
+        """
+        pass
@@ -2,15 +2,18 @@ from abc import ABC, abstractmethod
 from src.domain.entities.stages.raw_data import RawData
 from src.domain.entities.stages.cleaned_data import CleanedData
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict, List, Optional
 
 
 @dataclass(frozen=True)
 class CleaningConfig:
     """
     Parameters or thresholds extracted from raw data that drive cleaning logic.
+    Examples: imputation values, clipping bounds, columns to clean.
     """
 
+    params: Dict[str, Any] = None
+
 
 @dataclass(frozen=True)
 class CleaningSummary:
@@ -37,3 +40,24 @@ class IFeatureCleaner(ABC):
         Apply cleaning logic based on a previously prepared config.
         """
         pass
+
+    def required_columns(
+        self, config: CleaningConfig, downstream: Optional[List[str]]
+    ) -> Optional[List[str]]:
+        """
+        Raw columns clean() must read to produce the downstream columns (None = all).
+        Column-wise cleaners need exactly what downstream needs.
+        """
+        return downstream
+
+    def update_prepare(self, config: CleaningConfig, added: RawData) -> CleaningSummary:
+        """
+        Refresh a prepared config with newly arrived rows only, without rescanning
+        the rows it was prepared on. The result should match prepare() over all
+        rows within floating-point tolerance.
+
+        Raises NotImplementedError when the config cannot be updated incrementally.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental preparation"
+        )
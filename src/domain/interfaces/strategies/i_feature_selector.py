@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from src.domain.entities.stages.cleaned_data import CleanedData
 from src.domain.entities.stages.selected_data import SelectedData
 
@@ -10,6 +10,10 @@ class SelectionConfig:
     """
     Parameters, thresholds or metadata derived from cleaned data that drive selection logic.
     Examples: importance scores, feature rankings, variance thresholds, selected column names.
+
+    Implementations that keep a fixed set of columns should list them (targets
+    included) under details["selected_columns"] so orchestrators can push the
+    projection down to the loaders.
     """
 
     details: Dict[str, Any] = None
@@ -54,3 +58,9 @@ class IFeatureSelector(ABC):
             SelectedData: subset or transformed version after selection.
         """
         pass
+
+    def required_columns(self, config: SelectionConfig) -> Optional[List[str]]:
+        """
+        Columns that select() reads under config, or None when it needs them all.
+        """
+        return (config.details or {}).get("selected_columns")
@@ -11,6 +11,10 @@ class TrainingConfig:
     """
     Parameters or hyperparameters determined/validated before actual training.
     Examples: learning rate, feature subset, class weights, early stopping thresholds.
+
+    Models trained iteratively should honour an optional params["epoch_callback"]:
+    a callable (epoch, val_loss) -> bool called after every epoch; returning True
+    asks the model to stop training (used by tuners to prune trials).
     """
 
     params: Dict[str, Any]
@@ -90,3 +94,24 @@ class IModel(ABC):
         Perform inference using a precomputed prediction config.
         """
         pass
+
+    def warm_start(self, previous: "IModel") -> bool:
+        """
+        Initialise the next train() from a model trained on overlapping earlier data
+        (e.g. the previous walk-forward fold). Returns False when unsupported, in
+        which case training starts from scratch.
+        """
+        return False
+
+    def update(self, data: ModelInputData, config: TrainingConfig) -> TrainingSummary:
+        """
+        Incrementally fit an already trained model on newly arrived rows only,
+        instead of a full train() on the whole history. The returned observations
+        should include "retrain_due": True once incremental updates are no longer
+        enough and a full train() is recommended.
+
+        Raises NotImplementedError when the model cannot learn incrementally.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental updates"
+        )
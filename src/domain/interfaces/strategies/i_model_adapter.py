@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from src.domain.entities.stages.selected_data import SelectedData
 from src.domain.entities.stages.model_input_data import ModelInputData
@@ -73,6 +73,21 @@ class IModelAdapter(ABC):
         """
         pass
 
+    def update_transform(
+        self,
+        config: TransformationConfig,
+        added: SelectedData,
+        removed: Optional[SelectedData] = None,
+    ) -> TransformationSummary:
+        """
+        Update a prepared config with rows added to (and removed from) the data it
+        was prepared on, without revisiting the other rows. Adapters that cannot
+        do this incrementally raise NotImplementedError; callers then re-prepare.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental updates"
+        )
+
     @abstractmethod
     def prepare_inverse(self, output: ModelOutputData) -> InverseSummary:
         """
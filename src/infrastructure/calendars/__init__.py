@@ -0,0 +1,3 @@
+from .business_days import business_days, calendar_between
+
+__all__ = ["business_days", "calendar_between"]
@@ -0,0 +1,58 @@
+# infra/calendars/business_days.py
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@lru_cache(maxsize=None)
+def _holidays(market: str, year: int) -> Tuple[np.datetime64, ...]:
+    import holidays
+
+    if market in holidays.list_supported_financial():
+        calendar = holidays.financial_holidays(market, years=year)
+    else:
+        calendar = holidays.country_holidays(market, years=year)
+    return tuple(np.datetime64(day, "D") for day in calendar)
+
+
+@lru_cache(maxsize=64)
+def business_days(market: str, start_year: int, end_year: int) -> pd.DatetimeIndex:
+    """
+    Trading days of a market over whole years, cached per (market, year range);
+    holidays are cached per (market, year), so overlapping ranges share them.
+
+    Args:
+        market (str): A financial calendar of the holidays package ("B3", "BVMF",
+                      "NYSE", ...) or a country code ("BR", "US") for plain
+                      weekday-minus-holiday calendars.
+        start_year (int): First year included.
+        end_year (int): Last year included.
+
+    Returns:
+        pd.DatetimeIndex: Sorted business days (midnight, tz-naive).
+    """
+    if end_year < start_year:
+        raise ValueError("end_year must not precede start_year")
+    closed = [
+        d for year in range(start_year, end_year + 1) for d in _holidays(market, year)
+    ]
+    days = np.arange(
+        np.datetime64(f"{start_year}-01-01"),
+        np.datetime64(f"{end_year + 1}-01-01"),
+        dtype="datetime64[D]",
+    )
+    days = days[np.is_busday(days, holidays=closed)]
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"), name="date")
+
+
+def calendar_between(market: str, start, end) -> pd.DatetimeIndex:
+    """
+    Business days of `market` within [start, end], sliced from the cached years.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    days = business_days(market, start.year, end.year)
+    return days[days.searchsorted(start.normalize()) : days.searchsorted(end, "right")]
@@ -0,0 +1,16 @@
+from typing import Any
+
+from .replay_buffer import ReplayBuffer
+from .feature_layout import feature_order, target_indices
+
+__all__ = ["ReplayBuffer", "SlidingWindowSequence", "feature_order", "target_indices"]
+
+
+def __getattr__(name: str) -> Any:
+    # SlidingWindowSequence subclasses keras' PyDataset, and importing keras loads
+    # TensorFlow; only pay for it when the sequence is actually used.
+    if name == "SlidingWindowSequence":
+        from .sequence_generator import SlidingWindowSequence
+
+        return SlidingWindowSequence
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
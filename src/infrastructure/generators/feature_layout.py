@@ -0,0 +1,22 @@
+# infra/generators/feature_layout.py
+from __future__ import annotations
+
+from typing import List
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+
+
+def feature_order(data: ModelInputData) -> List[str]:
+    """
+    Column order of a ModelInputData matrix: schema.columns, then any target not
+    already among them. In forecasting the target series is usually a feature too.
+    """
+    if data.schema is None:
+        return []
+    columns = list(data.schema.columns)
+    return columns + [t for t in data.schema.targets or [] if t not in columns]
+
+
+def target_indices(data: ModelInputData) -> List[int]:
+    order = feature_order(data)
+    return [order.index(t) for t in (data.schema.targets or [])] if order else []
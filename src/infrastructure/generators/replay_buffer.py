@@ -0,0 +1,49 @@
+# infra/generators/replay_buffer.py
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class ReplayBuffer:
+    """
+    Bounded buffer of the most recent matrix rows, kept in time order.
+
+    Rows live in one preallocated float32 block twice the capacity; appends write
+    after the current tail and, once the block is full, the newest `capacity` rows
+    are moved back to the front. view() is therefore always a contiguous slice
+    (no copy) that SlidingWindowSequence can window directly, and each row is
+    moved at most once per `capacity` appends.
+    """
+
+    def __init__(self, capacity: int, features: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._block = np.empty((2 * capacity, features), dtype=np.float32)
+        self._start = 0
+        self._stop = 0
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def extend(self, rows: Any) -> ReplayBuffer:
+        rows = np.asarray(rows, dtype=np.float32)[-self.capacity :]
+        if rows.ndim != 2 or rows.shape[1] != self._block.shape[1]:
+            raise ValueError(
+                f"Expected rows with {self._block.shape[1]} features, got {rows.shape}"
+            )
+        if self._stop + len(rows) > len(self._block):
+            keep = self.capacity - len(rows)
+            self._block[:keep] = self._block[self._stop - keep : self._stop]
+            self._start, self._stop = 0, keep
+        self._block[self._stop : self._stop + len(rows)] = rows
+        self._stop += len(rows)
+        self._start = max(self._start, self._stop - self.capacity)
+        return self
+
+    def view(self) -> np.ndarray:
+        view = self._block[self._start : self._stop]
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,159 @@
+# infra/generators/sequence_generator.py
+from __future__ import annotations
+
+import math
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.infrastructure.config import YamlConfigProvider
+from src.infrastructure.generators.feature_layout import target_indices
+from config.paths import DATASET_PARAMS_FILE
+
+try:
+    from keras.utils import PyDataset as _KerasDataset
+except ModuleNotFoundError:  # keras is optional for building windows
+    _KerasDataset = object
+
+
+class SlidingWindowSequence(_KerasDataset):
+    """
+    Zero-copy sliding-window generator over a ModelInputData matrix.
+
+    The data is held once as a contiguous float32 (rows, features) buffer; all
+    windows are a read-only strided view of shape (n_windows, sequence_length,
+    features) over it, so memory stays at 1x the dataset whatever the sequence
+    length. Shuffling permutes window start indices, never data; only the batch
+    being served is gathered into a fresh (batch, sequence_length, features) array.
+
+    Window i covers rows [i, i + sequence_length) and, when targets are set, is
+    labelled with the target columns at row i + sequence_length - 1 + horizon.
+
+    Usable directly as a Keras dataset (PyDataset/Sequence) or through
+    as_tf_dataset().
+    """
+
+    def __init__(
+        self,
+        data: ModelInputData,
+        sequence_length: int = 32,
+        batch_size: int = 8,
+        *,
+        horizon: int = 1,
+        targets: Optional[Sequence[int]] = None,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        if _KerasDataset is not object:
+            super().__init__(**kwargs)
+        if sequence_length < 1 or batch_size < 1:
+            raise ValueError("sequence_length and batch_size must be positive")
+
+        self.buffer = np.ascontiguousarray(np.asarray(data.data), dtype=np.float32)
+        if self.buffer.ndim != 2:
+            raise ValueError("ModelInputData payload must be a 2-D (rows, features)")
+
+        self.sequence_length = sequence_length
+        self.batch_size = batch_size
+        self.horizon = horizon
+        self.targets = list(targets) if targets is not None else target_indices(data)
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+
+        rows, features = self.buffer.shape
+        lookahead = horizon if self.targets else 0
+        self.n_windows = rows - sequence_length - lookahead + 1
+        if self.n_windows < 1:
+            raise ValueError(
+                f"{rows} rows are not enough for sequence_length={sequence_length} "
+                f"and horizon={lookahead}"
+            )
+
+        row_stride, col_stride = self.buffer.strides
+        self.windows = as_strided(
+            self.buffer,
+            shape=(self.n_windows, sequence_length, features),
+            strides=(row_stride, row_stride, col_stride),
+            writeable=False,
+        )
+        self._label_rows = np.arange(self.n_windows) + sequence_length - 1 + lookahead
+        self._order = np.arange(self.n_windows)
+        if shuffle:
+            self._rng.shuffle(self._order)
+
+    @classmethod
+    def from_config(
+        cls, data: ModelInputData, **overrides: Any
+    ) -> SlidingWindowSequence:
+        """
+        Build with gererator.sequence_length / gererator.batch_size from dataset_params.yaml.
+        """
+        provider = YamlConfigProvider(DATASET_PARAMS_FILE)
+        params = {
+            "sequence_length": provider.get("gererator.sequence_length", 32),
+            "batch_size": provider.get("gererator.batch_size", 8),
+        }
+        params.update(overrides)
+        return cls(data, **params)
+
+    # ------------ Sequence protocol ------------
+
+    def __len__(self) -> int:
+        return math.ceil(self.n_windows / self.batch_size)
+
+    def __getitem__(self, index: int) -> Any:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        starts = self._order[index * self.batch_size : (index + 1) * self.batch_size]
+        return self.batch(starts)
+
+    def on_epoch_end(self) -> None:
+        if self.shuffle:
+            self._rng.shuffle(self._order)
+
+    # ------------ Helpers ------------
+
+    def batch(self, starts: np.ndarray) -> Any:
+        """
+        Gather the windows starting at the given rows: x, or (x, y) with targets.
+        """
+        x = self.windows[starts]
+        if not self.targets:
+            return x
+        y = self.buffer[self._label_rows[starts]][:, self.targets]
+        return x, y
+
+    @property
+    def input_shape(self) -> Tuple[int, int]:
+        return self.sequence_length, self.buffer.shape[1]
+
+    def as_tf_dataset(self, prefetch: bool = True):
+        """
+        tf.data pipeline over the same buffer: the dataset is held once as a tensor
+        and batches are gathered from shuffled start indices.
+        """
+        import tensorflow as tf
+
+        base = tf.constant(self.buffer)
+        offsets = tf.range(self.sequence_length, dtype=tf.int64)
+        label_offset = self.sequence_length - 1 + (self.horizon if self.targets else 0)
+        targets = tf.constant(self.targets, dtype=tf.int64)
+
+        starts = tf.data.Dataset.range(self.n_windows)
+        if self.shuffle:
+            starts = starts.shuffle(self.n_windows, reshuffle_each_iteration=True)
+
+        def gather(batch_starts):
+            x = tf.gather(base, batch_starts[:, None] + offsets[None, :])
+            if not self.targets:
+                return x
+            rows = tf.gather(base, batch_starts + label_offset)
+            return x, tf.gather(rows, targets, axis=1)
+
+        dataset = starts.batch(self.batch_size).map(
+            gather, num_parallel_calls=tf.data.AUTOTUNE
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE) if prefetch else dataset
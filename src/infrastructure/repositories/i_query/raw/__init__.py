@@ -1,5 +1,6 @@
 from .bcb_loader import BcbLoader
 from .yfinance_loader import YfinanceLoader
 from .data_reader_loader import DataReaderLoader
+from .csv_raw_store import CsvRawStore
 
-__all__ = ["BcbLoader", "YfinanceLoader", "DataReaderLoader"]
+__all__ = ["BcbLoader", "YfinanceLoader", "DataReaderLoader", "CsvRawStore"]
@@ -2,21 +2,23 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Mapping, Optional, List
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, List, Sequence
 
 import requests
 import pandas as pd
 
-from src.domain.interfaces.repositories import IQuery
+from src.domain.interfaces.repositories import IScanQuery
 from src.infrastructure.config import YamlConfigProvider
 from config.paths import DATASET_PARAMS_FILE
 from config.logging_config import logger
+from .projection import group_by_series, narrow_range
 
 
-class BcbLoader(IQuery):
+class BcbLoader(IScanQuery):
     """
     Loader para dados do Banco Central (SGS API).
-    Implementa contrato IQuery (get_by_id, list_all).
+    Implementa contrato IScanQuery (get_by_id, list_all, scan).
     """
 
     def __init__(
@@ -40,12 +42,41 @@ class BcbLoader(IQuery):
     def get_by_id(self, ids: Optional[List[str]] = None) -> Mapping[str, Any]:
         requested = ids or list(self._config.keys())
         name_to_ticker = self._resolve_ids(requested)
+        return self._download(name_to_ticker, self.start_date, self.end_date)
 
+    def scan(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Mapping[str, Any]:
+        """
+        Request only the SGS series behind the projected columns, over the
+        intersection of [start, end] with the loader's range.
+        """
+        groups = group_by_series(columns, self._config.keys())
+        lo, hi = narrow_range(start, end, self.start_date, self.end_date)
+        if not groups or lo > hi:
+            return {}
+        name_to_ticker = {name: self._config[name] for name in groups}
+        return self._download(name_to_ticker, lo, hi)
+
+    def list_all(self) -> List[str]:
+        return list(self._config.keys())
+
+    # ------------ Helpers ------------
+
+    def _download(
+        self,
+        name_to_ticker: Mapping[str, str],
+        start_date: pd.Timestamp,
+        end_date: pd.Timestamp,
+    ) -> Dict[str, pd.DataFrame]:
         datasets: Dict[str, pd.DataFrame] = {}
         for name, ticker in name_to_ticker.items():
             logger.info(f"Downloading {name} ({ticker}) from BCB API...")
             try:
-                df = self._request_bcb_series(ticker)
+                df = self._request_bcb_series(ticker, start_date, end_date)
                 if df is not None and not df.empty:
                     df.rename(columns={"valor": f"{name}_valor"}, inplace=True)
                     datasets[name] = df
@@ -59,11 +90,6 @@ class BcbLoader(IQuery):
 
         return datasets
 
-    def list_all(self) -> List[str]:
-        return list(self._config.keys())
-
-    # ------------ Helpers ------------
-
     def _resolve_ids(self, ids: List[str]) -> Dict[str, str]:
         inverse = {ticker: name for name, ticker in self._config.items()}
         resolved: Dict[str, str] = {}
@@ -76,12 +102,17 @@ class BcbLoader(IQuery):
                 resolved[_id] = _id  # fallback
         return resolved
 
-    def _request_bcb_series(self, sgs_code: str) -> Optional[pd.DataFrame]:
+    def _request_bcb_series(
+        self,
+        sgs_code: str,
+        start_date: Optional[pd.Timestamp] = None,
+        end_date: Optional[pd.Timestamp] = None,
+    ) -> Optional[pd.DataFrame]:
         url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.{sgs_code}/dados"
         params = {
             "formato": "json",
-            "dataInicial": self.start_date.strftime("%d/%m/%Y"),
-            "dataFinal": self.end_date.strftime("%d/%m/%Y"),
+            "dataInicial": (start_date or self.start_date).strftime("%d/%m/%Y"),
+            "dataFinal": (end_date or self.end_date).strftime("%d/%m/%Y"),
         }
         try:
             response = requests.get(url, params=params)
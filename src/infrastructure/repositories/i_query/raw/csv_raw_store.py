@@ -0,0 +1,98 @@
+# infra/loaders/csv_raw_store.py
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from src.domain.interfaces.repositories import IScanQuery
+from config.paths import MAIN_RAW_FILE
+from config.logging_config import logger
+from .projection import group_by_series
+
+
+class CsvRawStore(IScanQuery):
+    """
+    Raw dataset persisted as a wide CSV (first column = date index, one column per
+    series field, e.g. data/raw/raw_dataset.csv).
+
+    scan() pushes the projection into the parser via usecols and filters the date
+    range chunk by chunk, so unused columns are never parsed and out-of-range rows
+    are never held in memory.
+    """
+
+    def __init__(
+        self, filepath: str | Path = MAIN_RAW_FILE, *, chunksize: int = 100_000
+    ) -> None:
+        self._filepath = Path(filepath)
+        self.chunksize = chunksize
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: Optional[List[str]] = None) -> Mapping[str, Any]:
+        """
+        Ids are series names (column prefixes) or full column names.
+        """
+        return self.scan(columns=self._expand(ids) if ids else None)
+
+    def list_all(self) -> List[str]:
+        return self._header()[1:]
+
+    # ------------ IScanQuery ------------
+
+    def scan(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Mapping[str, Any]:
+        header = self._header()
+        index_col = header[0]
+        if columns is None:
+            usecols = header
+        else:
+            available = set(header[1:])
+            usecols = [index_col] + [c for c in columns if c in available]
+            if len(usecols) == 1:
+                return {}
+
+        logger.info(
+            f"Scanning {len(usecols) - 1}/{len(header) - 1} columns of {self._filepath}"
+        )
+        chunks = []
+        reader = pd.read_csv(
+            self._filepath,
+            usecols=usecols,
+            index_col=index_col,
+            parse_dates=[index_col],
+            chunksize=self.chunksize,
+        )
+        for chunk in reader:
+            if start is not None:
+                chunk = chunk[chunk.index >= pd.Timestamp(start)]
+            if end is not None:
+                chunk = chunk[chunk.index <= pd.Timestamp(end)]
+            if not chunk.empty:
+                chunks.append(chunk)
+
+        if not chunks:
+            return {}
+        frame = pd.concat(chunks)
+        # Keep the caller's column order rather than the file's.
+        return {"raw": frame[[c for c in usecols[1:]]]}
+
+    # ------------ Helpers ------------
+
+    def _header(self) -> List[str]:
+        if not self._filepath.exists():
+            raise FileNotFoundError(f"Raw dataset not found: {self._filepath}")
+        return list(pd.read_csv(self._filepath, nrows=0).columns)
+
+    def _expand(self, ids: Sequence[str]) -> List[str]:
+        columns = self._header()[1:]
+        series = {c.rpartition("_")[0] for c in columns}
+        groups = group_by_series(columns, [i for i in ids if i in series])
+        expanded = [c for cols in groups.values() for c in cols or []]
+        return expanded + [i for i in ids if i in columns]
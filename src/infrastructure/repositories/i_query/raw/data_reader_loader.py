@@ -1,57 +1,107 @@
+# infra/loaders/data_reader_loader.py
+from __future__ import annotations
+
 import time
-from typing import Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
 import pandas as pd
 import pandas_datareader.data as pdr
 
-from src.core.interfaces.dataset_loading_strategy import IDatasetLoadingStrategy
-from src.infrastructure.config.market_config import MarketConfigFacade
-from src.infrastructure.logging import logger
+from src.domain.interfaces.repositories import IScanQuery
+from src.infrastructure.config import YamlConfigProvider
+from config.paths import DATASET_PARAMS_FILE
+from config.logging_config import logger
+from .projection import group_by_series, narrow_range, project
 
 
-class DataReaderLoadingStrategy(IDatasetLoadingStrategy):
+class DataReaderLoader(IScanQuery):
     """
-    Strategy to load datasets from DataReader (FRED).
-    Bottom Line Up Front (BLUF): If your pipeline ignores these sources,
-    you are missing critical insights and exposing blind spots.
+    Loader for macroeconomic series from DataReader (FRED).
+    Implements the IScanQuery contract (get_by_id, list_all, scan).
+
+    The "DataReader" section of dataset_params.yaml maps FRED code -> name;
+    columns are exposed as "<name>_<code>" like the other loaders.
     """
 
-    def __init__(self, start_date: str, end_date: str):
-        self.start_date = start_date
-        self.end_date = end_date
-        self._config = MarketConfigFacade().datareader_codes
-
-    def load(self) -> Dict[str, pd.DataFrame]:
-        dr_data = {}
-
-        for ticker, name in self._config.items():
-            logger.info(
-                f"[BLUF] Capturing {name} ({ticker}) from DataReader — "
-                f"without this data, your analysis risks being incomplete."
-            )
-            df = self._load_single_ticker(ticker, name)
-            if df is not None:
-                dr_data[name] = df
-
-            time.sleep(2)  # avoid overloading the API
-
-        return dr_data
-
-    def _load_single_ticker(self, ticker: str, name: str) -> Optional[pd.DataFrame]:
-        try:
-            df = pdr.DataReader(
-                ticker, "fred", start=self.start_date, end=self.end_date
-            )
-            if df.empty:
-                logger.warning(
-                    f"[GAP] No data returned for {name} ({ticker}) — "
-                    "ignoring this means missing a piece of the economic puzzle."
-                )
-                return None
-            return df
-        except Exception as e:
-            logger.error(
-                f"[FAILURE] Could not load {name} ({ticker}): {e} — "
-                "delays here represent lost opportunities in decision-making.",
-                exc_info=True,
-            )
-            return None
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        *,
+        sleep_seconds: float = 2.0,
+        config: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.start_date = pd.to_datetime(start_date)
+        self.end_date = pd.to_datetime(end_date)
+        self.sleep_seconds = sleep_seconds
+
+        codes = dict(
+            config or YamlConfigProvider(DATASET_PARAMS_FILE).get("DataReader", {})
+        )
+        # name -> FRED code, matching the name -> ticker layout of other loaders
+        self._config: Dict[str, str] = {name: code for code, name in codes.items()}
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: Optional[List[str]] = None) -> Mapping[str, Any]:
+        requested = ids or list(self._config.keys())
+        name_to_code = self._resolve_ids(requested)
+        return self._download(name_to_code, self.start_date, self.end_date)
+
+    def list_all(self) -> List[str]:
+        return list(self._config.keys())
+
+    # ------------ IScanQuery ------------
+
+    def scan(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Mapping[str, Any]:
+        groups = group_by_series(columns, self._config.keys())
+        lo, hi = narrow_range(start, end, self.start_date, self.end_date)
+        if not groups or lo > hi:
+            return {}
+        name_to_code = {name: self._config[name] for name in groups}
+        datasets = self._download(name_to_code, lo, hi)
+        return {name: project(df, groups[name]) for name, df in datasets.items()}
+
+    # ------------ Helpers ------------
+
+    def _download(
+        self,
+        name_to_code: Mapping[str, str],
+        start_date: pd.Timestamp,
+        end_date: pd.Timestamp,
+    ) -> Dict[str, pd.DataFrame]:
+        datasets: Dict[str, pd.DataFrame] = {}
+        for name, code in name_to_code.items():
+            logger.info(f"Downloading {name} ({code}) from DataReader...")
+            try:
+                df = pdr.DataReader(code, "fred", start=start_date, end=end_date)
+                if isinstance(df, pd.DataFrame) and not df.empty:
+                    df.columns = [f"{name}_{col}" for col in df.columns]
+                    datasets[name] = df
+                else:
+                    logger.warning(f"No data returned for {name} ({code})")
+            except Exception as e:
+                logger.error(f"Error loading {name} ({code}): {e}", exc_info=True)
+
+            if self.sleep_seconds:
+                time.sleep(self.sleep_seconds)
+
+        return datasets
+
+    def _resolve_ids(self, ids: List[str]) -> Dict[str, str]:
+        inverse = {code: name for name, code in self._config.items()}
+        resolved: Dict[str, str] = {}
+        for _id in ids:
+            if _id in self._config:
+                resolved[_id] = self._config[_id]  # name -> code
+            elif _id in inverse:
+                resolved[inverse[_id]] = _id  # code -> name
+            else:
+                resolved[_id] = _id  # fallback
+        return resolved
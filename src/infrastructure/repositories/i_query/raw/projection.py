@@ -0,0 +1,60 @@
+# infra/loaders/projection.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+def group_by_series(
+    columns: Optional[Sequence[str]], names: Iterable[str]
+) -> Dict[str, Optional[List[str]]]:
+    """
+    Map projected column names back to the series that produce them.
+
+    Loaders prefix every column with the series name ("IndBovespa_Close",
+    "SELIC_Anual_valor"); the longest matching prefix wins so that names
+    containing underscores resolve correctly. A bare series name selects all
+    of its columns (None). Columns from other sources are ignored.
+    """
+    names = list(names)
+    if columns is None:
+        return {name: None for name in names}
+
+    by_length = sorted(names, key=len, reverse=True)
+    groups: Dict[str, Optional[List[str]]] = {}
+    for column in columns:
+        if column in names:
+            groups[column] = None
+            continue
+        for name in by_length:
+            if column.startswith(f"{name}_"):
+                if groups.get(name, []) is not None:
+                    groups.setdefault(name, []).append(column)
+                break
+    return groups
+
+
+def narrow_range(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    default_start: datetime,
+    default_end: datetime,
+) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Intersect a requested date range with the loader's configured range.
+    """
+    lo = pd.Timestamp(default_start)
+    hi = pd.Timestamp(default_end)
+    if start is not None:
+        lo = max(lo, pd.Timestamp(start))
+    if end is not None:
+        hi = min(hi, pd.Timestamp(end))
+    return lo, hi
+
+
+def project(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    if columns is None:
+        return df
+    return df[[c for c in columns if c in df.columns]]
@@ -2,18 +2,20 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Mapping, Optional, List
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, List, Sequence
 
 import pandas as pd
 import yfinance as yf
 
-from src.domain.interfaces.repositories import IQuery
+from src.domain.interfaces.repositories import IScanQuery
 from src.infrastructure.config import YamlConfigProvider
 from config.paths import DATASET_PARAMS_FILE
 from config.logging_config import logger
+from .projection import group_by_series, narrow_range, project
 
 
-class YfinanceLoader(IQuery):
+class YfinanceLoader(IScanQuery):
     """
     Infrastructure Layer loader implementing the IQuery interface.
     Preserves functionality from the previous loader (dates, interval, logging,
@@ -59,15 +61,54 @@ class YfinanceLoader(IQuery):
         # fallback: sem ids -> todos
         requested = ids or list(self._config.keys())
         name_to_ticker = self._resolve_ids(requested)
+        return self._download(name_to_ticker, self.start_date, self.end_date)
 
+    def scan(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Mapping[str, Any]:
+        """
+        Download only the series owning the requested columns, restricted to the
+        intersection of [start, end] with the loader's range, and keep only the
+        requested fields (e.g. "IndBovespa_Close" skips the other OHLCV columns).
+
+        end is inclusive; yfinance treats its end as exclusive (as does the
+        loader's end_date), so the day after end is what gets passed on.
+        """
+        groups = group_by_series(columns, self._config.keys())
+        if end is not None:
+            end = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+        lo, hi = narrow_range(start, end, self.start_date, self.end_date)
+        if not groups or lo >= hi:
+            return {}
+
+        name_to_ticker = {name: self._config[name] for name in groups}
+        datasets = self._download(
+            name_to_ticker, lo.strftime("%Y-%m-%d"), hi.strftime("%Y-%m-%d")
+        )
+        return {name: project(df, groups[name]) for name, df in datasets.items()}
+
+    def list_all(self) -> List[str]:
+        """
+        List all available IDs (logical names) from the configuration.
+        """
+        return list(self._config.keys())
+
+    # ------------ Helpers ------------
+
+    def _download(
+        self, name_to_ticker: Mapping[str, str], start_date: str, end_date: str
+    ) -> Dict[str, pd.DataFrame]:
         datasets: Dict[str, pd.DataFrame] = {}
         for name, ticker in name_to_ticker.items():
             logger.info(f"Downloading {name} ({ticker}) from yfinance...")
             try:
                 df = yf.download(
                     ticker,
-                    start=self.start_date,
-                    end=self.end_date,
+                    start=start_date,
+                    end=end_date,
                     interval=self.interval,
                     auto_adjust=self.auto_adjust,
                     progress=False,
@@ -92,14 +133,6 @@ class YfinanceLoader(IQuery):
 
         return datasets
 
-    def list_all(self) -> List[str]:
-        """
-        List all available IDs (logical names) from the configuration.
-        """
-        return list(self._config.keys())
-
-    # ------------ Helpers ------------
-
     def _resolve_ids(self, ids: List[str]) -> Dict[str, str]:
         """
         Resolves provided IDs into a name -> ticker mapping.
@@ -0,0 +1,17 @@
+from .prepared_config_store import PreparedConfigStore
+from .checkpoint_store import CheckpointStore
+from .feature_store import AsOfIndex, PointInTimeFeatureStore
+from .model_registry import ModelRef, ModelRegistry
+from .processed_array_store import MemmapBatchLoader, NpyAppender, ProcessedArrayStore
+
+__all__ = [
+    "PreparedConfigStore",
+    "CheckpointStore",
+    "AsOfIndex",
+    "PointInTimeFeatureStore",
+    "ProcessedArrayStore",
+    "MemmapBatchLoader",
+    "NpyAppender",
+    "ModelRegistry",
+    "ModelRef",
+]
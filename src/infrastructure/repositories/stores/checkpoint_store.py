@@ -0,0 +1,102 @@
+# infra/repositories/stores/checkpoint_store.py
+from __future__ import annotations
+
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.domain.interfaces.repositories import CheckpointKey, ICheckpointStore
+from config.paths import CHECKPOINTS_DIR
+from config.logging_config import logger
+
+FORMAT_VERSION = 1
+
+
+class CheckpointStore(ICheckpointStore):
+    """
+    File-system store for stage checkpoints under data/processed/checkpoints.
+
+    Each stage output is written as <root>/<lineage_id>/<position>-<stage>.ckpt
+    with pickle protocol 5, which serializes numpy/pandas blocks as raw buffers
+    (no per-element encoding). Entities keep their schema, provenance, lineage and
+    metadata. A checkpoint only loads back for the exact key it was saved under.
+    """
+
+    def __init__(self, root: str | Path = CHECKPOINTS_DIR) -> None:
+        self.root = Path(root)
+
+    # ------------ ICheckpointStore ------------
+
+    def save_checkpoint(self, key: CheckpointKey, output: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        envelope = {"format_version": FORMAT_VERSION, "key": key, "output": output}
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(envelope, f, protocol=5)
+        os.replace(tmp, path)
+        logger.info(f"Checkpoint saved: {key.id}")
+
+    def load_checkpoint(self, key: CheckpointKey) -> Optional[Any]:
+        envelope = self._read(self._path(key))
+        if envelope is None:
+            return None
+        stored: CheckpointKey = envelope["key"]
+        if stored.input_fingerprint != key.input_fingerprint:
+            logger.info(f"Checkpoint {key.id} belongs to a different input; ignoring")
+            return None
+        return envelope["output"]
+
+    # ------------ ICommand ------------
+
+    def delete(self, id: str) -> None:
+        """
+        Delete one checkpoint ("<lineage_id>/<position>-<stage>") or, given a bare
+        lineage id, every checkpoint of that run.
+        """
+        target = self.root / id
+        if target.is_dir():
+            shutil.rmtree(target)
+        else:
+            target.with_suffix(".ckpt").unlink(missing_ok=True)
+
+    def edit(self, id: str) -> None:
+        raise NotImplementedError("Checkpoints are immutable; save a new one instead.")
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: list[str]) -> Mapping[str, Any]:
+        found: Dict[str, Any] = {}
+        for _id in ids:
+            envelope = self._read((self.root / _id).with_suffix(".ckpt"))
+            if envelope is not None:
+                found[_id] = envelope["output"]
+        return found
+
+    def list_all(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return [
+            str(path.relative_to(self.root).with_suffix(""))
+            for path in sorted(self.root.glob("*/*.ckpt"))
+        ]
+
+    # ------------ Helpers ------------
+
+    def _path(self, key: CheckpointKey) -> Path:
+        return (self.root / key.id).with_suffix(".ckpt")
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as f:
+                envelope = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Unreadable checkpoint {path}: {e}")
+            return None
+        if envelope.get("format_version") != FORMAT_VERSION:
+            return None
+        return envelope
@@ -0,0 +1,286 @@
+# infra/repositories/stores/feature_store.py
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.value_objects import DatasetSchema
+from src.domain.interfaces.repositories.i_command import ICommand
+from src.domain.interfaces.repositories.i_query import IQuery
+from config.paths import FEATURE_STORE_DIR
+from config.logging_config import logger
+
+NAT = np.iinfo(np.int64).min  # datetime64[ns] NaT as int64
+
+
+def _nanoseconds(times: Any) -> np.ndarray:
+    # Naive timestamps as int64 ns; tz-aware ones are converted to UTC first.
+    index = pd.DatetimeIndex(times)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+class AsOfIndex:
+    """
+    Point-in-time lookup over the records of one series.
+
+    A record is (observation_time, available_time, value); revisions repeat an
+    observation_time with a later available_time. As of t, the known value is
+    the record with the largest (observation_time, available_time) among those
+    available at or before t.
+
+    Records are sorted by available_time and each gets its rank in
+    (observation_time, available_time) order; a running maximum of the ranks
+    (np.maximum.accumulate) then names, for every prefix of the availability
+    order, the best record published so far. A query for any number of
+    timestamps is one searchsorted into the availability times plus one gather.
+    """
+
+    def __init__(
+        self, observed: np.ndarray, available: np.ndarray, values: np.ndarray
+    ) -> None:
+        self.observed = np.asarray(observed, dtype=np.int64)
+        self.available = np.asarray(available, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        by_key = np.lexsort((self.available, self.observed))
+        rank = np.empty(len(by_key), dtype=np.int64)
+        rank[by_key] = np.arange(len(by_key))
+        by_availability = np.lexsort((self.observed, self.available))
+        self._times = self.available[by_availability]
+        self._best = by_key[np.maximum.accumulate(rank[by_availability])]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def lookup(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Values and their observation times (int64 ns, NAT when none) as of times."""
+        if not len(self):
+            return np.full(len(times), np.nan), np.full(len(times), NAT)
+        position = np.searchsorted(self._times, times, side="right") - 1
+        known = position >= 0
+        record = self._best[np.maximum(position, 0)]
+        values = np.where(known, self.values[record], np.nan)
+        observed = np.where(known, self.observed[record], NAT)
+        return values, observed
+
+
+class PointInTimeFeatureStore(ICommand, IQuery):
+    """
+    Local store of series records with observation and availability times.
+
+    Each series lives in <root>/<quoted name>.npz as three aligned arrays
+    (observation_time, available_time as int64 ns, value as float64). Writes
+    merge new records into the series, a record repeating an (observation,
+    availability) pair replacing the old one, so BCB revisions are kept side by
+    side with the first prints. When availability is not known, release_lag
+    (a Timedelta or a pandas offset such as BDay(1)) derives it from the
+    observation time.
+
+    materialize() builds a point-in-time correct frame for any number of
+    timestamps in one bulk query: per series one vectorized as-of lookup on a
+    cached AsOfIndex, so no row can see a value published after its timestamp.
+    """
+
+    def __init__(self, root: Union[str, Path] = FEATURE_STORE_DIR) -> None:
+        self.root = Path(root)
+        self._indexes: Dict[str, AsOfIndex] = {}
+
+    # ------------ ICommand ------------
+
+    def save(self, to_save: Tuple[str, Any]) -> None:
+        """Write (series, values) with values as accepted by write()."""
+        series, values = to_save
+        self.write(series, values)
+
+    def write(
+        self,
+        series: str,
+        values: Union[pd.Series, pd.DataFrame],
+        *,
+        available: Optional[Any] = None,
+        release_lag: Optional[Any] = None,
+    ) -> int:
+        """
+        Add records to a series and return its record count.
+
+        Args:
+            series (str): Series name (e.g. "SELIC_Anual_valor").
+            values (pd.Series | pd.DataFrame): Values indexed by observation time,
+                or a frame with observation_time / available_time / value columns.
+            available (array-like, optional): Availability time of each value.
+            release_lag (Timedelta | DateOffset, optional): Publication delay used
+                when no availability is given; defaults to none (available when
+                observed).
+        """
+        observed, published, numbers = self._records(values, available, release_lag)
+        stored = self._load(series)
+        if stored is not None:
+            observed = np.concatenate([stored.observed, observed])
+            published = np.concatenate([stored.available, published])
+            numbers = np.concatenate([stored.values, numbers])
+        # Keep the last write of every (observation, availability) pair.
+        keys = pd.MultiIndex.from_arrays([observed, published])
+        keep = ~keys.duplicated(keep="last")
+        index = AsOfIndex(observed[keep], published[keep], numbers[keep])
+
+        path = self._path(series)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            np.savez(
+                f,
+                observation_time=index.observed,
+                available_time=index.available,
+                value=index.values,
+            )
+        os.replace(tmp, path)
+        self._indexes[series] = index
+        logger.info(f"Stored {len(index)} records of {series} in the feature store")
+        return len(index)
+
+    def delete(self, id: str) -> None:
+        self._path(id).unlink(missing_ok=True)
+        self._indexes.pop(id, None)
+
+    def edit(self, id: str) -> None:
+        raise NotImplementedError(
+            "Series records are append-only; write revisions instead."
+        )
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: list[str]) -> Mapping[str, Any]:
+        """Raw records of each stored series, as observation/available/value frames."""
+        records = {}
+        for series in ids:
+            index = self._load(series)
+            if index is None:
+                continue
+            records[series] = pd.DataFrame(
+                {
+                    "observation_time": index.observed.view("datetime64[ns]"),
+                    "available_time": index.available.view("datetime64[ns]"),
+                    "value": index.values,
+                }
+            )
+        return records
+
+    def list_all(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(unquote(path.stem) for path in self.root.glob("*.npz"))
+
+    # ------------ Point in time ------------
+
+    def as_of(self, series: str, times: Any) -> pd.Series:
+        """Value of one series known at each of times."""
+        index = self._require(series)
+        stamps = _nanoseconds(times)
+        values, _ = index.lookup(stamps)
+        return pd.Series(values, index=pd.DatetimeIndex(stamps), name=series)
+
+    def materialize(
+        self,
+        times: Any,
+        series: Optional[Sequence[str]] = None,
+        *,
+        max_age: Optional[Any] = None,
+        dtype: Any = np.float32,
+        targets: Optional[Sequence[str]] = None,
+    ) -> RawData:
+        """
+        Point-in-time frame of the given series (all stored when None) at times.
+
+        Args:
+            times (array-like): Timestamps to materialize, one output row each.
+            series (Sequence[str], optional): Series to include, in column order.
+            max_age (Timedelta, optional): Values observed longer than this before
+                a row's timestamp are dropped (NaN).
+            dtype (np.dtype): Dtype of the value block.
+            targets (Sequence[str], optional): Series to declare as schema targets.
+
+        Returns:
+            RawData: Values frame indexed by times, with metadata["observation_time"]
+                     holding the observation time behind every value and
+                     observation_time set to the latest timestamp.
+        """
+        names = list(series) if series is not None else self.list_all()
+        stamps = _nanoseconds(times)
+        values = np.empty((len(stamps), len(names)), dtype=dtype, order="F")
+        observed = np.empty((len(stamps), len(names)), dtype=np.int64, order="F")
+        for j, name in enumerate(names):
+            values[:, j], observed[:, j] = self._require(name).lookup(stamps)
+        if max_age is not None:
+            limit = pd.Timedelta(max_age).value
+            stale = (observed != NAT) & (stamps[:, None] - observed > limit)
+            values[stale] = np.nan
+            observed[stale] = NAT
+
+        index = pd.DatetimeIndex(stamps)
+        frame = pd.DataFrame(values, index=index, columns=names, copy=False)
+        observation = pd.DataFrame(
+            observed.view("datetime64[ns]"), index=index, columns=names, copy=False
+        )
+        targets = [t for t in targets or [] if t in names]
+        return RawData(
+            data=frame,
+            schema=DatasetSchema(
+                columns=[n for n in names if n not in targets], targets=targets or None
+            ),
+            metadata={"observation_time": observation, "source": "feature_store"},
+            observation_time=index.max().to_pydatetime() if len(index) else None,
+        )
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _records(
+        values: Union[pd.Series, pd.DataFrame],
+        available: Optional[Any],
+        release_lag: Optional[Any],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if isinstance(values, pd.DataFrame):
+            observed = pd.DatetimeIndex(values["observation_time"])
+            if available is None and "available_time" in values:
+                available = values["available_time"]
+            numbers = pd.to_numeric(values["value"], errors="coerce")
+        else:
+            observed = pd.DatetimeIndex(values.index)
+            numbers = pd.to_numeric(values, errors="coerce")
+        if available is None:
+            available = observed + release_lag if release_lag is not None else observed
+        observed_ns, available_ns = _nanoseconds(observed), _nanoseconds(available)
+        if len(available_ns) != len(observed_ns):
+            raise ValueError("available must have one time per value")
+        if np.any(available_ns < observed_ns):
+            raise ValueError("Values cannot be available before they are observed")
+        return observed_ns, available_ns, np.asarray(numbers, dtype=np.float64)
+
+    def _path(self, series: str) -> Path:
+        return self.root / f"{quote(series, safe='')}.npz"
+
+    def _load(self, series: str) -> Optional[AsOfIndex]:
+        if series in self._indexes:
+            return self._indexes[series]
+        path = self._path(series)
+        if not path.exists():
+            return None
+        with np.load(path) as stored:
+            index = AsOfIndex(
+                stored["observation_time"], stored["available_time"], stored["value"]
+            )
+        self._indexes[series] = index
+        return index
+
+    def _require(self, series: str) -> AsOfIndex:
+        index = self._load(series)
+        if index is None:
+            raise KeyError(f"Series '{series}' is not in the feature store")
+        return index
@@ -0,0 +1,271 @@
+# infra/repositories/stores/model_registry.py
+from __future__ import annotations
+
+import os
+import pickle
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.domain.interfaces.repositories.i_command import ICommand
+from src.domain.interfaces.repositories.i_query import IQuery
+from config.paths import MODELS_DIR
+from config.logging_config import logger
+
+ARTIFACT_FILE = "model.pkl"
+
+
+@dataclass(frozen=True)
+class ModelRef:
+    """
+    Registry coordinates of a model artifact, e.g. ModelRef("close_h5", "3").
+    """
+
+    name: str
+    version: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.name}/{self.version}"
+
+    @classmethod
+    def parse(cls, id: str) -> ModelRef:
+        name, _, version = id.rpartition("/")
+        if not name or not version:
+            raise KeyError(f"Model id must be '<name>/<version>', got '{id}'")
+        return cls(name, version)
+
+
+def _version_key(version: str) -> Tuple:
+    # "10" sorts after "9"; non-numeric parts compare as text
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.split(r"[.\-_]", version)
+    )
+
+
+class ModelRegistry(ICommand, IQuery):
+    """
+    Registry of model artifacts stored as <root>/<name>/<version>/model.pkl.
+
+    Artifacts are indexed from the directory layout and loaded lazily on first
+    get(). Loaded models live in a memory-bounded LRU (bytes estimated by `sizer`,
+    by default the artifact size on disk); the least recently used are evicted
+    when max_bytes or max_models is exceeded.
+
+    Loading happens outside the registry lock: a cold model only blocks callers
+    asking for that same model, which share one in-flight load. prefetch() starts
+    loads on a background pool for models expected to be needed soon. save() and
+    delete() detach loads already in flight for the refs they change, so an
+    overwritten version is never cached from a stale read.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = MODELS_DIR,
+        *,
+        max_bytes: Optional[int] = None,
+        max_models: Optional[int] = None,
+        loader: Optional[Callable[[Path], Any]] = None,
+        sizer: Optional[Callable[[Path, Any], int]] = None,
+        prefetch_workers: int = 2,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_models = max_models
+        self.loader = loader or self._unpickle
+        self.sizer = sizer or (lambda path, model: path.stat().st_size)
+
+        self._lock = threading.Lock()
+        self._loaded: "OrderedDict[ModelRef, Tuple[Any, int]]" = OrderedDict()
+        self._loading: Dict[ModelRef, Future] = {}
+        self._generation: Dict[ModelRef, int] = {}
+        self._bytes = 0
+        self._pool = ThreadPoolExecutor(
+            max_workers=prefetch_workers, thread_name_prefix="model-prefetch"
+        )
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ------------ Registry ------------
+
+    def get(self, name: str, version: Optional[str] = None) -> Any:
+        """
+        Return the model, loading it on a miss. Without a version, the latest one.
+        """
+        ref = ModelRef(name, version or self.latest(name))
+        with self._lock:
+            cached = self._loaded.get(ref)
+            if cached is not None:
+                self._loaded.move_to_end(ref)
+                self.stats["hits"] += 1
+                return cached[0]
+            self.stats["misses"] += 1
+            future = self._loading.get(ref)
+            owner = future is None
+            if owner:
+                future = self._loading[ref] = Future()
+
+        if owner:
+            self._load_into(ref, future)
+        return future.result()
+
+    def prefetch(self, refs: Iterable[ModelRef | str]) -> List[Future]:
+        """
+        Load the given models in the background; already loaded ones are skipped.
+        """
+        futures = []
+        for ref in refs:
+            ref = ModelRef.parse(ref) if isinstance(ref, str) else ref
+            with self._lock:
+                if ref in self._loaded:
+                    continue
+                future = self._loading.get(ref)
+                if future is None:
+                    future = self._loading[ref] = Future()
+                    self._pool.submit(self._load_into, ref, future)
+            futures.append(future)
+        return futures
+
+    def is_loaded(self, ref: ModelRef) -> bool:
+        with self._lock:
+            return ref in self._loaded
+
+    def versions(self, name: str) -> List[str]:
+        folder = self.root / name
+        if not folder.is_dir():
+            return []
+        found = [p.parent.name for p in folder.glob(f"*/{ARTIFACT_FILE}")]
+        return sorted(found, key=_version_key)
+
+    def latest(self, name: str) -> str:
+        versions = self.versions(name)
+        if not versions:
+            raise KeyError(f"No versions registered for model '{name}'")
+        return versions[-1]
+
+    def evict(self, ref: ModelRef) -> None:
+        with self._lock:
+            entry = self._loaded.pop(ref, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def loaded_bytes(self) -> int:
+        return self._bytes
+
+    # ------------ ICommand ------------
+
+    def save(self, to_save: Tuple[ModelRef, Any]) -> None:
+        ref, model = to_save
+        path = self._path(ref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        with self._lock:
+            self._invalidate(lambda r: r == ref)
+        logger.info(f"Model registered: {ref.id}")
+
+    def delete(self, id: str) -> None:
+        """
+        Delete one version ("<name>/<version>") or, given a bare name, every version.
+        """
+        target = self.root / id
+        if target.is_dir():
+            shutil.rmtree(target)
+        with self._lock:
+            self._invalidate(lambda r: id in (r.id, r.name))
+
+    def edit(self, id: str) -> None:
+        raise NotImplementedError("Model versions are immutable; save a new version.")
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: list[str]) -> Mapping[str, Any]:
+        found: Dict[str, Any] = {}
+        for _id in ids:
+            ref = ModelRef.parse(_id)
+            if self._path(ref).exists():
+                found[_id] = self.get(ref.name, ref.version)
+        return found
+
+    def list_all(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            str(p.parent.relative_to(self.root).as_posix())
+            for p in self.root.glob(f"*/*/{ARTIFACT_FILE}")
+        )
+
+    # ------------ Helpers ------------
+
+    def _path(self, ref: ModelRef) -> Path:
+        return self.root / ref.name / ref.version / ARTIFACT_FILE
+
+    def _invalidate(self, match: Callable[[ModelRef], bool]) -> None:
+        # Caller holds the lock. Drops cached copies, and detaches in-flight loads
+        # (bumping their generation) so they do not cache what they read.
+        for ref in [r for r in self._loaded if match(r)]:
+            self._bytes -= self._loaded.pop(ref)[1]
+        for ref in [r for r in self._loading if match(r)]:
+            del self._loading[ref]
+            self._generation[ref] = self._generation.get(ref, 0) + 1
+
+    def _load_into(self, ref: ModelRef, future: Future) -> None:
+        path = self._path(ref)
+        with self._lock:
+            generation = self._generation.get(ref, 0)
+        try:
+            if not path.exists():
+                raise KeyError(f"Model '{ref.id}' is not registered under {self.root}")
+            model = self.loader(path)
+            size = int(self.sizer(path, model))
+        except BaseException as e:
+            with self._lock:
+                if self._loading.get(ref) is future:
+                    del self._loading[ref]
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            if self._loading.get(ref) is future:
+                del self._loading[ref]
+            current = self._generation.get(ref, 0) == generation
+            if current:
+                self._loaded[ref] = (model, size)
+                self._bytes += size
+                self._evict_over_budget(keep=ref)
+        if current:
+            logger.info(f"Model loaded: {ref.id} ({size} bytes)")
+        else:
+            logger.info(f"Model {ref.id} changed while loading; not cached")
+        future.set_result(model)
+
+    def _evict_over_budget(self, keep: ModelRef) -> None:
+        def over() -> bool:
+            return (self.max_bytes is not None and self._bytes > self.max_bytes) or (
+                self.max_models is not None and len(self._loaded) > self.max_models
+            )
+
+        while over() and len(self._loaded) > 1:
+            ref = next(iter(self._loaded))
+            if ref == keep:
+                self._loaded.move_to_end(ref)
+                ref = next(iter(self._loaded))
+            self._bytes -= self._loaded.pop(ref)[1]
+            self.stats["evictions"] += 1
+            logger.info(f"Model evicted: {ref.id}")
+
+    @staticmethod
+    def _unpickle(path: Path) -> Any:
+        with path.open("rb") as f:
+            return pickle.load(f)
@@ -0,0 +1,115 @@
+# infra/repositories/stores/prepared_config_store.py
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.domain.interfaces.repositories import (
+    IPreparedConfigStore,
+    PreparedConfigKey,
+    PreparedConfigRecord,
+)
+from config.paths import PREPARED_CONFIGS_DIR
+from config.logging_config import logger
+
+FORMAT_VERSION = 1
+
+
+class PreparedConfigStore(IPreparedConfigStore):
+    """
+    File-system store for prepared strategy configs.
+
+    Each record is pickled together with a format version and its full key under
+    <root>/<fingerprint>/<stage>-<strategy hash>.pkl, the hash covering the strategy
+    class and its parameters. A record written by another strategy class, strategy
+    version, parameter set or store format is treated as a miss.
+    """
+
+    def __init__(self, root: str | Path = PREPARED_CONFIGS_DIR) -> None:
+        self.root = Path(root)
+
+    # ------------ ICommand ------------
+
+    def save(self, to_save: PreparedConfigRecord) -> None:
+        path = self._path(to_save.key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        envelope = {
+            "format_version": FORMAT_VERSION,
+            "key": to_save.key,
+            "created_at": to_save.created_at,
+            "config": to_save.config,
+        }
+        # Write-then-rename keeps concurrent readers from seeing partial files.
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(envelope, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        logger.info(f"Saved prepared config {to_save.key.id}")
+
+    def delete(self, id: str) -> None:
+        for path, envelope in self._scan():
+            if envelope["key"].id == id:
+                path.unlink(missing_ok=True)
+
+    def edit(self, id: str) -> None:
+        raise NotImplementedError(
+            "Prepared configs are immutable; save a new record instead."
+        )
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: list[str]) -> Mapping[str, Any]:
+        wanted = set(ids)
+        return {
+            envelope["key"].id: envelope["config"]
+            for _, envelope in self._scan()
+            if envelope["key"].id in wanted
+        }
+
+    def list_all(self) -> List[str]:
+        return [envelope["key"].id for _, envelope in self._scan()]
+
+    # ------------ IPreparedConfigStore ------------
+
+    def load(self, key: PreparedConfigKey) -> Optional[Any]:
+        envelope = self._read(self._path(key))
+        if envelope is None:
+            return None
+        if envelope["key"].id != key.id:
+            logger.warning(
+                f"Ignoring stale prepared config at {self._path(key)}: "
+                f"expected {key.id}, found {envelope['key'].id}"
+            )
+            return None
+        return envelope["config"]
+
+    # ------------ Helpers ------------
+
+    def _path(self, key: PreparedConfigKey) -> Path:
+        name = f"{key.strategy}#{key.params}" if key.params else key.strategy
+        strategy = hashlib.sha1(name.encode("utf-8")).hexdigest()[:12]
+        return self.root / key.fingerprint / f"{key.stage}-{strategy}.pkl"
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as f:
+                envelope = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Unreadable prepared config {path}: {e}")
+            return None
+        if envelope.get("format_version") != FORMAT_VERSION:
+            return None
+        return envelope
+
+    def _scan(self):
+        if not self.root.exists():
+            return
+        for path in sorted(self.root.glob("*/*.pkl")):
+            envelope = self._read(path)
+            if envelope is not None:
+                yield path, envelope
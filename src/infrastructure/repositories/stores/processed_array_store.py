@@ -0,0 +1,335 @@
+# infra/repositories/stores/processed_array_store.py
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.interfaces.repositories.i_command import ICommand
+from src.domain.interfaces.repositories.i_query import IQuery
+from src.infrastructure.generators import feature_order
+from config.paths import (
+    X_PROCESSED_DATA_TRAIN_FILE,
+    Y_PROCESSED_DATA_TRAIN_FILE,
+    X_PROCESSED_DATA_TEST_FILE,
+    Y_PROCESSED_DATA_TEST_FILE,
+)
+from config.logging_config import logger
+
+SPLITS: Dict[str, Tuple[Path, Path]] = {
+    "train": (X_PROCESSED_DATA_TRAIN_FILE, Y_PROCESSED_DATA_TRAIN_FILE),
+    "test": (X_PROCESSED_DATA_TEST_FILE, Y_PROCESSED_DATA_TEST_FILE),
+}
+
+# Header size reserved for files created here, so the row count can grow in place.
+HEADER_BYTES = 256
+
+
+class NpyAppender:
+    """
+    Appends rows to a .npy file without reading it back.
+
+    Rows are written as raw C-order bytes right after the rows the header counts,
+    then the shape in the header is rewritten in place. The write offset comes from
+    the header, not the file size, so bytes left behind by an interrupted append
+    (data written, header not yet updated) are overwritten and truncated away.
+    Files created here reserve HEADER_BYTES of header; files written by np.save
+    carry numpy's own growth padding.
+    """
+
+    def __init__(self, path: Union[str, Path], dtype: Any = np.float32) -> None:
+        self.path = Path(path)
+        self.dtype = np.dtype(dtype)
+
+    def append(self, rows: np.ndarray) -> int:
+        """
+        Append rows (2-D, or 1-D for a single column) and return the new row count.
+        """
+        rows = np.ascontiguousarray(rows, dtype=self.dtype)
+        if rows.ndim == 1:
+            rows = rows[:, None]
+
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("wb") as f:
+                self._write_header(f, rows.shape, HEADER_BYTES)
+                f.write(rows.tobytes())
+            return rows.shape[0]
+
+        with self.path.open("r+b") as f:
+            shape, header_bytes = self._read_header(f)
+            if shape[1:] != rows.shape[1:]:
+                raise ValueError(
+                    f"Cannot append rows of shape {rows.shape[1:]} to {self.path} "
+                    f"with rows of shape {shape[1:]}"
+                )
+            f.seek(header_bytes + shape[0] * self._row_bytes(shape))
+            f.truncate()
+            f.write(rows.tobytes())
+            new_shape = (shape[0] + rows.shape[0], *shape[1:])
+            f.seek(0)
+            self._write_header(f, new_shape, header_bytes)
+        return new_shape[0]
+
+    def rows(self) -> int:
+        """
+        Row count recorded in the header (0 when the file does not exist).
+        """
+        if not self.path.exists():
+            return 0
+        with self.path.open("rb") as f:
+            return self._read_header(f)[0][0]
+
+    def truncate(self, rows: int) -> None:
+        """
+        Shrink the file back to its first `rows` rows.
+        """
+        with self.path.open("r+b") as f:
+            shape, header_bytes = self._read_header(f)
+            if rows > shape[0]:
+                raise ValueError(f"{self.path} has {shape[0]} rows, not {rows}")
+            f.seek(0)
+            self._write_header(f, (rows, *shape[1:]), header_bytes)
+            f.truncate(header_bytes + rows * self._row_bytes(shape))
+
+    # ------------ Helpers ------------
+
+    def _row_bytes(self, shape: Tuple[int, ...]) -> int:
+        return int(np.prod(shape[1:], dtype=np.int64)) * self.dtype.itemsize
+
+    def _read_header(self, f) -> Tuple[Tuple[int, ...], int]:
+        version = npy_format.read_magic(f)
+        if version != (1, 0):
+            raise ValueError(f"{self.path} uses .npy format {version}; expected 1.0")
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(f)
+        if fortran_order or dtype != self.dtype:
+            raise ValueError(
+                f"{self.path} holds {dtype} (fortran_order={fortran_order}); "
+                f"expected C-order {self.dtype}"
+            )
+        return shape, f.tell()
+
+    def _write_header(self, f, shape: Tuple[int, ...], header_bytes: int) -> None:
+        header = repr(
+            {
+                "descr": npy_format.dtype_to_descr(self.dtype),
+                "fortran_order": False,
+                "shape": tuple(shape),
+            }
+        )
+        # magic (6) + version (2) + header length (2), then header ending in "\n"
+        width = header_bytes - 10
+        if len(header) + 1 > width:
+            raise ValueError(
+                f"Shape {shape} no longer fits in the header of {self.path}"
+            )
+        f.write(npy_format.MAGIC_PREFIX + bytes([1, 0]))
+        f.write(width.to_bytes(2, "little"))
+        f.write(header.ljust(width - 1).encode("latin1") + b"\n")
+
+
+class MemmapBatchLoader:
+    """
+    Streams shuffled (x, y) mini-batches from memory-mapped X/Y .npy arrays.
+
+    Opening is O(1): nothing is read until a batch is requested, so datasets larger
+    than RAM train in constant memory. Each epoch permutes the row indices; within a
+    batch the indices are sorted so the gather reads the mapping mostly forward.
+    Up to `prefetch` batches are materialized ahead by a background thread.
+    """
+
+    def __init__(
+        self,
+        x_path: Union[str, Path],
+        y_path: Optional[Union[str, Path]] = None,
+        *,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        prefetch: int = 2,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.x = np.load(x_path, mmap_mode="r")
+        self.y = np.load(y_path, mmap_mode="r") if y_path is not None else None
+        if self.y is not None and len(self.y) != len(self.x):
+            raise ValueError(
+                f"X has {len(self.x)} rows but Y has {len(self.y)}: {x_path}, {y_path}"
+            )
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = max(1, prefetch)
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return -(-len(self.x) // self.batch_size)
+
+    def __iter__(self) -> Iterator[Any]:
+        order = (
+            self._rng.permutation(len(self.x))
+            if self.shuffle
+            else np.arange(len(self.x))
+        )
+        buffer: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def produce() -> None:
+            try:
+                for start in range(0, len(order), self.batch_size):
+                    if stop.is_set():
+                        return
+                    buffer.put(self._batch(order[start : start + self.batch_size]))
+            except Exception as e:  # surfaced in the consuming thread
+                buffer.put(e)
+                return
+            buffer.put(None)
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        try:
+            while (item := buffer.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            while worker.is_alive():  # unblock a producer waiting on a full queue
+                try:
+                    buffer.get_nowait()
+                except queue.Empty:
+                    worker.join(timeout=0.01)
+
+    def _batch(self, rows: np.ndarray) -> Any:
+        if self.shuffle:
+            rows = np.sort(rows)
+        x = np.asarray(self.x[rows])
+        if self.y is None:
+            return x
+        return x, np.asarray(self.y[rows])
+
+
+class ProcessedArrayStore(ICommand, IQuery):
+    """
+    File-system store for the processed X/Y .npy arrays of one split.
+
+    save() appends the adapter output incrementally: schema.columns go to X and
+    schema.targets to Y, following the ModelInputData column order. Reads go
+    through memory maps; batches() streams shuffled mini-batches with prefetch.
+    """
+
+    def __init__(
+        self,
+        split: str = "train",
+        *,
+        x_path: Optional[Union[str, Path]] = None,
+        y_path: Optional[Union[str, Path]] = None,
+        dtype: Any = np.float32,
+    ) -> None:
+        if split not in SPLITS and (x_path is None or y_path is None):
+            raise KeyError(f"Unknown split '{split}'; expected one of {list(SPLITS)}")
+        default_x, default_y = SPLITS.get(split, (None, None))
+        self.split = split
+        self.x_path = Path(x_path or default_x)
+        self.y_path = Path(y_path or default_y)
+        self._x_writer = NpyAppender(self.x_path, dtype)
+        self._y_writer = NpyAppender(self.y_path, dtype)
+
+    def batches(self, batch_size: int = 32, **kwargs: Any) -> MemmapBatchLoader:
+        y_path = self.y_path if self.y_path.exists() else None
+        return MemmapBatchLoader(self.x_path, y_path, batch_size=batch_size, **kwargs)
+
+    # ------------ ICommand ------------
+
+    def save(self, to_save: Union[ModelInputData, Tuple[Any, Any]]) -> None:
+        """
+        Append a ModelInputData (or an (x, y) pair of arrays) to the split.
+
+        Row counts are checked before anything is written; if writing either file
+        fails, both are truncated back to their previous lengths.
+        """
+        if isinstance(to_save, ModelInputData):
+            x, y = self._split_columns(to_save)
+        else:
+            x, y = to_save
+        x = np.asarray(x)
+        y = np.asarray(y) if y is not None else None
+
+        writers = [self._x_writer] + ([self._y_writer] if y is not None else [])
+        before = [(w.path.exists(), w.rows()) for w in writers]
+        if y is not None:
+            if len(y) != len(x):
+                raise ValueError(
+                    f"{self.split}: cannot append {len(x)} X rows with {len(y)} Y rows"
+                )
+            if before[0][1] != before[1][1]:
+                raise ValueError(
+                    f"{self.split}: X has {before[0][1]} rows but Y has "
+                    f"{before[1][1]}; refusing to append"
+                )
+
+        try:
+            rows = self._x_writer.append(x)
+            if y is not None:
+                self._y_writer.append(y)
+        except BaseException:
+            for writer, (existed, count) in zip(writers, before):
+                self._restore(writer, existed, count)
+            raise
+        logger.info(f"Appended {len(x)} rows to {self.x_path} ({rows} total)")
+
+    def delete(self, id: str) -> None:
+        for path in self._paths_for(id):
+            path.unlink(missing_ok=True)
+
+    def edit(self, id: str) -> None:
+        raise NotImplementedError("Processed arrays are append-only.")
+
+    # ------------ IQuery ------------
+
+    def get_by_id(self, ids: list[str]) -> Mapping[str, Any]:
+        found: Dict[str, Any] = {}
+        for _id in ids:
+            for path in self._paths_for(_id):
+                if path.exists():
+                    found[path.stem] = np.load(path, mmap_mode="r")
+        return found
+
+    def list_all(self) -> List[str]:
+        return [p.stem for p in (self.x_path, self.y_path) if p.exists()]
+
+    # ------------ Helpers ------------
+
+    def _paths_for(self, id: str) -> List[Path]:
+        """
+        "X"/"X_train" -> X file, "Y"/"Y_train" -> Y file, anything else -> both.
+        """
+        if id in ("X", self.x_path.stem):
+            return [self.x_path]
+        if id in ("Y", self.y_path.stem):
+            return [self.y_path]
+        return [self.x_path, self.y_path]
+
+    @staticmethod
+    def _restore(writer: NpyAppender, existed: bool, rows: int) -> None:
+        try:
+            if not existed:
+                writer.path.unlink(missing_ok=True)
+            elif writer.rows() != rows:
+                writer.truncate(rows)
+        except Exception as e:
+            logger.error(f"Could not roll {writer.path} back to {rows} rows: {e}")
+
+    @staticmethod
+    def _split_columns(data: ModelInputData) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        matrix = np.asarray(data.data)
+        order = feature_order(data)
+        if not order:
+            return matrix, None
+        x_idx = [order.index(c) for c in data.schema.columns]
+        y_idx = [order.index(t) for t in data.schema.targets or []]
+        return matrix[:, x_idx], (matrix[:, y_idx] if y_idx else None)
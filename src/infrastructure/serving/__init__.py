@@ -0,0 +1,4 @@
+from .inference_server import BadRequest, InferenceServer, LatencyMetrics
+from .transform_plan import TransformPlan
+
+__all__ = ["BadRequest", "InferenceServer", "LatencyMetrics", "TransformPlan"]
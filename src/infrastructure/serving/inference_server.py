@@ -0,0 +1,397 @@
+# infra/serving/inference_server.py
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socketserver
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.application.orchestrators.end2end_prediction_flow import (
+    End2EndPredictionFlow,
+)
+from config.logging_config import logger
+
+FlowFactory = Callable[[Optional[str]], End2EndPredictionFlow]
+
+
+class BadRequest(ValueError):
+    """
+    A request body that cannot be parsed into a payload (answered with 400). Any
+    other error, including a ValueError from the flow, the model or the flow
+    factory, is a server error (500).
+    """
+
+
+class LatencyMetrics:
+    """
+    Thread-safe request counters plus a sliding window of recent latencies.
+    """
+
+    def __init__(self, window: int = 2048) -> None:
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.in_flight = 0
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.errors += 0 if ok else 1
+            self._latencies.append(seconds)
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = np.fromiter(self._latencies, dtype=np.float64)
+            counters = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "rejected": self.rejected,
+                "in_flight": self.in_flight,
+            }
+        if latencies.size:
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000.0
+            counters["latency_ms"] = {
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "mean": float(latencies.mean() * 1000.0),
+                "window": int(latencies.size),
+            }
+        return counters
+
+
+class InferenceServer:
+    """
+    Long-lived local inference server around a warm End2EndPredictionFlow.
+
+    The flow (model, adapter and prepared configs) is built once by flow_factory
+    and reused for every request. Requests are served over HTTP on a TCP port or
+    a Unix domain socket:
+
+        GET  /health   -> status, model version and load time
+        GET  /metrics  -> request counters and latency percentiles
+        POST /predict  -> body {"columns": [...], "index": [...], "data": [[...]]}
+                          (pandas "split" orient), response in the same layout
+        POST /reload   -> body {"version": "..."}; builds and warms a new flow,
+                          then swaps it in atomically
+
+    At most max_concurrency predictions run at once; a request that cannot get a
+    slot within queue_timeout seconds is answered with 503. Requests in flight
+    during a reload finish on the flow they started with.
+    """
+
+    def __init__(
+        self,
+        flow_factory: FlowFactory,
+        *,
+        version: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        unix_socket: Optional[str] = None,
+        max_concurrency: int = 4,
+        queue_timeout: float = 1.0,
+        warmup_data: Optional[RawData] = None,
+    ) -> None:
+        self.flow_factory = flow_factory
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.queue_timeout = queue_timeout
+        self.warmup_data = warmup_data
+        self.metrics = LatencyMetrics()
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._reload_lock = threading.Lock()
+        self._flow: Optional[End2EndPredictionFlow] = None
+        self._version: Optional[str] = None
+        self._loaded_at: Optional[datetime] = None
+        self._httpd: Optional[socketserver.BaseServer] = None
+
+        self.reload(version)
+
+    # ------------ Lifecycle ------------
+
+    def reload(self, version: Optional[str] = None) -> None:
+        """
+        Build and warm a flow for version, then swap it in. The current flow keeps
+        serving while the new one loads; a failed load leaves it in place.
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            flow = self.flow_factory(version)
+            if flow.configs.store is not None and flow.configs.config_key:
+                flow.preload()
+            if self.warmup_data is not None:
+                flow.execute(self.warmup_data)
+            self._flow, self._version = flow, version
+            self._loaded_at = datetime.now(timezone.utc)
+            logger.info(
+                f"Inference flow {version or 'default'} ready in "
+                f"{time.perf_counter() - started:.2f}s"
+            )
+
+    def serve_forever(self) -> None:
+        self._httpd = self._make_server()
+        where = self.unix_socket or f"http://{self.host}:{self.address[1]}"
+        logger.info(f"Serving inference on {where}")
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+
+    def start(self) -> threading.Thread:
+        """
+        Serve from a background daemon thread (useful for tests and notebooks).
+        """
+        self._httpd = self._make_server()
+        thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    @property
+    def address(self) -> Any:
+        return self._httpd.server_address if self._httpd else (self.host, self.port)
+
+    # ------------ Request handling ------------
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok" if self._flow is not None else "loading",
+            "model_version": self._version,
+            "loaded_at": self._loaded_at.isoformat() if self._loaded_at else None,
+        }
+
+    def predict(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Score one request. Returns None when no concurrency slot was available.
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self.metrics.reject()
+            return None
+
+        flow = self._flow  # pinned: a concurrent reload does not affect this call
+        self.metrics.started()
+        started, ok = time.perf_counter(), False
+        try:
+            predicted = flow.execute(RawData(data=_frame_from_split(payload)))
+            ok = True
+            return _split_from_frame(predicted.data)
+        finally:
+            self.metrics.finished(time.perf_counter() - started, ok)
+            self._slots.release()
+
+    def _make_server(self) -> socketserver.BaseServer:
+        handler = _handler_for(self)
+        if self.unix_socket:
+            if os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+            return _ThreadingUnixHTTPServer(self.unix_socket, handler)
+        return ThreadingHTTPServer((self.host, self.port), handler)
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+def _handler_for(server: InferenceServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._reply(HTTPStatus.OK, server.health())
+            elif self.path == "/metrics":
+                self._reply(HTTPStatus.OK, server.metrics.snapshot())
+            else:
+                self._reply(
+                    HTTPStatus.NOT_FOUND, {"error": f"unknown path {self.path}"}
+                )
+
+        def do_POST(self) -> None:
+            try:
+                payload = self._body()
+                if self.path == "/predict":
+                    result = server.predict(payload)
+                    if result is None:
+                        self._reply(
+                            HTTPStatus.SERVICE_UNAVAILABLE,
+                            {"error": "server busy"},
+                            headers={"Retry-After": "1"},
+                        )
+                    else:
+                        self._reply(HTTPStatus.OK, result)
+                elif self.path == "/reload":
+                    server.reload(payload.get("version"))
+                    self._reply(HTTPStatus.OK, server.health())
+                else:
+                    self._reply(
+                        HTTPStatus.NOT_FOUND, {"error": f"unknown path {self.path}"}
+                    )
+            except BadRequest as e:
+                # Malformed payloads (e.g. no 'data', ragged rows) are client errors.
+                logger.warning(f"Rejected request to {self.path}: {e}")
+                self._reply(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            except Exception as e:
+                logger.error(f"Request to {self.path} failed: {e}", exc_info=True)
+                self._reply(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+
+        def _body(self) -> Dict[str, Any]:
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError as e:
+                raise BadRequest(f"invalid Content-Length: {e}") from e
+            raw = self.rfile.read(length) if length else b"{}"
+            try:
+                payload = json.loads(raw or b"{}")
+            except ValueError as e:  # JSONDecodeError and undecodable bytes
+                raise BadRequest(f"invalid JSON: {e}") from e
+            if not isinstance(payload, dict):
+                raise BadRequest("body must be a JSON object")
+            return payload
+
+        def _reply(
+            self,
+            status: HTTPStatus,
+            body: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None,
+        ) -> None:
+            data = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def address_string(self) -> str:
+            # Unix socket peers have no (host, port) address.
+            return str(self.client_address[0]) if self.client_address else "unix"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"{self.address_string()} - {format % args}")
+
+    return Handler
+
+
+def _frame_from_split(payload: Dict[str, Any]) -> pd.DataFrame:
+    if "data" not in payload:
+        raise BadRequest("payload must contain 'data' (pandas split orient)")
+    try:
+        frame = pd.DataFrame(
+            payload["data"], columns=payload.get("columns"), index=payload.get("index")
+        )
+    except (TypeError, ValueError) as e:
+        raise BadRequest(f"payload is not a valid split frame: {e}") from e
+    if payload.get("index") is not None:
+        try:
+            frame.index = pd.to_datetime(frame.index)
+        except (TypeError, ValueError):
+            pass
+    return frame
+
+
+def _split_from_frame(data: Any) -> Dict[str, Any]:
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return json.loads(data.to_json(orient="split", date_format="iso"))
+    if isinstance(data, np.ndarray):
+        return {"data": data.tolist()}
+    return {"data": data}
+
+
+def default_flow_factory(version: Optional[str] = None) -> End2EndPredictionFlow:
+    """
+    Flow built from the bypass strategies. Real deployments pass their own
+    factory (see --factory) that loads the model and adapter for version.
+    """
+    return End2EndPredictionFlow()
+
+
+def _load_factory(spec: str) -> FlowFactory:
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name or "flow_factory")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="cleanflow-ml inference server")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--unix-socket", type=str, default=None, help="Serve on a Unix socket path"
+    )
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--queue-timeout", type=float, default=1.0)
+    parser.add_argument(
+        "--factory",
+        type=str,
+        default=None,
+        help="module:callable(version) returning an End2EndPredictionFlow",
+    )
+    parser.add_argument("--model-version", type=str, default=None)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    factory = _load_factory(args.factory) if args.factory else default_flow_factory
+    server = InferenceServer(
+        factory,
+        version=args.model_version,
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        max_concurrency=args.max_concurrency,
+        queue_timeout=args.queue_timeout,
+    )
+    # SIGHUP reloads the current version in place (e.g. after a new artifact).
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(
+            signal.SIGHUP,
+            lambda *_: threading.Thread(
+                target=server.reload, args=(server.version,), daemon=True
+            ).start(),
+        )
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
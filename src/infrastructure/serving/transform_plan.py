@@ -0,0 +1,193 @@
+# infra/serving/transform_plan.py
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from domain.interfaces.strategies.i_feature_cleaner import CleaningConfig
+from domain.interfaces.strategies.i_feature_selector import SelectionConfig
+from domain.interfaces.strategies.i_model_adapter import TransformationConfig
+
+
+class TransformPlan:
+    """
+    Prepared cleaning, selection and adapter configs fused into one row-level
+    transform over NumPy buffers, for online scoring of single records and tiny
+    batches where building DataFrames costs more than the model.
+
+    compile() resolves everything once: the output column order (the adapter's
+    feature order, else the selected columns, else the cleaned columns), and per
+    output column its fill value and clip bounds (from a VectorizedCleaner-style
+    CleaningConfig with columns / fill / lower / upper) and its affine map (from
+    a VectorizedModelAdapter-style TransformationConfig with scale / offset /
+    categories). Columns the cleaner does not cover keep NaNs and are not
+    clipped; without an adapter the map is the identity.
+
+    At run time a record is gathered into a preallocated float32 buffer in that
+    order, then cleaned and mapped with four in-place ufuncs over the filled rows
+    (copyto where NaN, clip, multiply, add). Categorical columns are looked up in
+    precomputed code tables (unknown -> -1). The returned matrix is a view of the
+    plan's buffer, overwritten by the next call, so a plan is not shared across
+    threads; copy() gives each thread its own.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        fill: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        scale: np.ndarray,
+        offset: np.ndarray,
+        codes: Optional[Mapping[str, Mapping[Any, int]]] = None,
+        max_rows: int = 1,
+    ) -> None:
+        self.columns = list(columns)
+        self.fill = np.asarray(fill, dtype=np.float32)
+        self.lower = np.asarray(lower, dtype=np.float32)
+        self.upper = np.asarray(upper, dtype=np.float32)
+        self.scale = np.asarray(scale, dtype=np.float32)
+        self.offset = np.asarray(offset, dtype=np.float32)
+        self.codes = {c: dict(table) for c, table in (codes or {}).items()}
+        self._categorical = [
+            (j, self.codes[c]) for j, c in enumerate(self.columns) if c in self.codes
+        ]
+        self._numeric = [j for j, c in enumerate(self.columns) if c not in self.codes]
+        self._numeric_names = [self.columns[j] for j in self._numeric]
+        if not self._categorical:
+            self._numeric = slice(None)  # plain slice assignment, no gather
+        self._allocate(max_rows)
+
+    @classmethod
+    def compile(
+        cls,
+        cleaning: Optional[CleaningConfig] = None,
+        selection: Optional[SelectionConfig] = None,
+        adapter: Optional[TransformationConfig] = None,
+        *,
+        max_rows: int = 1,
+    ) -> TransformPlan:
+        cleaning_params = (cleaning.params if cleaning is not None else None) or {}
+        if cleaning_params and not {"columns", "fill", "lower", "upper"} <= set(
+            cleaning_params
+        ):
+            raise ValueError(
+                "Only column-wise cleaning configs (columns, fill, lower, upper) "
+                "compile into a row-level plan"
+            )
+        cleaned = list(cleaning_params.get("columns", []))
+        selected = ((selection.details if selection is not None else None) or {}).get(
+            "selected_columns"
+        )
+        adapter_params = adapter.params if adapter is not None else {}
+        columns = list(adapter_params.get("feature_order") or selected or cleaned or [])
+        if not columns:
+            raise ValueError("Cannot compile a plan without any column order")
+
+        position = {c: i for i, c in enumerate(cleaned)}
+        width = len(columns)
+        fill = np.full(width, np.nan)
+        lower = np.full(width, -np.inf)
+        upper = np.full(width, np.inf)
+        for j, column in enumerate(columns):
+            i = position.get(column)
+            if i is not None:
+                fill[j] = cleaning_params["fill"][i]
+                lower[j] = cleaning_params["lower"][i]
+                upper[j] = cleaning_params["upper"][i]
+
+        scale = adapter_params.get("scale", np.ones(width))
+        offset = adapter_params.get("offset", np.zeros(width))
+        codes = {
+            column: {value: code for code, value in enumerate(categories)}
+            for column, categories in (adapter_params.get("categories") or {}).items()
+        }
+        return cls(columns, fill, lower, upper, scale, offset, codes, max_rows)
+
+    def copy(self) -> TransformPlan:
+        """Same plan with its own buffers."""
+        return TransformPlan(
+            self.columns,
+            self.fill,
+            self.lower,
+            self.upper,
+            self.scale,
+            self.offset,
+            self.codes,
+            len(self._buffer),
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        """Which columns the plan fills, clips and encodes."""
+        return {
+            "columns": list(self.columns),
+            "categorical": [self.columns[j] for j, _ in self._categorical],
+            "filled": [c for c, f in zip(self.columns, self.fill) if not np.isnan(f)],
+            "clipped": [
+                c
+                for c, lo, hi in zip(self.columns, self.lower, self.upper)
+                if np.isfinite(lo) or np.isfinite(hi)
+            ],
+            "buffer_rows": len(self._buffer),
+        }
+
+    # ------------ Run ------------
+
+    def transform_record(self, record: Mapping[str, Any]) -> np.ndarray:
+        """(1, features) matrix for one {column: value} record; missing keys are NaN."""
+        row = self._rows(1)[0]
+        get = record.get
+        row[self._numeric] = [
+            np.nan if (v := get(c)) is None else v for c in self._numeric_names
+        ]
+        for j, table in self._categorical:
+            row[j] = table.get(get(self.columns[j]), -1)
+        return self._apply(1)
+
+    def transform_records(self, records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """(len(records), features) matrix for a small batch of records."""
+        block = self._rows(len(records))
+        for i, record in enumerate(records):
+            get = record.get
+            block[i, self._numeric] = [
+                np.nan if (v := get(c)) is None else v for c in self._numeric_names
+            ]
+            for j, table in self._categorical:
+                block[i, j] = table.get(get(self.columns[j]), -1)
+        return self._apply(len(records))
+
+    def transform_array(self, values: Any) -> np.ndarray:
+        """
+        (rows, features) matrix for numeric rows already in plan.columns order,
+        categorical columns given as codes.
+        """
+        values = np.asarray(values)
+        values = values.reshape(1, -1) if values.ndim == 1 else values
+        if values.shape[1] != len(self.columns):
+            raise ValueError(
+                f"Expected rows of {len(self.columns)} values, got {values.shape[1]}"
+            )
+        np.copyto(self._rows(len(values)), values, casting="unsafe")
+        return self._apply(len(values))
+
+    # ------------ Helpers ------------
+
+    def _allocate(self, rows: int) -> None:
+        width = len(self.columns)
+        self._buffer = np.empty((max(rows, 1), width), dtype=np.float32)
+        self._mask = np.empty((max(rows, 1), width), dtype=bool)
+
+    def _rows(self, rows: int) -> np.ndarray:
+        if rows > len(self._buffer):
+            self._allocate(rows)
+        return self._buffer[:rows]
+
+    def _apply(self, rows: int) -> np.ndarray:
+        block, mask = self._buffer[:rows], self._mask[:rows]
+        np.isnan(block, out=mask)
+        np.copyto(block, self.fill, where=mask)
+        np.clip(block, self.lower, self.upper, out=block)
+        np.multiply(block, self.scale, out=block)
+        np.add(block, self.offset, out=block)
+        return block
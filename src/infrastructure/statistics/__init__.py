@@ -0,0 +1,22 @@
+from .accumulators import (
+    Accumulator,
+    ConfusionCounts,
+    DirectionalAccuracy,
+    ErrorMetrics,
+    Moments,
+)
+from .column_statistics import ColumnStatistics
+from .quantile_sketch import KLLSketch, QuantileSketches
+from .reference_profile import ReferenceProfile
+
+__all__ = [
+    "Accumulator",
+    "ColumnStatistics",
+    "ConfusionCounts",
+    "DirectionalAccuracy",
+    "ErrorMetrics",
+    "KLLSketch",
+    "Moments",
+    "QuantileSketches",
+    "ReferenceProfile",
+]
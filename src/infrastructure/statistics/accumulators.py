@@ -0,0 +1,269 @@
+# infra/statistics/accumulators.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def _as_matrix(values: Any) -> np.ndarray:
+    matrix = np.asarray(values, dtype=np.float64)
+    return matrix.reshape(len(matrix), -1) if matrix.ndim != 2 else matrix
+
+
+class Accumulator(ABC):
+    """
+    Online statistic over a stream of chunks.
+
+    update() folds one chunk in, merge() folds in another accumulator built over a
+    different shard (possibly in another process; accumulators are picklable) and
+    result() reads the statistic. Memory does not grow with the number of rows.
+    All statistics are vectorised over columns (one value per target).
+    """
+
+    @abstractmethod
+    def update(self, actual: Any, predicted: Any) -> Accumulator:
+        pass
+
+    @abstractmethod
+    def merge(self, other: Accumulator) -> Accumulator:
+        pass
+
+    @abstractmethod
+    def result(self) -> Dict[str, np.ndarray]:
+        pass
+
+
+class Moments(Accumulator):
+    """
+    Count, mean and variance (Welford; merged with Chan's parallel formula), plus
+    min and max. Tracks `actual - predicted` residuals when fed pairs, or raw
+    values through update_values().
+    """
+
+    def __init__(self) -> None:
+        self.count: Optional[np.ndarray] = None
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+        self.min: Optional[np.ndarray] = None
+        self.max: Optional[np.ndarray] = None
+
+    def update(self, actual: Any, predicted: Any) -> Moments:
+        return self.update_values(_as_matrix(actual) - _as_matrix(predicted))
+
+    def update_values(self, values: Any) -> Moments:
+        values = _as_matrix(values)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / count, 0.0)
+        m2 = np.nansum(np.where(valid, values - mean, 0.0) ** 2, axis=0)
+        chunk = Moments()
+        chunk.count, chunk.mean, chunk.m2 = count, mean, m2
+        chunk.min = np.nanmin(values, axis=0, initial=np.inf)
+        chunk.max = np.nanmax(values, axis=0, initial=-np.inf)
+        return self.merge(chunk)
+
+    def merge(self, other: Moments) -> Moments:
+        if other.count is None:
+            return self
+        if self.count is None:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        safe = np.maximum(count, 1)
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / safe
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / safe
+        self.count = count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def result(self) -> Dict[str, np.ndarray]:
+        if self.count is None:
+            return {}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": np.sqrt(variance),
+            "min": np.where(self.count > 0, self.min, np.nan),
+            "max": np.where(self.count > 0, self.max, np.nan),
+        }
+
+
+class ErrorMetrics(Accumulator):
+    """
+    Streaming MAE, RMSE, bias and MAPE (MAPE over non-zero actuals only; n_ape
+    counts them, so MAPE can be pooled across targets).
+    """
+
+    FIELDS = ("n", "abs", "sq", "err", "n_ape", "ape")
+
+    def __init__(self) -> None:
+        self.sums: Optional[Dict[str, np.ndarray]] = None
+
+    def update(self, actual: Any, predicted: Any) -> ErrorMetrics:
+        actual = _as_matrix(actual)
+        error = _as_matrix(predicted) - actual
+        valid = ~np.isnan(error)
+        nonzero = valid & (actual != 0)
+        error0 = np.where(valid, error, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ape = np.where(nonzero, np.abs(error / actual), 0.0)
+        chunk = {
+            "n": valid.sum(axis=0).astype(np.float64),
+            "abs": np.abs(error0).sum(axis=0),
+            "sq": (error0**2).sum(axis=0),
+            "err": error0.sum(axis=0),
+            "n_ape": nonzero.sum(axis=0).astype(np.float64),
+            "ape": ape.sum(axis=0),
+        }
+        return self._add(chunk)
+
+    def merge(self, other: ErrorMetrics) -> ErrorMetrics:
+        return self._add(other.sums) if other.sums is not None else self
+
+    def result(self) -> Dict[str, np.ndarray]:
+        if self.sums is None:
+            return {}
+        s = self.sums
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                "n": s["n"],
+                "mae": s["abs"] / s["n"],
+                "rmse": np.sqrt(s["sq"] / s["n"]),
+                "bias": s["err"] / s["n"],
+                "mape": np.where(s["n_ape"] > 0, s["ape"] / s["n_ape"], np.nan),
+                "n_ape": s["n_ape"],
+            }
+
+    def _add(self, sums: Dict[str, np.ndarray]) -> ErrorMetrics:
+        if self.sums is None:
+            self.sums = {k: v.copy() for k, v in sums.items()}
+        else:
+            for key in self.FIELDS:
+                self.sums[key] = self.sums[key] + sums[key]
+        return self
+
+
+class ConfusionCounts(Accumulator):
+    """
+    Confusion-matrix counts per target over a fixed label set; predictions and
+    actuals outside the labels are ignored.
+    """
+
+    def __init__(self, labels: Sequence[Any]) -> None:
+        self.labels = list(labels)
+        self._index = pd.Index(self.labels)
+        if not self._index.is_unique:
+            raise ValueError(f"Confusion labels must be unique: {self.labels}")
+        self.counts: Optional[np.ndarray] = None  # (targets, actual, predicted)
+
+    def update(self, actual: Any, predicted: Any) -> ConfusionCounts:
+        actual = np.asarray(actual)
+        predicted = np.asarray(predicted)
+        actual = actual.reshape(len(actual), -1)
+        predicted = predicted.reshape(len(predicted), -1)
+        k = len(self.labels)
+        a = self._codes(actual)
+        p = self._codes(predicted)
+
+        counts = np.zeros((actual.shape[1], k, k), dtype=np.int64)
+        for t in range(actual.shape[1]):
+            keep = (a[:, t] >= 0) & (p[:, t] >= 0)
+            flat = a[keep, t] * k + p[keep, t]
+            counts[t] = np.bincount(flat, minlength=k * k).reshape(k, k)
+        return self._add(counts)
+
+    def merge(self, other: ConfusionCounts) -> ConfusionCounts:
+        if other.labels != self.labels:
+            raise ValueError("Cannot merge confusion counts over different labels")
+        return self._add(other.counts) if other.counts is not None else self
+
+    def result(self) -> Dict[str, np.ndarray]:
+        if self.counts is None:
+            return {}
+        counts = self.counts.astype(np.float64)
+        diagonal = np.diagonal(counts, axis1=1, axis2=2)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            precision = diagonal / counts.sum(axis=1)
+            recall = diagonal / counts.sum(axis=2)
+            return {
+                "confusion": self.counts,
+                "accuracy": diagonal.sum(axis=1) / counts.sum(axis=(1, 2)),
+                "macro_precision": np.nanmean(precision, axis=1),
+                "macro_recall": np.nanmean(recall, axis=1),
+            }
+
+    def _codes(self, values: np.ndarray) -> np.ndarray:
+        # Hash lookup of every value at once; -1 marks values outside the labels.
+        codes = self._index.get_indexer(values.ravel())
+        return codes.reshape(values.shape)
+
+    def _add(self, counts: np.ndarray) -> ConfusionCounts:
+        self.counts = counts.copy() if self.counts is None else self.counts + counts
+        return self
+
+
+class DirectionalAccuracy(Accumulator):
+    """
+    Share of steps where the predicted change (predicted[t] - actual[t-1]) has the
+    sign of the actual change (actual[t] - actual[t-1]).
+
+    Chunks must arrive in time order, and merge(other) treats `other` as the shard
+    that immediately follows; the pair straddling the boundary is counted from the
+    first row of `other` and the last actual kept here.
+    """
+
+    def __init__(self) -> None:
+        self.hits: Optional[np.ndarray] = None
+        self.total: Optional[np.ndarray] = None
+        self.first_actual: Optional[np.ndarray] = None
+        self.first_predicted: Optional[np.ndarray] = None
+        self.last_actual: Optional[np.ndarray] = None
+
+    def update(self, actual: Any, predicted: Any) -> DirectionalAccuracy:
+        actual, predicted = _as_matrix(actual), _as_matrix(predicted)
+        if not len(actual):
+            return self
+        chunk = DirectionalAccuracy()
+        chunk.first_actual, chunk.first_predicted = actual[0], predicted[0]
+        chunk.last_actual = actual[-1]
+        chunk.hits, chunk.total = self._count(actual[1:], predicted[1:], actual[:-1])
+        return self.merge(chunk)
+
+    def merge(self, other: DirectionalAccuracy) -> DirectionalAccuracy:
+        if other.total is None:
+            return self
+        if self.total is None:
+            vars(self).update({k: v.copy() for k, v in vars(other).items()})
+            return self
+        hits, total = self._count(
+            other.first_actual[None],
+            other.first_predicted[None],
+            self.last_actual[None],
+        )
+        self.hits = self.hits + other.hits + hits
+        self.total = self.total + other.total + total
+        self.last_actual = other.last_actual
+        return self
+
+    def result(self) -> Dict[str, np.ndarray]:
+        if self.total is None:
+            return {}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {"directional_accuracy": self.hits / self.total, "steps": self.total}
+
+    @staticmethod
+    def _count(actual, predicted, previous):
+        real = np.sign(actual - previous)
+        forecast = np.sign(predicted - previous)
+        valid = ~(np.isnan(real) | np.isnan(forecast))
+        hits = (valid & (real == forecast)).sum(axis=0).astype(np.float64)
+        return hits, valid.sum(axis=0).astype(np.float64)
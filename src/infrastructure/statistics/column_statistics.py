@@ -0,0 +1,132 @@
+# infra/statistics/column_statistics.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .accumulators import Moments
+
+
+class ColumnStatistics:
+    """
+    Sufficient statistics of a set of columns: rows, null counts and, through
+    Moments, count, mean, M2 (sum of squared deviations), min and max.
+
+    update() folds in new rows only; merge() combines states built over
+    different partitions (Chan's formula, exact up to floating point). The state
+    is picklable and round-trips through to_dict()/from_dict() as plain lists,
+    so it can be kept in a prepared config and refreshed in O(new rows).
+    """
+
+    def __init__(self, columns: List[str]) -> None:
+        self.columns = list(columns)
+        self.rows = 0
+        self.nulls = np.zeros(len(self.columns))
+        self.moments = Moments()
+
+    def update(self, block: Any) -> ColumnStatistics:
+        block = np.asarray(block)
+        if block.ndim != 2 or block.shape[1] != len(self.columns):
+            raise ValueError(
+                f"Expected a (rows, {len(self.columns)}) block, got {block.shape}"
+            )
+        chunk = ColumnStatistics(self.columns)
+        chunk.rows = len(block)
+        chunk.nulls = np.isnan(block).sum(axis=0).astype(np.float64)
+        chunk.moments.update_values(block)
+        return self.merge(chunk)
+
+    def merge(self, other: ColumnStatistics) -> ColumnStatistics:
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge statistics over different columns")
+        self.rows += other.rows
+        self.nulls = self.nulls + other.nulls
+        self.moments.merge(other.moments)
+        return self
+
+    def result(self) -> Dict[str, np.ndarray]:
+        """
+        Per-column nulls, count, mean, std (ddof=1), min and max; NaN where a
+        column has no values.
+        """
+        width = len(self.columns)
+        moments = self.moments.result() or {
+            "count": np.zeros(width),
+            "mean": np.full(width, np.nan),
+            "std": np.full(width, np.nan),
+            "min": np.full(width, np.nan),
+            "max": np.full(width, np.nan),
+        }
+        empty = moments["count"] == 0
+        return {
+            "nulls": self.nulls.copy(),
+            **moments,
+            "mean": np.where(empty, np.nan, moments["mean"]),
+        }
+
+    # ------------ Serialization ------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        m = self.moments
+        arrays = {
+            name: None if value is None else np.asarray(value).tolist()
+            for name, value in (
+                ("count", m.count),
+                ("mean", m.mean),
+                ("m2", m.m2),
+                ("min", m.min),
+                ("max", m.max),
+            )
+        }
+        return {
+            "columns": list(self.columns),
+            "rows": self.rows,
+            "nulls": self.nulls.tolist(),
+            **arrays,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> ColumnStatistics:
+        stats = cls(state["columns"])
+        stats.rows = int(state["rows"])
+        stats.nulls = np.asarray(state["nulls"], dtype=np.float64)
+
+        def array(name: str) -> Optional[np.ndarray]:
+            value = state.get(name)
+            return None if value is None else np.asarray(value, dtype=np.float64)
+
+        m = stats.moments
+        m.count, m.mean, m.m2 = array("count"), array("mean"), array("m2")
+        m.min, m.max = array("min"), array("max")
+        return stats
+
+    @classmethod
+    def from_arrays(
+        cls,
+        columns: List[str],
+        rows: int,
+        nulls: np.ndarray,
+        mean: np.ndarray,
+        m2: np.ndarray,
+        minimum: np.ndarray,
+        maximum: np.ndarray,
+    ) -> ColumnStatistics:
+        """
+        State from statistics already computed by a full scan (NaN for empty
+        columns), so a prepare pass does not have to scan twice.
+        """
+        count = rows - np.asarray(nulls, dtype=np.float64)
+        empty = count == 0
+        return cls.from_dict(
+            {
+                "columns": columns,
+                "rows": rows,
+                "nulls": nulls,
+                "count": count,
+                "mean": np.where(empty, 0.0, mean),
+                "m2": np.where(empty, 0.0, np.nan_to_num(m2)),
+                "min": np.where(empty, np.inf, minimum),
+                "max": np.where(empty, -np.inf, maximum),
+            }
+        )
@@ -0,0 +1,235 @@
+# infra/statistics/quantile_sketch.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_DECAY = 2.0 / 3.0  # capacity ratio between consecutive KLL levels
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch of one numeric stream (Karnin, Lang and Liberty, 2016).
+
+    Items live in levels; an item at level h stands for 2^h inputs. When a level
+    exceeds its capacity it is sorted and every other item (random offset) moves
+    up one level, halving its size. Level capacities shrink geometrically from
+    the top (k at the highest level), so the sketch holds O(k) items whatever the
+    stream length, and quantile ranks are within about 1.7 / k of the truth
+    (k=200: ~1%) with high probability. min and max are tracked exactly.
+
+    update() takes whole arrays: the input is sliced into batches of at most
+    batch_size values, each cast, filtered and sorted once and halved directly
+    into the level it fits, so ingestion is vectorized and the temporary memory
+    bounded by batch_size. Sketches merge
+    level by level (same k) and round-trip through to_dict()/from_dict().
+    NaNs and infinities are ignored.
+    """
+
+    def __init__(
+        self, k: int = 200, *, batch_size: int = 1 << 16, seed: Optional[int] = None
+    ) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.batch_size = batch_size
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def size(self) -> int:
+        """Items retained (the sketch's memory, in float64s)."""
+        return sum(len(level) for level in self.levels)
+
+    # ------------ Ingestion ------------
+
+    def update(self, values: Any) -> KLLSketch:
+        values = np.asarray(values)
+        values = values if values.ndim == 1 else values.reshape(-1)
+        for start in range(0, len(values), self.batch_size):
+            batch = np.asarray(values[start : start + self.batch_size], np.float64)
+            batch = np.sort(batch[np.isfinite(batch)])
+            if not len(batch):
+                continue
+            self.n += len(batch)
+            self.min = min(self.min, batch[0])
+            self.max = max(self.max, batch[-1])
+            self._insert(batch)
+        return self
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        if other.k != self.k:
+            raise ValueError("Cannot merge KLL sketches with different k")
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self._compress()
+        return self
+
+    # ------------ Queries ------------
+
+    def quantile(self, q: Any) -> np.ndarray:
+        """
+        Approximate quantiles (linear interpolation between retained items).
+        NaN for an empty sketch.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if not self.n:
+            return np.full(q.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, weights = items[order], weights[order]
+        # Each item sits at the centre of the rank range it stands for; the
+        # exact min and max anchor ranks 0 and 1.
+        centres = (np.cumsum(weights) - weights / 2) / weights.sum()
+        values = np.interp(
+            q, np.r_[0.0, centres, 1.0], np.r_[self.min, items, self.max]
+        )
+        return np.clip(values, self.min, self.max)
+
+    def rank(self, x: Any) -> np.ndarray:
+        """Approximate fraction of inputs <= x."""
+        x = np.asarray(x, dtype=np.float64)
+        if not self.n:
+            return np.full(x.shape, np.nan)
+        total = np.zeros(x.shape)
+        for h, level in enumerate(self.levels):
+            total += np.searchsorted(np.sort(level), x, side="right") * 2.0**h
+        return total / sum(len(level) * 2.0**h for h, level in enumerate(self.levels))
+
+    # ------------ Serialization ------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": float(self.min),
+            "max": float(self.max),
+            "levels": [level.tolist() for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], seed: Optional[int] = None) -> KLLSketch:
+        sketch = cls(state["k"], seed=seed)
+        sketch.n = int(state["n"])
+        sketch.min, sketch.max = float(state["min"]), float(state["max"])
+        sketch.levels = [
+            np.asarray(level, dtype=np.float64) for level in state["levels"]
+        ]
+        return sketch
+
+    # ------------ Helpers ------------
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels) - 1 - h
+        return max(2, int(np.ceil(self.k * _DECAY**depth)))
+
+    def _insert(self, batch: np.ndarray) -> None:
+        # A sorted batch is halved straight down to the level it fits in;
+        # halving keeps it sorted, so no re-sort is needed on the way.
+        h = 0
+        while len(batch) > self._capacity(h) and len(batch) > 1:
+            if len(batch) % 2:
+                self.levels[h] = np.concatenate([self.levels[h], batch[-1:]])
+                batch = batch[:-1]
+            batch = batch[self._rng.integers(2) :: 2]
+            h += 1
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+        self.levels[h] = np.concatenate([self.levels[h], batch])
+        self._compress()
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                level = np.sort(level)
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                pairs = level[: len(level) - len(keep)]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                promoted = pairs[self._rng.integers(2) :: 2]
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+
+class QuantileSketches:
+    """
+    One KLLSketch per column of a (rows, columns) block, with the same
+    update/merge/serialization surface as ColumnStatistics. Memory per column is
+    O(k) regardless of the row count.
+
+    The per-column seeds are drawn from seed (fixed by default) and from_dict()
+    draws them again from the stored seed, so the same rows give the same
+    sketches, and configs prepared from them the same fingerprint.
+    """
+
+    def __init__(
+        self, columns: Sequence[str], k: int = 200, seed: Optional[int] = 0
+    ) -> None:
+        self.columns = list(columns)
+        self.k = k
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self.sketches = [
+            KLLSketch(k, seed=int(s))
+            for s in rng.integers(2**31, size=len(self.columns))
+        ]
+
+    def update(self, block: Any) -> QuantileSketches:
+        block = np.asarray(block)
+        if block.ndim != 2 or block.shape[1] != len(self.columns):
+            raise ValueError(
+                f"Expected a (rows, {len(self.columns)}) block, got {block.shape}"
+            )
+        for j, sketch in enumerate(self.sketches):
+            sketch.update(block[:, j])
+        return self
+
+    def update_column(self, j: int, values: Any) -> QuantileSketches:
+        self.sketches[j].update(values)
+        return self
+
+    def merge(self, other: QuantileSketches) -> QuantileSketches:
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge sketches over different columns")
+        for mine, theirs in zip(self.sketches, other.sketches):
+            mine.merge(theirs)
+        return self
+
+    def quantiles(self, q: Sequence[float]) -> np.ndarray:
+        """(len(q), columns) array of approximate quantiles."""
+        if not self.sketches:
+            return np.empty((len(q), 0))
+        return np.stack([s.quantile(q) for s in self.sketches], axis=1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "columns": list(self.columns),
+            "k": self.k,
+            "seed": self.seed,
+            "sketches": [s.to_dict() for s in self.sketches],
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> QuantileSketches:
+        sketches = cls(state["columns"], state["k"], state.get("seed", 0))
+        sketches.sketches = [
+            KLLSketch.from_dict(s, seed=fresh.seed)
+            for s, fresh in zip(state["sketches"], sketches.sketches)
+        ]
+        return sketches
@@ -0,0 +1,184 @@
+# infra/statistics/reference_profile.py
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .quantile_sketch import QuantileSketches
+
+_PSI_FLOOR = 1e-4  # bin share floor, keeps PSI finite for empty bins
+_RANK_ERROR = 1.7  # KLL rank error is about _RANK_ERROR / k
+
+
+class ReferenceProfile:
+    """
+    Compact per-feature picture of the training inputs for drift checks.
+
+    fit() streams the training block through one KLL sketch per feature
+    (QuantileSketches) in bounded row batches, then fixes n_bins equal-frequency
+    bins per feature from the sketch quantiles. What is kept is a (features,
+    n_bins - 1) array of interior edges, the reference CDF at those edges, the
+    missing rate and the sketches themselves, i.e. O(features * k) floats
+    whatever the training size; the training set is never read again.
+
+    compare() scores a batch against the profile with one broadcast comparison
+    of the batch against all edges (row chunks of chunk_rows bound the
+    temporary), which gives every feature's empirical CDF at its edges at once:
+        psi: population stability index over the bins (> 0.1 moderate,
+             > psi_threshold drifted);
+        ks:  largest CDF gap at the bin edges, a binned (lower-bound)
+             Kolmogorov-Smirnov statistic, flagged above the two-sample
+             critical value at ks_alpha. The reference CDF is read from the
+             sketch, so it is only known to about 1.7 / k; the critical value
+             is floored there, or large batches (where it tends to 0) would
+             all be flagged on sketch error alone;
+        missing: change in missing rate.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        edges: np.ndarray,
+        cdf: np.ndarray,
+        missing_rate: np.ndarray,
+        rows: int,
+        sketches: Optional[QuantileSketches] = None,
+        k: Optional[int] = None,
+    ) -> None:
+        self.columns = list(columns)
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.cdf = np.asarray(cdf, dtype=np.float64)
+        self.missing_rate = np.asarray(missing_rate, dtype=np.float64)
+        self.rows = int(rows)
+        self.sketches = sketches
+        if k is None:
+            k = sketches.k if sketches is not None else 200
+        self.k = int(k)
+
+    @property
+    def n_bins(self) -> int:
+        return self.edges.shape[1] + 1
+
+    @classmethod
+    def fit(
+        cls,
+        block: Any,
+        columns: Optional[Sequence[str]] = None,
+        *,
+        n_bins: int = 10,
+        k: int = 200,
+        batch_rows: int = 1 << 16,
+        seed: Optional[int] = 0,
+    ) -> ReferenceProfile:
+        block = np.asarray(block)
+        if block.ndim != 2:
+            raise ValueError(f"Expected a (rows, features) block, got {block.shape}")
+        if n_bins < 2:
+            raise ValueError("n_bins must be at least 2")
+        columns = list(columns) if columns else [str(j) for j in range(block.shape[1])]
+        sketches = QuantileSketches(columns, k, seed)
+        missing = np.zeros(block.shape[1])
+        for start in range(0, len(block), batch_rows):
+            batch = np.asarray(block[start : start + batch_rows], dtype=np.float64)
+            sketches.update(batch)
+            missing += np.isnan(batch).sum(axis=0)
+
+        q = np.linspace(0.0, 1.0, n_bins + 1)[1:-1]
+        edges = sketches.quantiles(q).T
+        cdf = np.stack([s.rank(e) for s, e in zip(sketches.sketches, edges)]).reshape(
+            edges.shape
+        )
+        return cls(
+            columns, edges, cdf, missing / max(len(block), 1), len(block), sketches
+        )
+
+    # ------------ Drift ------------
+
+    def compare(
+        self,
+        block: Any,
+        *,
+        psi_threshold: float = 0.2,
+        ks_alpha: float = 0.05,
+        chunk_rows: int = 4096,
+    ) -> Dict[str, Any]:
+        """
+        Drift scores of a (rows, features) batch against the profile, per feature
+        name, with the names of the features flagged by either test.
+        """
+        block = np.asarray(block)
+        if block.ndim != 2 or block.shape[1] != len(self.columns):
+            raise ValueError(
+                f"Expected a (rows, {len(self.columns)}) block, got {block.shape}"
+            )
+        below = np.zeros(self.edges.shape)
+        valid = np.zeros(len(self.columns))
+        edges = self.edges[None]
+        for start in range(0, len(block), chunk_rows):
+            chunk = block[start : start + chunk_rows]
+            below += (chunk[:, :, None] <= edges).sum(axis=0)
+            valid += (~np.isnan(chunk)).sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cdf = below / valid[:, None]
+            ks = np.abs(cdf - self.cdf).max(axis=1, initial=0.0)
+            expected = np.maximum(np.diff(self._bounded(self.cdf), axis=1), _PSI_FLOOR)
+            actual = np.maximum(np.diff(self._bounded(cdf), axis=1), _PSI_FLOOR)
+            psi = ((actual - expected) * np.log(actual / expected)).sum(axis=1)
+            m = valid
+            n = self.rows * (1 - self.missing_rate)
+            critical = np.sqrt(-np.log(ks_alpha / 2) / 2) * np.sqrt((n + m) / (n * m))
+            critical = np.maximum(critical, _RANK_ERROR / self.k)
+        empty = (valid == 0) | np.isnan(self.edges).any(axis=1)
+        ks[empty] = psi[empty] = np.nan
+        missing = 1 - valid / max(len(block), 1) - self.missing_rate
+
+        drifted = (psi > psi_threshold) | (ks > critical)
+        return {
+            "rows": len(block),
+            "psi": dict(zip(self.columns, psi.tolist())),
+            "ks": dict(zip(self.columns, ks.tolist())),
+            "ks_critical": dict(zip(self.columns, critical.tolist())),
+            "missing_shift": dict(zip(self.columns, missing.tolist())),
+            "drifted": [c for c, flag in zip(self.columns, drifted) if flag],
+            "max_psi": float(np.nanmax(psi)) if (~empty).any() else np.nan,
+        }
+
+    # ------------ Serialization ------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "columns": list(self.columns),
+            "edges": self.edges.tolist(),
+            "cdf": self.cdf.tolist(),
+            "missing_rate": self.missing_rate.tolist(),
+            "rows": self.rows,
+            "k": self.k,
+            "sketches": None if self.sketches is None else self.sketches.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> ReferenceProfile:
+        sketches = state.get("sketches")
+        return cls(
+            state["columns"],
+            np.asarray(state["edges"], dtype=np.float64).reshape(
+                len(state["columns"]), -1
+            ),
+            np.asarray(state["cdf"], dtype=np.float64).reshape(
+                len(state["columns"]), -1
+            ),
+            state["missing_rate"],
+            state["rows"],
+            None if sketches is None else QuantileSketches.from_dict(sketches),
+            state.get("k"),
+        )
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _bounded(cdf: np.ndarray) -> np.ndarray:
+        # CDF at every bin boundary: 0 below the first bin, 1 above the last.
+        rows = len(cdf)
+        return np.hstack([np.zeros((rows, 1)), cdf, np.ones((rows, 1))])
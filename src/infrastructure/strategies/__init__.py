@@ -0,0 +1,36 @@
+from typing import Any
+
+from .i_feature_cleaner import (
+    CalendarAligner,
+    DtypeOptimizer,
+    FeatureSpec,
+    LagFeatureGenerator,
+    VectorizedCleaner,
+)
+from .i_feature_selector import CorrelationMISelector
+from .i_model_adapter import VectorizedModelAdapter
+from .i_model_evaluator import StreamingEvaluator
+from .i_model_transparency import PermutationImportance
+
+__all__ = [
+    "CalendarAligner",
+    "DtypeOptimizer",
+    "FeatureSpec",
+    "LagFeatureGenerator",
+    "VectorizedCleaner",
+    "CorrelationMISelector",
+    "KerasForecastModel",
+    "VectorizedModelAdapter",
+    "StreamingEvaluator",
+    "PermutationImportance",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # KerasForecastModel imports keras (and with it TensorFlow) at module level;
+    # resolve it on first use so the other strategies import quickly.
+    if name == "KerasForecastModel":
+        from .i_model import KerasForecastModel
+
+        return KerasForecastModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,12 @@
+from .calendar_aligner import CalendarAligner
+from .dtype_optimizer import DtypeOptimizer
+from .lag_feature_generator import FeatureSpec, LagFeatureGenerator
+from .vectorized_cleaner import VectorizedCleaner
+
+__all__ = [
+    "CalendarAligner",
+    "DtypeOptimizer",
+    "FeatureSpec",
+    "LagFeatureGenerator",
+    "VectorizedCleaner",
+]
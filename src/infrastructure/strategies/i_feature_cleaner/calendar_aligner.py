@@ -0,0 +1,181 @@
+# infra/strategies/i_feature_cleaner/calendar_aligner.py
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.calendars import calendar_between
+from domain.interfaces.strategies.i_feature_cleaner import (
+    IFeatureCleaner,
+    CleaningConfig,
+    CleaningSummary,
+)
+
+
+class CalendarAligner(IFeatureCleaner):
+    """
+    Aligns mixed-frequency series (daily, other-market daily, monthly releases)
+    onto the business days of one target market.
+
+    The input is a wide, date-indexed frame where each column holds the
+    observations of one series and NaN where it did not print. All columns are
+    aligned together: a running "last observed row" per column (one
+    maximum.accumulate over the frame) is gathered at the source position of each
+    target day (one searchsorted of the calendar into the source dates), so the
+    as-of forward fill is linear in the total number of cells, whatever the number
+    of series. No value from after a target day is ever used. All-float32 inputs
+    are aligned, and returned, in float32.
+
+    Each aligned value has an age: target business days since its observation.
+    Values older than the column's max_age are stale; they are flagged in
+    metadata["stale"] (a boolean frame like the output) and, with drop_stale, set
+    to NaN. Unless given, max_age is inferred in prepare as stale_factor times the
+    column's median gap between observations, in target business days.
+    """
+
+    def __init__(
+        self,
+        target: str = "B3",
+        *,
+        max_age: Optional[Union[int, Mapping[str, int]]] = None,
+        stale_factor: float = 2.0,
+        drop_stale: bool = False,
+    ) -> None:
+        self.target = target
+        self.max_age = max_age
+        self.stale_factor = stale_factor
+        self.drop_stale = drop_stale
+
+    # ------------ IFeatureCleaner ------------
+
+    def prepare(self, data: RawData) -> CleaningSummary:
+        frame = self._frame(data)
+        columns = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+        calendar = calendar_between(self.target, frame.index[0], frame.index[-1])
+        observed = frame[columns].notna().to_numpy()
+
+        # Median spacing of each column's observations, in target business days.
+        positions = calendar.searchsorted(frame.index, side="right") - 1
+        gaps: Dict[str, float] = {}
+        for j, column in enumerate(columns):
+            steps = np.diff(positions[observed[:, j]])
+            gaps[column] = float(np.median(steps)) if len(steps) else np.nan
+
+        max_age = {}
+        for column in columns:
+            if isinstance(self.max_age, Mapping) and column in self.max_age:
+                max_age[column] = int(self.max_age[column])
+            elif isinstance(self.max_age, int):
+                max_age[column] = self.max_age
+            elif np.isfinite(gaps[column]):
+                max_age[column] = int(np.ceil(self.stale_factor * max(gaps[column], 1)))
+            else:
+                max_age[column] = 0
+
+        config = CleaningConfig(
+            params={"target": self.target, "columns": columns, "max_age": max_age}
+        )
+        aligned = self._align(frame, columns, calendar, max_age)
+        stale = aligned["stale"]
+        issues = {
+            "calendar_days": len(calendar),
+            "median_gap": gaps,
+            "max_age": max_age,
+            "observations": dict(zip(columns, observed.sum(axis=0).tolist())),
+            "stale_rate": {
+                c: float(rate) for c, rate in zip(columns, stale.mean(axis=0)) if rate
+            },
+            "leading_missing": {
+                c: int(n) for c, n in zip(columns, aligned["leading"]) if n
+            },
+            "dropped": [c for c in frame.columns if c not in columns],
+        }
+        return CleaningSummary(config=config, issues=issues)
+
+    def clean(self, data: RawData, config: CleaningConfig) -> CleanedData:
+        params = config.params
+        frame = self._frame(data)
+        columns: List[str] = params["columns"]
+        calendar = calendar_between(params["target"], frame.index[0], frame.index[-1])
+        aligned = self._align(frame, columns, calendar, params["max_age"])
+
+        values, stale = aligned["values"], aligned["stale"]
+        if self.drop_stale:
+            values[stale] = np.nan
+        output = pd.DataFrame(values, index=calendar, columns=columns, copy=False)
+        stale_frame = pd.DataFrame(stale, index=calendar, columns=columns, copy=False)
+
+        targets = [
+            t for t in (getattr(data.schema, "targets", None) or []) if t in columns
+        ]
+        schema = DatasetSchema(
+            columns=[c for c in columns if c not in targets],
+            targets=targets or None,
+            feature_types=getattr(data.schema, "feature_types", None),
+            constraints=getattr(data.schema, "constraints", None),
+            description=getattr(data.schema, "description", None),
+            version=getattr(data.schema, "version", None),
+        )
+        return data.to_stage(
+            CleanedData,
+            data=output,
+            schema=schema,
+            metadata={
+                **dict(data.metadata or {}),
+                "calendar": params["target"],
+                "stale": stale_frame,
+                "age": pd.DataFrame(aligned["age"], index=calendar, columns=columns),
+            },
+        )
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _frame(data: RawData) -> pd.DataFrame:
+        frame: pd.DataFrame = data.data
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            frame = frame.set_axis(pd.DatetimeIndex(frame.index), axis=0)
+        if frame.index.tz is not None:
+            frame = frame.tz_localize(None)
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+        if frame.empty:
+            raise ValueError("Cannot align an empty frame")
+        return frame
+
+    @staticmethod
+    def _align(
+        frame: pd.DataFrame,
+        columns: List[str],
+        calendar: pd.DatetimeIndex,
+        max_age: Mapping[str, int],
+    ) -> Dict[str, np.ndarray]:
+        narrow = columns and all(frame[c].dtype == np.float32 for c in columns)
+        values = frame[columns].to_numpy(
+            dtype=np.float32 if narrow else np.float64, na_value=np.nan
+        )
+        rows = np.arange(len(values))[:, None]
+        last = np.maximum.accumulate(np.where(np.isnan(values), -1, rows), axis=0)
+
+        # Source row at or before each target day (target days have no time part).
+        source = frame.index.searchsorted(calendar + pd.Timedelta(days=1), "left") - 1
+        picked = np.where(source[:, None] >= 0, last[np.maximum(source, 0)], -1)
+        missing = picked < 0
+        aligned = np.take_along_axis(values, np.maximum(picked, 0), axis=0)
+        aligned[missing] = np.nan
+
+        observed_on = calendar.searchsorted(frame.index, side="right") - 1
+        age = np.arange(len(calendar))[:, None] - observed_on[np.maximum(picked, 0)]
+        age[missing] = -1
+        limit = np.array([max_age[c] for c in columns])
+        return {
+            "values": aligned,
+            "age": age,
+            "stale": age > limit,
+            "leading": missing.sum(axis=0),
+        }
@@ -0,0 +1,278 @@
+# infra/strategies/i_feature_cleaner/dtype_optimizer.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from domain.interfaces.strategies.i_feature_cleaner import (
+    IFeatureCleaner,
+    CleaningConfig,
+    CleaningSummary,
+)
+from config.logging_config import logger
+
+INTEGER_DTYPES = ("Int8", "Int16", "Int32", "Int64")
+MAX_DECIMALS = 6
+
+
+def fits_float32(dtype: Any) -> bool:
+    """True for float32 and integer dtypes (nullable or not) of up to 16 bits,
+    whose values float32 holds exactly."""
+    dtype = pd.api.types.pandas_dtype(dtype)
+    if dtype == np.float32:
+        return True
+    return (
+        pd.api.types.is_integer_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+        and dtype.itemsize <= 2
+    )
+
+
+def parse_numbers(values: pd.Series, decimal: str = ".") -> pd.Series:
+    """
+    Strings such as "13.65" (or "13,65" with decimal=",") as float64; blanks
+    become NaN, anything else unparseable too.
+    """
+    text = values.astype("string").str.strip()
+    if decimal != ".":
+        text = text.str.replace(".", "", regex=False).str.replace(
+            decimal, ".", regex=False
+        )
+    text = text.mask(text == "")
+    return pd.to_numeric(text, errors="coerce").astype(np.float64)
+
+
+def decimals(values: np.ndarray) -> Optional[int]:
+    """
+    Fewest decimal places (up to MAX_DECIMALS) that represent every value, or
+    None for values that are not short decimals (computed ratios, noise).
+    """
+    # Relative to each value, so tiny magnitudes never pass as round numbers.
+    tolerance = 1e-12 * np.abs(values)
+    for places in range(MAX_DECIMALS + 1):
+        if np.all(np.abs(np.round(values, places) - values) <= tolerance):
+            return places
+    return None
+
+
+def _as_integer(values: pd.Series, dtype: str, column: str) -> pd.Series:
+    # The prepared integer dtype was sized on the prepare rows; new rows may not
+    # fit it. Widen to the next integer dtype that holds them, or keep float64
+    # when they are not integral, rather than fail or round.
+    if pd.api.types.is_integer_dtype(values):
+        numbers, lo, hi = values, values.min(), values.max()
+    else:
+        numbers = pd.to_numeric(values, errors="coerce").astype(np.float64)
+        finite = numbers.dropna().to_numpy()
+        if not np.all(np.isfinite(finite)) or np.any(finite != np.round(finite)):
+            logger.warning(f"{column}: non-integral values, kept as float64")
+            return numbers
+        lo, hi = finite.min(initial=0), finite.max(initial=0)
+    if pd.isna(lo):
+        lo = hi = 0
+    for name in INTEGER_DTYPES[INTEGER_DTYPES.index(dtype) :]:
+        info = np.iinfo(name.lower())
+        if info.min <= lo and hi <= info.max:
+            if name != dtype:
+                logger.warning(f"{column}: values outside {dtype}, widened to {name}")
+            return numbers.astype(name)
+    logger.warning(f"{column}: values outside Int64, kept as float64")
+    return numbers
+
+
+class DtypeOptimizer(IFeatureCleaner):
+    """
+    Narrows a frame to the smallest dtypes that keep its values.
+
+    prepare picks one dtype per column:
+        - strings that all parse as numbers (BCB "valor" comes back as text)
+          are parsed and then treated as numbers;
+        - integral numbers (also floats holding integers and NaN, as volumes do
+          after an outer join) become the narrowest nullable integer that holds
+          their range (clean widens it, or falls back to float64 for fractions,
+          when later rows do not fit);
+        - other floats become float32 when the round trip keeps them: values
+          with at most MAX_DECIMALS decimal places must round back to the same
+          decimals, others must stay within float_rtol;
+        - remaining strings with at most max_categories distinct values, and at
+          most category_ratio distinct values per row, become categoricals with
+          the categories fixed at prepare time (unseen values become NaN).
+    Every other column is left alone.
+
+    clean applies the prepared dtypes, so training and prediction frames get
+    identical dtypes, and records them in DatasetSchema.feature_types as dtype
+    names. Memory before and after (deep, in bytes) is reported in the summary
+    issues and in metadata["memory"] of the cleaned data. The other stages keep
+    narrow dtypes: VectorizedCleaner cleans float32 and small-integer columns
+    in a float32 block and CalendarAligner aligns all-float32 frames in float32.
+    Both work on one block, so a single column left in float64 (or a wide
+    integer) upcasts every numeric column, the narrowed ones included.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_categories: int = 255,
+        category_ratio: float = 0.5,
+        float_rtol: float = 1e-6,
+        integers: bool = True,
+        decimal: str = ".",
+    ) -> None:
+        self.max_categories = max_categories
+        self.category_ratio = category_ratio
+        self.float_rtol = float_rtol
+        self.integers = integers
+        self.decimal = decimal
+
+    # ------------ IFeatureCleaner ------------
+
+    def prepare(self, data: RawData) -> CleaningSummary:
+        frame: pd.DataFrame = data.data
+        dtypes: Dict[str, str] = {}
+        parsed: List[str] = []
+        categories: Dict[str, List[Any]] = {}
+        for column in frame.columns:
+            values = frame[column]
+            if self._is_text(values):
+                numbers = parse_numbers(values, self.decimal)
+                present = values.notna() & (values.astype("string").str.strip() != "")
+                if present.any() and numbers[present].notna().all():
+                    parsed.append(column)
+                    values = numbers
+                else:
+                    dtype = self._categorical(values)
+                    if dtype is not None:
+                        dtypes[column] = "category"
+                        categories[column] = dtype
+                    continue
+            if pd.api.types.is_bool_dtype(values) or not pd.api.types.is_numeric_dtype(
+                values
+            ):
+                continue
+            dtype = self._numeric(values)
+            if dtype is not None:
+                dtypes[column] = dtype
+
+        config = CleaningConfig(
+            params={
+                "dtypes": dtypes,
+                "parsed": parsed,
+                "categories": categories,
+                "decimal": self.decimal,
+            }
+        )
+        before = int(frame.memory_usage(deep=True).sum())
+        after = int(self._apply(frame, config.params).memory_usage(deep=True).sum())
+        issues = {
+            "dtypes": dtypes,
+            "parsed": parsed,
+            "unchanged": [c for c in frame.columns if c not in dtypes],
+            **self._memory(before, after),
+        }
+        return CleaningSummary(config=config, issues=issues)
+
+    def clean(self, data: RawData, config: CleaningConfig) -> CleanedData:
+        frame: pd.DataFrame = data.data
+        before = int(frame.memory_usage(deep=True).sum())
+        output = self._apply(frame, config.params)
+        after = int(output.memory_usage(deep=True).sum())
+
+        schema = data.schema
+        feature_types = dict(getattr(schema, "feature_types", None) or {})
+        feature_types.update({c: str(output[c].dtype) for c in output.columns})
+        targets = list(getattr(schema, "targets", None) or [])
+        columns = (
+            list(schema.columns)
+            if schema is not None
+            else [c for c in output.columns if c not in targets]
+        )
+        return data.to_stage(
+            CleanedData,
+            data=output,
+            schema=DatasetSchema(
+                columns=columns,
+                targets=targets or None,
+                feature_types=feature_types,
+                constraints=getattr(schema, "constraints", None),
+                description=getattr(schema, "description", None),
+                version=getattr(schema, "version", None),
+            ),
+            metadata={
+                **dict(data.metadata or {}),
+                "memory": self._memory(before, after),
+            },
+        )
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _is_text(values: pd.Series) -> bool:
+        return pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(
+            values
+        )
+
+    def _categorical(self, values: pd.Series) -> Optional[List[Any]]:
+        distinct = values.dropna().unique()
+        if not len(distinct) or len(distinct) > self.max_categories:
+            return None
+        if len(distinct) > self.category_ratio * len(values):
+            return None
+        return sorted(distinct.tolist(), key=str)
+
+    def _numeric(self, values: pd.Series) -> Optional[str]:
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        array = array[np.isfinite(array)]
+        finite = len(array) == values.notna().sum()
+        if self.integers and finite and len(array) and np.all(array == np.round(array)):
+            lo, hi = array.min(), array.max()
+            for name in INTEGER_DTYPES:
+                info = np.iinfo(name.lower())
+                if info.min <= lo and hi <= info.max:
+                    return None if str(values.dtype) == name else name
+        if values.dtype == np.float32:
+            return None
+        narrow = array.astype(np.float32).astype(np.float64)
+        places = decimals(array)
+        if places is not None:
+            keeps = np.array_equal(np.round(narrow, places), np.round(array, places))
+        else:
+            error = np.abs(narrow - array)
+            keeps = bool(np.all(error <= self.float_rtol * np.abs(array)))
+        return "float32" if keeps else None
+
+    @staticmethod
+    def _apply(frame: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+        dtypes: Dict[str, str] = params["dtypes"]
+        if not dtypes and not params["parsed"]:
+            return frame
+        columns = {}
+        for column in frame.columns:
+            values = frame[column]
+            if column in params["parsed"]:
+                values = parse_numbers(values, params["decimal"])
+            dtype = dtypes.get(column)
+            if dtype == "category":
+                categories = params["categories"][column]
+                # Mask unseen values first; pd.Categorical no longer drops them.
+                values = values.where(values.isin(categories))
+                values = pd.Categorical(values, categories=categories)
+            elif dtype in INTEGER_DTYPES:
+                values = _as_integer(values, dtype, column)
+            elif dtype is not None:
+                values = values.astype(dtype)
+            columns[column] = values
+        return pd.DataFrame(columns, index=frame.index)
+
+    @staticmethod
+    def _memory(before: int, after: int) -> Dict[str, Any]:
+        return {
+            "memory_before": before,
+            "memory_after": after,
+            "memory_saved": before - after,
+            "memory_saved_ratio": (before - after) / before if before else 0.0,
+        }
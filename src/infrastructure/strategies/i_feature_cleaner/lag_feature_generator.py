@@ -0,0 +1,306 @@
+# infra/strategies/i_feature_cleaner/lag_feature_generator.py
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from domain.interfaces.strategies.i_feature_cleaner import (
+    IFeatureCleaner,
+    CleaningConfig,
+    CleaningSummary,
+)
+
+STATISTICS = ("mean", "std", "min", "max", "return")
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    Declarative block of lag / rolling-window features.
+
+    Every series gets one lag feature per lag and one feature per (window,
+    statistic). "return" over window w is x[t] / x[t - w] - 1. With shift > 0 all
+    features of the block are taken as of row t - shift, e.g. shift=1 to describe
+    a target strictly from its past. An empty series tuple means every numeric
+    column.
+    """
+
+    series: Tuple[str, ...] = ()
+    lags: Tuple[int, ...] = ()
+    windows: Tuple[int, ...] = ()
+    statistics: Tuple[str, ...] = ("mean", "std")
+    shift: int = 0
+
+    def __post_init__(self):
+        unknown = [s for s in self.statistics if s not in STATISTICS]
+        if unknown:
+            raise ValueError(f"Unknown statistics {unknown}; expected {STATISTICS}")
+        if any(lag < 1 for lag in self.lags) or any(w < 1 for w in self.windows):
+            raise ValueError("Lags and windows must be positive")
+        if self.shift < 0:
+            raise ValueError("shift must be non-negative")
+
+    def names(self, series: str) -> List[str]:
+        """Output column names for one series, in generation order."""
+        suffix = f"_s{self.shift}" if self.shift else ""
+        names = [f"{series}_lag{lag}{suffix}" for lag in self.lags]
+        for window in self.windows:
+            names += [f"{series}_{stat}{window}{suffix}" for stat in self.statistics]
+        return names
+
+
+def rolling_extreme(values: np.ndarray, window: int, maximum: bool) -> np.ndarray:
+    """
+    Trailing rolling max (or min) of a 1-D array in O(n) whatever the window
+    (van Herk / Gil-Werman): the padded series is viewed as (n / window, window)
+    blocks, and the extreme of the window ending at t is the extreme of the
+    suffix scan at its start and the prefix scan at t. NaNs are ignored (fmax /
+    fmin); the first window - 1 rows hold the extreme of the rows so far.
+    """
+    n = len(values)
+    ufunc = np.fmax if maximum else np.fmin
+    out = ufunc.accumulate(values) if n else np.empty(0)
+    if window > n or window == 1:
+        return out if window > 1 else values.copy()
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, np.nan)
+    padded[:n] = values
+    view = padded.reshape(blocks, window)
+    prefix = ufunc.accumulate(view, axis=1).ravel()
+    suffix = ufunc.accumulate(view[:, ::-1], axis=1)[:, ::-1].ravel()
+    ufunc(suffix[: n - window + 1], prefix[window - 1 : n], out=out[window - 1 :])
+    return out
+
+
+class LagFeatureGenerator(IFeatureCleaner):
+    """
+    Lag and rolling-window feature generation from declarative FeatureSpecs.
+
+    Each series is read once as float64 and everything it feeds is computed in
+    one pass from shared state: a cumulative sum, sum of squares and valid count
+    (taken after centring the series on its mean, so the window differences keep
+    their precision) give every rolling mean and std as two slices per window;
+    rolling min/max come from blocked prefix/suffix scans (rolling_extreme), and
+    lags and returns from shifted slices. Results are written straight into
+    columns of one preallocated, column-major float32 block, which becomes the
+    single block of the feature frame, so a feature costs its float32 column plus
+    a few float64 temporaries of one series.
+
+    Features at row t only use rows <= t - shift. A rolling statistic needs
+    min_periods valid values in its window (default: the whole window), else it is
+    NaN, as with pandas rolling(window, min_periods); std uses ddof=1. Returns
+    with a zero base are NaN.
+
+    Generated columns are appended to the input (or replace it, with
+    keep_source=False, keeping the targets) and added to the schema as numeric
+    features.
+    """
+
+    def __init__(
+        self,
+        specs: Union[FeatureSpec, Sequence[FeatureSpec]],
+        *,
+        keep_source: bool = True,
+        min_periods: Optional[int] = None,
+    ) -> None:
+        self.specs = [specs] if isinstance(specs, FeatureSpec) else list(specs)
+        self.keep_source = keep_source
+        self.min_periods = min_periods
+
+    # ------------ IFeatureCleaner ------------
+
+    def prepare(self, data: RawData) -> CleaningSummary:
+        frame: pd.DataFrame = data.data
+        numeric = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+        plan: Dict[str, List[Dict[str, Any]]] = {}
+        for spec in self.specs:
+            series = list(spec.series) or numeric
+            missing = [s for s in series if s not in frame.columns]
+            if missing:
+                raise KeyError(f"Series not found in the data: {missing}")
+            for name in series:
+                plan.setdefault(name, []).append(asdict(spec))
+
+        features, sources = self._features(plan)
+        duplicated = pd.Index(features)[pd.Index(features).duplicated()].tolist()
+        clashing = [f for f in features if f in frame.columns]
+        if duplicated or clashing:
+            raise ValueError(
+                f"Generated columns are not unique: {sorted(set(duplicated + clashing))}"
+            )
+        config = CleaningConfig(
+            params={"plan": plan, "features": features, "sources": sources}
+        )
+        issues = {
+            "series": len(plan),
+            "features": len(features),
+            "block_bytes": len(frame) * len(features) * np.dtype(np.float32).itemsize,
+            "missing_rate": {
+                s: float(rate) for s, rate in frame[list(plan)].isna().mean().items()
+            },
+        }
+        return CleaningSummary(config=config, issues=issues)
+
+    def clean(self, data: RawData, config: CleaningConfig) -> CleanedData:
+        params = config.params
+        frame: pd.DataFrame = data.data
+        block = self.generate(frame, params["plan"])
+        features = pd.DataFrame(
+            block, index=frame.index, columns=params["features"], copy=False
+        )
+
+        schema = data.schema
+        targets = list(getattr(schema, "targets", None) or [])
+        if self.keep_source:
+            output = pd.concat([frame, features], axis=1)
+            columns = (
+                list(schema.columns)
+                if schema is not None
+                else [c for c in frame.columns if c not in targets]
+            )
+        else:
+            kept = [t for t in targets if t in frame.columns]
+            output = pd.concat([frame[kept], features], axis=1)
+            columns = []
+        feature_types = dict(getattr(schema, "feature_types", None) or {})
+        feature_types.update({f: "numeric" for f in params["features"]})
+        return data.to_stage(
+            CleanedData,
+            data=output,
+            schema=DatasetSchema(
+                columns=columns + list(params["features"]),
+                targets=targets or None,
+                feature_types=feature_types,
+                constraints=getattr(schema, "constraints", None),
+                description=getattr(schema, "description", None),
+                version=getattr(schema, "version", None),
+            ),
+        )
+
+    def required_columns(
+        self, config: CleaningConfig, downstream: Optional[List[str]]
+    ) -> Optional[List[str]]:
+        if downstream is None:
+            return None
+        sources = config.params["sources"]
+        required = [c for c in downstream if c not in sources]
+        for column in downstream:
+            source = sources.get(column)
+            if source is not None and source not in required:
+                required.append(source)
+        return required
+
+    # ------------ Generation ------------
+
+    def generate(
+        self, frame: pd.DataFrame, plan: Dict[str, List[Dict[str, Any]]]
+    ) -> np.ndarray:
+        """
+        (rows, features) float32 block, column-major, for a plan of
+        {series: [FeatureSpec fields]}; columns follow the plan order.
+        """
+        specs = {s: [FeatureSpec(**fields) for fields in plan[s]] for s in plan}
+        width = sum(len(spec.names(s)) for s in specs for spec in specs[s])
+        block = np.empty((len(frame), width), dtype=np.float32, order="F")
+        j = 0
+        for series, series_specs in specs.items():
+            values = frame[series].to_numpy(dtype=np.float64, na_value=np.nan)
+            j = self._series(values, series_specs, block, j)
+        return block
+
+    def _series(
+        self,
+        values: np.ndarray,
+        specs: List[FeatureSpec],
+        block: np.ndarray,
+        j: int,
+    ) -> int:
+        valid = ~np.isnan(values)
+        centre = values[valid].mean() if valid.any() else 0.0
+        centred = np.where(valid, values - centre, 0.0)
+        # Shared prefix sums: window totals are c[t + 1] - c[max(t + 1 - w, 0)].
+        count = np.concatenate([[0], np.cumsum(valid)])
+        total = np.concatenate([[0.0], np.cumsum(centred)])
+        squares = np.concatenate([[0.0], np.cumsum(centred * centred)])
+
+        for spec in specs:
+            for lag in spec.lags:
+                self._write(block[:, j], values, lag + spec.shift)
+                j += 1
+            for window in spec.windows:
+                periods = min(self.min_periods or window, window)
+                observed = self._window_total(count, window)
+                enough = observed >= max(periods, 1)
+                for stat in spec.statistics:
+                    result = self._statistic(
+                        stat, values, window, observed, total, squares, centre
+                    )
+                    if stat != "return":
+                        result[~enough] = np.nan
+                    self._write(block[:, j], result, spec.shift)
+                    j += 1
+        return j
+
+    @staticmethod
+    def _statistic(
+        stat: str,
+        values: np.ndarray,
+        window: int,
+        observed: np.ndarray,
+        total: np.ndarray,
+        squares: np.ndarray,
+        centre: float,
+    ) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if stat in ("mean", "std"):
+                sums = LagFeatureGenerator._window_total(total, window)
+                if stat == "mean":
+                    return sums / observed + centre
+                sq = LagFeatureGenerator._window_total(squares, window)
+                var = np.maximum(sq - sums * sums / observed, 0.0) / (observed - 1)
+                return np.where(observed > 1, np.sqrt(var), np.nan)
+            if stat in ("min", "max"):
+                return rolling_extreme(values, window, stat == "max")
+            result = np.full(len(values), np.nan)
+            if window < len(values):
+                result[window:] = values[window:] / values[:-window] - 1.0
+                result[~np.isfinite(result)] = np.nan
+            return result
+
+    @staticmethod
+    def _window_total(prefix: np.ndarray, window: int) -> np.ndarray:
+        # Trailing window sums of the series behind a prefix sum (len n + 1);
+        # the first window - 1 rows sum over the rows so far.
+        n = len(prefix) - 1
+        out = prefix[1:] - prefix[0]
+        if window < n:
+            out[window:] = prefix[window + 1 :] - prefix[1 : n + 1 - window]
+        return out
+
+    @staticmethod
+    def _write(column: np.ndarray, values: np.ndarray, shift: int) -> None:
+        # column[t] = values[t - shift], NaN before the first available row.
+        if shift >= len(values):
+            column[:] = np.nan
+            return
+        column[:shift] = np.nan
+        column[shift:] = values[: len(values) - shift]
+
+    @staticmethod
+    def _features(
+        plan: Dict[str, List[Dict[str, Any]]],
+    ) -> Tuple[List[str], Dict[str, str]]:
+        features: List[str] = []
+        sources: Dict[str, str] = {}
+        for series, fields in plan.items():
+            for spec in (FeatureSpec(**f) for f in fields):
+                names = spec.names(series)
+                features += names
+                sources.update(dict.fromkeys(names, series))
+        return features, sources
@@ -0,0 +1,336 @@
+# infra/strategies/i_feature_cleaner/vectorized_cleaner.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.infrastructure.statistics import ColumnStatistics, QuantileSketches
+from .dtype_optimizer import fits_float32
+from domain.interfaces.strategies.i_feature_cleaner import (
+    IFeatureCleaner,
+    CleaningConfig,
+    CleaningSummary,
+)
+
+OUTLIER_METHODS = ("iqr", "zscore", "none")
+QUANTILE_METHODS = ("exact", "sketch")
+IMPUTATIONS = ("median", "mean", "zero")
+QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+
+class VectorizedCleaner(IFeatureCleaner):
+    """
+    Reference IFeatureCleaner over the numeric columns of a DataFrame.
+
+    The numeric columns are read once into a column-major float block (float32 if
+    every column already is float32 or a small integer, float64 otherwise).
+    prepare walks that block in column chunks of about chunk_bytes, and computes
+    every statistic of a chunk (null count, min/max, mean/std, quantiles, outlier
+    counts) while it is in cache: one sort per chunk gives all quantiles through
+    a vectorized gather, NaNs sorting last. Outlier bounds are q25 - k * IQR /
+    q75 + k * IQR ("iqr") or mean -/+ z * std ("zscore").
+
+    clean imputes missing values and clips to the bounds with two in-place ufuncs
+    per chunk (copyto where NaN, then clip) on one fresh block, which becomes the
+    single block of the cleaned frame, so numeric columns come back in the block
+    dtype. Configured columns missing from the frame (projected away by a lazy
+    load) are skipped. Non-numeric columns pass through untouched; targets are
+    imputed but not clipped unless clip_targets is set.
+
+    With quantile_method="sketch" the chunks are not sorted: quantiles come from
+    one KLL sketch per column (QuantileSketches, rank error about 1.7 / sketch_k)
+    fed in bounded row batches, so memory per column is fixed whatever the row
+    count, at the cost of approximate bounds and medians. seed fixes the
+    sketches' sampling, so the same data always prepares the same config.
+
+    The config also keeps the columns' sufficient statistics (ColumnStatistics,
+    and the sketches when used, as plain lists), so configs can be refreshed with
+    update_prepare from new rows only.
+    """
+
+    def __init__(
+        self,
+        *,
+        outliers: str = "iqr",
+        iqr_factor: float = 1.5,
+        z_threshold: float = 4.0,
+        impute: str = "median",
+        quantiles: Sequence[float] = QUANTILES,
+        clip_targets: bool = False,
+        chunk_bytes: int = 64 << 20,
+        quantile_method: str = "exact",
+        sketch_k: int = 200,
+        seed: int = 0,
+    ) -> None:
+        if outliers not in OUTLIER_METHODS:
+            raise ValueError(
+                f"Unknown outlier method '{outliers}'; expected one of {OUTLIER_METHODS}"
+            )
+        if quantile_method not in QUANTILE_METHODS:
+            raise ValueError(
+                f"Unknown quantile method '{quantile_method}'; "
+                f"expected one of {QUANTILE_METHODS}"
+            )
+        if impute not in IMPUTATIONS:
+            raise ValueError(
+                f"Unknown imputation '{impute}'; expected one of {IMPUTATIONS}"
+            )
+        self.outliers = outliers
+        self.iqr_factor = iqr_factor
+        self.z_threshold = z_threshold
+        self.impute = impute
+        self.quantiles = tuple(sorted({*quantiles, 0.25, 0.5, 0.75}))
+        self.clip_targets = clip_targets
+        self.chunk_bytes = chunk_bytes
+        self.quantile_method = quantile_method
+        self.sketch_k = sketch_k
+        self.seed = seed
+
+    # ------------ IFeatureCleaner ------------
+
+    def prepare(self, data: RawData) -> CleaningSummary:
+        frame: pd.DataFrame = data.data
+        columns = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c])]
+        block = self._block(frame, columns)
+        sketches = (
+            QuantileSketches(columns, self.sketch_k, self.seed)
+            if self.quantile_method == "sketch"
+            else None
+        )
+        stats = self._statistics(block, sketches)
+        state = ColumnStatistics.from_arrays(
+            columns,
+            len(block),
+            stats["nulls"],
+            stats["mean"],
+            stats["m2"],
+            stats["min"],
+            stats["max"],
+        )
+
+        targets = set(data.schema.targets or []) if data.schema is not None else set()
+        unclipped = [] if self.clip_targets else [c for c in columns if c in targets]
+        config = self._config(columns, block.dtype, stats, unclipped, state, sketches)
+        issues = self._issues(columns, stats, len(block))
+        return CleaningSummary(config=config, issues=issues)
+
+    def update_prepare(self, config: CleaningConfig, added: RawData) -> CleaningSummary:
+        """
+        Fold the added rows into the sufficient statistics kept in
+        config.params["state"] (see ColumnStatistics) and rebuild the config from
+        them, in O(added rows). Moment-based settings (zscore or no outlier
+        bounds, mean or zero imputation) match a full prepare exactly;
+        quantile-based ones need the sketches of quantile_method="sketch" and
+        otherwise raise NotImplementedError.
+        """
+        params = config.params
+        needs_quantiles = self.outliers == "iqr" or self.impute == "median"
+        if needs_quantiles and params.get("sketches") is None:
+            raise NotImplementedError(
+                "Exact quantile-based bounds or imputation cannot be updated "
+                "incrementally; prepare with quantile_method='sketch'"
+            )
+        columns: List[str] = params["columns"]
+        dtype = np.dtype(params["dtype"])
+        block = self._block(added.data, columns, dtype)
+
+        state = ColumnStatistics.from_dict(params["state"]).update(block)
+        stats = state.result()
+        sketches = None
+        if params.get("sketches") is not None:
+            sketches = QuantileSketches.from_dict(params["sketches"]).update(block)
+            stats.update(self._quantile_stats(sketches.quantiles(self.quantiles)))
+        config = self._config(
+            columns, dtype, stats, params["unclipped"], state, sketches
+        )
+        issues = {**self._issues(columns, stats, state.rows), "added_rows": len(block)}
+        return CleaningSummary(config=config, issues=issues)
+
+    def clean(self, data: RawData, config: CleaningConfig) -> CleanedData:
+        params = config.params
+        frame: pd.DataFrame = data.data
+        columns: List[str] = params["columns"]
+        fill, lower, upper = params["fill"], params["lower"], params["upper"]
+        present = [i for i, c in enumerate(columns) if c in frame.columns]
+        if len(present) != len(columns):
+            # Projected loads (LazyEnrichmentFlow) drop columns nobody downstream
+            # reads; clean the ones that came with their own fill and bounds.
+            columns = [columns[i] for i in present]
+            fill, lower, upper = fill[present], lower[present], upper[present]
+        block = self._block(frame, columns, np.dtype(params["dtype"]), copy=True)
+
+        mask = np.empty((len(block), 0), dtype=bool)
+        for start, stop in self._chunks(block):
+            chunk = block[:, start:stop]
+            if mask.shape[1] != stop - start:
+                mask = np.empty(chunk.shape, dtype=bool, order="F")
+            np.isnan(chunk, out=mask)
+            np.copyto(chunk, fill[start:stop], where=mask)
+            np.clip(chunk, lower[start:stop], upper[start:stop], out=chunk)
+
+        cleaned = pd.DataFrame(block, index=frame.index, columns=columns, copy=False)
+        if len(columns) != frame.shape[1]:
+            rest = frame.drop(columns=columns)
+            cleaned = pd.concat([cleaned, rest], axis=1)[list(frame.columns)]
+        return data.to_stage(CleanedData, data=cleaned)
+
+    # ------------ Helpers ------------
+
+    def _config(
+        self,
+        columns: List[str],
+        dtype: np.dtype,
+        stats: Dict[str, np.ndarray],
+        unclipped: List[str],
+        state: ColumnStatistics,
+        sketches: Optional[QuantileSketches] = None,
+    ) -> CleaningConfig:
+        lower, upper = self._bounds(stats)
+        keep = np.array([c in unclipped for c in columns], dtype=bool)
+        lower[keep], upper[keep] = -np.inf, np.inf
+        fill = {"median": stats.get("q0.5"), "mean": stats["mean"]}.get(
+            self.impute, np.zeros(len(columns))
+        )
+        return CleaningConfig(
+            params={
+                "columns": columns,
+                "dtype": dtype.name,
+                "fill": np.nan_to_num(fill).astype(dtype),
+                "lower": lower.astype(dtype),
+                "upper": upper.astype(dtype),
+                "outliers": self.outliers,
+                "impute": self.impute,
+                "unclipped": unclipped,
+                "state": state.to_dict(),
+                "sketches": None if sketches is None else sketches.to_dict(),
+            }
+        )
+
+    @staticmethod
+    def _block(
+        frame: pd.DataFrame,
+        columns: List[str],
+        dtype: Optional[np.dtype] = None,
+        copy: bool = False,
+    ) -> np.ndarray:
+        if dtype is None:
+            narrow = all(fits_float32(frame[c].dtype) for c in columns)
+            dtype = np.dtype(np.float32 if columns and narrow else np.float64)
+        block = frame[columns].to_numpy(dtype=dtype, copy=copy)
+        return np.asfortranarray(block)  # column chunks are contiguous
+
+    def _chunks(self, block: np.ndarray):
+        width = max(1, self.chunk_bytes // max(1, len(block) * block.itemsize))
+        for start in range(0, block.shape[1], width):
+            yield start, min(start + width, block.shape[1])
+
+    def _statistics(
+        self, block: np.ndarray, sketches: Optional[QuantileSketches] = None
+    ) -> Dict[str, np.ndarray]:
+        rows, n_cols = block.shape
+        q = np.asarray(self.quantiles)
+        stats = {
+            name: np.full(n_cols, np.nan)
+            for name in ("nulls", "min", "max", "mean", "std", "m2")
+        }
+        stats.update({f"q{p:g}": np.full(n_cols, np.nan) for p in q})
+        stats["outliers"] = np.zeros(n_cols)
+        if not rows:
+            stats["nulls"][:] = 0
+            return stats
+
+        for start, stop in self._chunks(block):
+            part = slice(start, stop)
+            if sketches is None:
+                chunk = np.sort(block[:, part], axis=0)  # NaNs last
+            else:
+                chunk = block[:, part]
+                for j in range(start, stop):
+                    sketches.update_column(j, block[:, j])
+            valid = rows - np.count_nonzero(np.isnan(chunk), axis=0)
+            empty = valid == 0
+
+            total = np.where(np.isnan(chunk), 0.0, chunk).sum(axis=0, dtype=np.float64)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = total / valid
+                deviation = np.where(np.isnan(chunk), 0.0, chunk - mean)
+                m2 = (deviation**2).sum(axis=0, dtype=np.float64)
+                var = m2 / (valid - 1)
+
+            if sketches is None:
+                quantile = self._sorted_quantiles(chunk, valid, q)
+                low = chunk[0]
+                high = chunk[np.maximum(valid - 1, 0), np.arange(stop - start)]
+            else:
+                quantile = np.stack(
+                    [sketches.sketches[j].quantile(q) for j in range(start, stop)],
+                    axis=1,
+                )
+                low = np.nanmin(chunk, axis=0, initial=np.inf)
+                high = np.nanmax(chunk, axis=0, initial=-np.inf)
+
+            stats["nulls"][part] = rows - valid
+            stats["min"][part] = np.where(empty, np.nan, low)
+            stats["max"][part] = np.where(empty, np.nan, high)
+            stats["mean"][part] = np.where(empty, np.nan, mean)
+            stats["std"][part] = np.where(valid > 1, np.sqrt(var), np.nan)
+            stats["m2"][part] = m2
+            for name, values in self._quantile_stats(quantile).items():
+                stats[name][part] = np.where(empty, np.nan, values)
+
+            lower, upper = self._bounds({k: v[part] for k, v in stats.items()})
+            stats["outliers"][part] = np.count_nonzero(
+                chunk < lower, axis=0
+            ) + np.count_nonzero(chunk > upper, axis=0)
+        return stats
+
+    def _quantile_stats(self, quantile: np.ndarray) -> Dict[str, np.ndarray]:
+        return {f"q{p:g}": quantile[i] for i, p in enumerate(self.quantiles)}
+
+    @staticmethod
+    def _sorted_quantiles(
+        chunk: np.ndarray, valid: np.ndarray, q: np.ndarray
+    ) -> np.ndarray:
+        last = np.maximum(valid - 1, 0)[None, :]
+        position = q[:, None] * last
+        below = np.floor(position).astype(np.intp)
+        above = np.minimum(below + 1, last)
+        weight = position - below
+        low = np.take_along_axis(chunk, below, axis=0).astype(np.float64)
+        high = np.take_along_axis(chunk, above, axis=0).astype(np.float64)
+        return low + (high - low) * weight
+
+    def _bounds(self, stats: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        if self.outliers == "iqr":
+            iqr = stats["q0.75"] - stats["q0.25"]
+            lower = stats["q0.25"] - self.iqr_factor * iqr
+            upper = stats["q0.75"] + self.iqr_factor * iqr
+        elif self.outliers == "zscore":
+            lower = stats["mean"] - self.z_threshold * stats["std"]
+            upper = stats["mean"] + self.z_threshold * stats["std"]
+        else:
+            lower = np.full(len(stats["mean"]), -np.inf)
+            upper = np.full(len(stats["mean"]), np.inf)
+        # Undefined bounds (empty or single-value columns) do not clip.
+        return np.nan_to_num(lower, nan=-np.inf), np.nan_to_num(upper, nan=np.inf)
+
+    @staticmethod
+    def _issues(
+        columns: List[str], stats: Dict[str, np.ndarray], rows: int
+    ) -> Dict[str, Any]:
+        nulls = dict(zip(columns, stats["nulls"].astype(int).tolist()))
+        shown = {k: v for k, v in stats.items() if k not in ("m2", "count")}
+        table = pd.DataFrame(shown, index=pd.Index(columns, name="column"))
+        issues = {
+            "rows": rows,
+            "missing_rate": {c: n / rows for c, n in nulls.items() if n},
+            "statistics": table.to_dict(orient="index"),
+        }
+        if "outliers" in stats:
+            outliers = dict(zip(columns, stats["outliers"].astype(int).tolist()))
+            issues["outliers"] = {c: n for c, n in outliers.items() if n}
+        return issues
@@ -0,0 +1,11 @@
+from .correlation_mi_selector import (
+    CorrelationMISelector,
+    binned_mutual_information,
+    equal_frequency_codes,
+)
+
+__all__ = [
+    "CorrelationMISelector",
+    "binned_mutual_information",
+    "equal_frequency_codes",
+]
@@ -0,0 +1,274 @@
+# infra/strategies/i_feature_selector/correlation_mi_selector.py
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.config import YamlConfigProvider
+from domain.interfaces.strategies.i_feature_selector import (
+    IFeatureSelector,
+    SelectionConfig,
+    SelectionSummary,
+)
+from config.paths import DATASET_PARAMS_FILE
+
+
+def equal_frequency_codes(block: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Quantile-bin every column of a (rows, k) block into n_bins codes with one
+    argsort per column; ties fall into neighbouring bins by position.
+    """
+    rows = len(block)
+    order = np.argsort(block, axis=0, kind="stable")
+    codes = np.empty(block.shape, dtype=np.intp)
+    ranks = (np.arange(rows) * n_bins // max(rows, 1))[:, None]
+    np.put_along_axis(codes, order, np.broadcast_to(ranks, block.shape), axis=0)
+    return codes
+
+
+def binned_mutual_information(
+    codes: np.ndarray, target: np.ndarray, n_bins: int, bias_correction: bool = True
+) -> np.ndarray:
+    """
+    Mutual information (nats) between each binned column of codes (rows, k) and
+    a binned target (rows,), from one joint histogram of all k columns. The
+    plug-in estimate is biased upwards by about (n_bins - 1)^2 / 2n; with
+    bias_correction that term is subtracted (Miller-Madow) and the result floored
+    at 0, so independent features score near zero.
+    """
+    rows, k = codes.shape
+    cells = n_bins * n_bins
+    flat = codes * n_bins + target[:, None] + np.arange(k) * cells
+    joint = np.bincount(flat.ravel(), minlength=k * cells).reshape(k, n_bins, n_bins)
+    joint = joint / rows
+    px = joint.sum(axis=2, keepdims=True)
+    py = joint.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = joint * np.log(joint / (px * py))
+    mi = np.nansum(terms, axis=(1, 2))
+    if bias_correction:
+        mi = np.maximum(mi - (n_bins - 1) ** 2 / (2 * max(rows, 1)), 0.0)
+    return mi
+
+
+class CorrelationMISelector(IFeatureSelector):
+    """
+    Filter selector: relevance by mutual information with the targets, redundancy
+    by absolute Pearson correlation.
+
+    prepare standardizes the numeric features into one float32 matrix (NaNs
+    become the column mean, i.e. 0). Mutual information with every target is
+    estimated from equal-frequency bins, one joint histogram per feature block,
+    with blocks scored in parallel; a feature's relevance is its largest MI over
+    the targets. Features below min_mi are dropped.
+
+    The rest are ranked by relevance and screened greedily for redundancy in
+    blocks of block_size: each block's correlations with the features already
+    kept, and within itself, come from float32 matrix products X_b^T X / n, so
+    memory stays at block_size x features and the full pairwise matrix is never
+    built. A feature correlated above corr_threshold with a more relevant kept
+    one is dropped. max_features then caps the kept list.
+
+    SelectionConfig.details:
+        selected_columns: Kept features followed by the targets.
+        dropped: {column: reason} for every other column.
+        targets: Target columns (schema.targets, else dataset_params targets).
+        mutual_information: {feature: relevance} for the scored features.
+    """
+
+    def __init__(
+        self,
+        *,
+        corr_threshold: float = 0.95,
+        min_mi: float = 0.0,
+        max_features: Optional[int] = None,
+        n_bins: int = 16,
+        block_size: int = 512,
+        max_workers: Optional[int] = None,
+        targets: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.corr_threshold = corr_threshold
+        self.min_mi = min_mi
+        self.max_features = max_features
+        self.n_bins = n_bins
+        self.block_size = block_size
+        self.max_workers = max_workers
+        self.targets = list(targets) if targets is not None else None
+
+    # ------------ IFeatureSelector ------------
+
+    def prepare(self, data: CleanedData) -> SelectionSummary:
+        frame: pd.DataFrame = data.data
+        targets = self._targets(data, frame)
+        dropped: Dict[str, str] = {}
+        candidates = []
+        for column in frame.columns:
+            if column in targets:
+                continue
+            if pd.api.types.is_numeric_dtype(frame[column]):
+                candidates.append(column)
+            else:
+                dropped[column] = "non_numeric"
+
+        labelled = frame[targets].notna().all(axis=1).to_numpy()
+        matrix, std = self._standardize(frame.loc[labelled, candidates])
+        constant = std == 0
+        dropped.update({c: "constant" for c, flag in zip(candidates, constant) if flag})
+        features = [c for c, flag in zip(candidates, constant) if not flag]
+        matrix = np.ascontiguousarray(matrix[:, ~constant])
+
+        target_values = frame.loc[labelled, targets].to_numpy(np.float64)
+        relevance = self._relevance(matrix, target_values)
+        for column, mi in zip(features, relevance):
+            if mi < self.min_mi:
+                dropped[column] = f"low_mutual_information ({mi:.4f})"
+
+        ranked = [
+            i
+            for i in np.argsort(-relevance, kind="stable")
+            if relevance[i] >= self.min_mi
+        ]
+        kept, redundant = self._screen(matrix, ranked, features)
+        dropped.update(redundant)
+        if self.max_features is not None:
+            dropped.update(
+                {features[i]: "max_features" for i in kept[self.max_features :]}
+            )
+            kept = kept[: self.max_features]
+
+        selected = [features[i] for i in sorted(kept)]
+        config = SelectionConfig(
+            details={
+                "selected_columns": selected + targets,
+                "dropped": dropped,
+                "targets": targets,
+                "mutual_information": dict(zip(features, relevance.tolist())),
+            }
+        )
+        reasons = pd.Series(
+            [r.split(" ")[0] for r in dropped.values()], dtype=object
+        ).value_counts()
+        observations = {
+            "candidates": len(candidates),
+            "selected": len(selected),
+            "rows": int(labelled.sum()),
+            "dropped_by_reason": reasons.to_dict(),
+            "top_features": [features[i] for i in kept[:10]],
+        }
+        return SelectionSummary(config=config, observations=observations)
+
+    def select(self, data: CleanedData, config: SelectionConfig) -> SelectedData:
+        details = config.details or {}
+        columns = details.get("selected_columns")
+        if columns is None:
+            return data.to_stage(SelectedData)
+        targets = list(details.get("targets") or [])
+        features = [c for c in columns if c not in targets]
+        schema = data.schema
+        return data.to_stage(
+            SelectedData,
+            data=data.data[columns],
+            schema=DatasetSchema(
+                columns=features,
+                targets=targets or None,
+                feature_types=getattr(schema, "feature_types", None),
+                constraints=getattr(schema, "constraints", None),
+                description=getattr(schema, "description", None),
+                version=getattr(schema, "version", None),
+            ),
+        )
+
+    # ------------ Helpers ------------
+
+    def _targets(self, data: CleanedData, frame: pd.DataFrame) -> List[str]:
+        targets = self.targets
+        if targets is None and data.schema is not None and data.schema.targets:
+            targets = list(data.schema.targets)
+        if targets is None:
+            targets = list(YamlConfigProvider(DATASET_PARAMS_FILE).get("targets", []))
+        missing = [t for t in targets if t not in frame.columns]
+        if not targets or missing:
+            raise KeyError(
+                f"Target column(s) not found in the data: {missing or targets}"
+            )
+        return targets
+
+    @staticmethod
+    def _standardize(frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        matrix = frame.to_numpy(dtype=np.float32, copy=True)
+        with np.errstate(invalid="ignore"):
+            mean = (
+                np.nanmean(matrix, axis=0) if len(matrix) else np.zeros(matrix.shape[1])
+            )
+            np.subtract(matrix, mean, out=matrix)
+            np.nan_to_num(matrix, copy=False, nan=0.0)
+            std = np.sqrt(np.mean(matrix * matrix, axis=0, dtype=np.float64))
+        std = np.where(np.isfinite(std) & (std > 1e-12), std, 0.0)
+        np.divide(matrix, np.where(std > 0, std, 1.0).astype(np.float32), out=matrix)
+        return matrix, std
+
+    def _relevance(self, matrix: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        n_bins = self.n_bins
+        target_codes = equal_frequency_codes(targets, n_bins)
+        blocks = [
+            slice(start, min(start + self.block_size, matrix.shape[1]))
+            for start in range(0, matrix.shape[1], self.block_size)
+        ]
+
+        def score(block: slice) -> np.ndarray:
+            codes = equal_frequency_codes(matrix[:, block], n_bins)
+            return np.max(
+                [
+                    binned_mutual_information(codes, target_codes[:, t], n_bins)
+                    for t in range(target_codes.shape[1])
+                ],
+                axis=0,
+            )
+
+        if not blocks:
+            return np.zeros(0)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return np.concatenate(list(pool.map(score, blocks)))
+
+    def _screen(
+        self, matrix: np.ndarray, ranked: List[int], features: List[str]
+    ) -> Tuple[List[int], Dict[str, str]]:
+        rows = max(len(matrix), 1)
+        kept: List[int] = []
+        dropped: Dict[str, str] = {}
+        for start in range(0, len(ranked), self.block_size):
+            block = ranked[start : start + self.block_size]
+            candidates = matrix[:, block]
+            alive = np.ones(len(block), dtype=bool)
+            if kept:
+                against_kept = np.abs(candidates.T @ matrix[:, kept]) / rows
+                worst = against_kept.argmax(axis=1)
+                for j in np.flatnonzero(
+                    against_kept[np.arange(len(block)), worst] > self.corr_threshold
+                ):
+                    alive[j] = False
+                    dropped[features[block[j]]] = self._reason(
+                        features[kept[worst[j]]], against_kept[j, worst[j]]
+                    )
+            within = np.abs(candidates.T @ candidates) / rows
+            for j in range(len(block)):
+                if not alive[j]:
+                    continue
+                kept.append(block[j])
+                clash = np.flatnonzero(alive & (within[j] > self.corr_threshold))
+                for other in clash[clash > j]:
+                    alive[other] = False
+                    dropped[features[block[other]]] = self._reason(
+                        features[block[j]], within[j, other]
+                    )
+        return kept, dropped
+
+    @staticmethod
+    def _reason(kept: str, correlation: float) -> str:
+        return f"correlated ({correlation:.3f}) with {kept}"
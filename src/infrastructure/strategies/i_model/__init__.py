@@ -0,0 +1,25 @@
+from typing import Any
+
+from .compiled_predictor import (
+    ShapeBucketedPredictor,
+    benchmark_latency,
+    power_of_two_buckets,
+)
+
+__all__ = [
+    "KerasForecastModel",
+    "keras_defaults",
+    "ShapeBucketedPredictor",
+    "benchmark_latency",
+    "power_of_two_buckets",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # keras_forecast_model imports keras, which loads TensorFlow; defer it until
+    # the model is asked for.
+    if name in ("KerasForecastModel", "keras_defaults"):
+        from . import keras_forecast_model
+
+        return getattr(keras_forecast_model, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,147 @@
+# infra/strategies/i_model/compiled_predictor.py
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def power_of_two_buckets(max_batch: int) -> List[int]:
+    buckets, size = [], 1
+    while size < max_batch:
+        buckets.append(size)
+        size *= 2
+    return buckets + [max_batch]
+
+
+class ShapeBucketedPredictor:
+    """
+    Low-overhead forward pass for a Keras model on CPU.
+
+    Each batch-size bucket gets its own tf.function with a fixed input signature,
+    traced once (optionally XLA-compiled with jit_compile). A request is copied
+    into the preallocated, zero-padded input buffer of the smallest bucket that
+    fits and run through the compiled function; the valid rows of its output
+    array are returned as a view, with no further copy. Requests larger than the
+    biggest bucket run in bucket-sized chunks. Input buffers are guarded per
+    bucket, so concurrent callers on different buckets never wait on each other.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        buckets: Optional[Sequence[int]] = None,
+        max_batch: int = 1024,
+        xla: bool = False,
+    ) -> None:
+        import tensorflow as tf
+
+        self.model = model
+        self.input_shape: Tuple[int, ...] = tuple(model.input_shape[1:])
+        self.buckets = sorted(set(buckets or power_of_two_buckets(max_batch)))
+        self.xla = xla
+
+        self.output_shape: Tuple[int, ...] = tuple(model.output_shape[1:])
+        self._inputs = {
+            b: np.zeros((b, *self.input_shape), dtype=np.float32) for b in self.buckets
+        }
+        self._locks = {b: threading.Lock() for b in self.buckets}
+        self._functions: Dict[int, Any] = {}
+        self._tf = tf
+
+    def warmup(self, buckets: Optional[Iterable[int]] = None) -> None:
+        """
+        Trace (and compile) the given buckets, all by default, ahead of traffic.
+        """
+        for bucket in buckets or self.buckets:
+            with self._locks[bucket]:
+                self._function(bucket)(self._inputs[bucket])
+
+    @property
+    def traced_buckets(self) -> List[int]:
+        return sorted(self._functions)
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        batch = np.asarray(batch, dtype=np.float32)
+        if batch.shape[1:] != self.input_shape:
+            raise ValueError(
+                f"Expected rows of shape {self.input_shape}, got {batch.shape[1:]}"
+            )
+        largest = self.buckets[-1]
+        if len(batch) > largest:
+            return np.concatenate(
+                [self(batch[i : i + largest]) for i in range(0, len(batch), largest)]
+            )
+        if not len(batch):
+            return np.empty((0, *self.output_shape), dtype=np.float32)
+
+        bucket = self.buckets[np.searchsorted(self.buckets, len(batch))]
+        n = len(batch)
+        with self._locks[bucket]:
+            padded = self._inputs[bucket]
+            padded[:n] = batch
+            if n < bucket:
+                padded[n:] = 0.0
+            # Every call yields a fresh output array, so the slice aliases nothing.
+            return self._function(bucket)(padded).numpy()[:n]
+
+    def _function(self, bucket: int):
+        function = self._functions.get(bucket)
+        if function is None:
+            tf = self._tf
+            model = self.model
+            spec = tf.TensorSpec((bucket, *self.input_shape), tf.float32)
+
+            @tf.function(input_signature=[spec], jit_compile=self.xla)
+            def forward(x):
+                return model(x, training=False)
+
+            function = self._functions[bucket] = forward
+        return function
+
+
+def benchmark_latency(
+    model: Any,
+    batch_sizes: Sequence[int] = tuple(2**i for i in range(11)),
+    *,
+    repeats: int = 50,
+    xla: bool = True,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Median per-call latency (ms) of model.predict against the bucketed compiled
+    path (and its XLA variant when xla is set) for each batch size.
+    """
+    rng = np.random.default_rng(seed)
+    input_shape = tuple(model.input_shape[1:])
+    variants = {"compiled": ShapeBucketedPredictor(model, max_batch=max(batch_sizes))}
+    if xla:
+        variants["compiled_xla"] = ShapeBucketedPredictor(
+            model, max_batch=max(batch_sizes), xla=True
+        )
+
+    def median_ms(call, batch) -> float:
+        call(batch)  # warm: trace/compile outside the timing
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            call(batch)
+            timings.append(time.perf_counter() - started)
+        return float(np.median(timings) * 1e3)
+
+    rows = []
+    for size in batch_sizes:
+        batch = rng.normal(size=(size, *input_shape)).astype(np.float32)
+        row = {
+            "batch_size": size,
+            "predict_ms": median_ms(lambda b: model.predict(b, verbose=0), batch),
+        }
+        for name, predictor in variants.items():
+            row[f"{name}_ms"] = median_ms(predictor, batch)
+            row[f"{name}_speedup"] = row["predict_ms"] / row[f"{name}_ms"]
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("batch_size")
@@ -0,0 +1,352 @@
+# infra/strategies/i_model/keras_forecast_model.py
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.stages.model_output_data import ModelOutputData
+from src.domain.enums.problem_type import ProblemType
+from src.domain.interfaces.strategies.i_model import (
+    IModel,
+    TrainingConfig,
+    TrainingSummary,
+    PredictionConfig,
+    PredictionSummary,
+)
+from src.infrastructure.config import YamlConfigProvider
+from src.infrastructure.generators import (
+    ReplayBuffer,
+    SlidingWindowSequence,
+    feature_order,
+    target_indices,
+)
+from src.infrastructure.statistics import ReferenceProfile
+from src.infrastructure.strategies.i_model.compiled_predictor import (
+    ShapeBucketedPredictor,
+)
+from config.paths import DATASET_PARAMS_FILE, KERAS_PARAMS_FILE
+
+SUPPORTED = (ProblemType.FORECASTING, ProblemType.REGRESSION)
+
+
+def keras_defaults() -> Dict[str, Any]:
+    """
+    Training defaults from keras_params.yaml plus the window settings of
+    dataset_params.yaml (gererator.sequence_length / gererator.batch_size).
+    """
+    params = dict(YamlConfigProvider(KERAS_PARAMS_FILE).load() or {})
+    dataset = YamlConfigProvider(DATASET_PARAMS_FILE)
+    params.setdefault("sequence_length", dataset.get("gererator.sequence_length", 32))
+    params.setdefault("batch_size", dataset.get("gererator.batch_size", 8))
+    params.setdefault("units", 32)
+    params.setdefault("horizon", 1)
+    return params
+
+
+class KerasForecastModel(IModel):
+    """
+    Recurrent forecaster over sliding windows of a float32 ModelInputData matrix.
+
+    Windows come from SlidingWindowSequence; the last validation_len windows are
+    held out for validation. The network is LSTM(units) -> Dense(n_targets),
+    compiled with Adam(learning_rate, clipnorm) and a Huber(delta) loss, with
+    early stopping and learning-rate reduction from keras_params.yaml. Any keyword
+    passed to the constructor overrides the YAML value.
+
+    Predictions cover every complete window and are aligned with the window's last
+    row, i.e. with the tail of the input index. With compiled=True (and optionally
+    xla=True) predict() runs through a ShapeBucketedPredictor instead of
+    model.predict, which removes most of the per-call overhead on small batches.
+
+    After a full train(), update() fits only newly arrived rows for a few
+    warm epochs, mixed with a replay buffer of the most recent windows.
+
+    train() also keeps a ReferenceProfile of the training inputs (drift_bins
+    bins per feature), and prepare_prediction() reports the input drift of every
+    batch against it in diagnostics["drift"]: PSI and binned KS per feature and
+    the features over drift_psi or the KS critical value at drift_alpha.
+    """
+
+    def __init__(self, **overrides: Any) -> None:
+        self.overrides = overrides
+        self.model = None
+        self.history: Optional[Dict[str, list]] = None
+        self._initial_weights: Optional[list] = None
+        self._compiled: Optional[ShapeBucketedPredictor] = None
+        self._replay: Optional[ReplayBuffer] = None
+        self._baseline_loss = np.nan
+        self._updates = 0
+        self._rows_since_train = 0
+        self._profile: Optional[ReferenceProfile] = None
+        self._drift: Dict[str, float] = {}
+
+    # ------------ Training ------------
+
+    def prepare_training(
+        self, problem_type: ProblemType, data: ModelInputData
+    ) -> TrainingSummary:
+        if problem_type not in SUPPORTED:
+            raise ValueError(f"{type(self).__name__} does not support {problem_type}")
+        params = {**keras_defaults(), **self.overrides}
+        targets = target_indices(data)
+        if not targets:
+            raise ValueError("ModelInputData must declare schema.targets to train")
+
+        rows, features = np.shape(data.data)
+        windows = rows - params["sequence_length"] - params["horizon"] + 1
+        observations = {
+            "rows": rows,
+            "features": features,
+            "windows": windows,
+            "validation_windows": min(params["validation_len"], max(windows - 1, 0)),
+        }
+        if windows - observations["validation_windows"] < 1:
+            raise ValueError(f"Not enough rows ({rows}) to train: {observations}")
+        return TrainingSummary(
+            config=TrainingConfig(params={**params, "targets": targets}),
+            observations=observations,
+        )
+
+    def train(
+        self, problem_type: ProblemType, data: ModelInputData, config: TrainingConfig
+    ) -> None:
+        import keras
+
+        params = config.params
+        train_seq, val_seq = self._split(data, params)
+
+        self.model = self._build(train_seq.input_shape, len(params["targets"]), params)
+        self._compiled = None
+        if self._initial_weights is not None:
+            try:
+                self.model.set_weights(self._initial_weights)
+            except ValueError:
+                pass  # different architecture: train from scratch
+            self._initial_weights = None
+        callbacks = [
+            keras.callbacks.EarlyStopping(
+                monitor=params["monitor"],
+                mode=params["mode"],
+                patience=params["early_stop_patience"],
+                restore_best_weights=True,
+            ),
+            keras.callbacks.ReduceLROnPlateau(
+                monitor=params["monitor"],
+                mode=params["mode"],
+                patience=params["reduce_lr_patience"],
+                factor=params["reduce_lr_factor"],
+                min_lr=params["min_lr"],
+            ),
+        ]
+        report = params.get("epoch_callback")
+        if report is not None:
+            model = self.model
+
+            def on_epoch_end(epoch, logs):
+                if report(epoch, float(logs.get(params["monitor"], np.nan))):
+                    model.stop_training = True
+
+            callbacks.append(keras.callbacks.LambdaCallback(on_epoch_end=on_epoch_end))
+
+        history = self.model.fit(
+            train_seq,
+            validation_data=val_seq,
+            epochs=params["epochs"],
+            callbacks=callbacks,
+            verbose=0,
+        )
+        self.history = history.history
+        self._baseline_loss = float(np.min(self.history["loss"]))
+        self._updates = self._rows_since_train = 0
+        self._replay = ReplayBuffer(self._replay_rows(params), np.shape(data.data)[1])
+        self._replay.extend(data.data)
+        self._profile = ReferenceProfile.fit(
+            data.data,
+            feature_order(data),
+            n_bins=params["drift_bins"],
+            seed=params.get("seed"),
+        )
+        self._drift = {
+            "psi_threshold": params["drift_psi"],
+            "ks_alpha": params["drift_alpha"],
+        }
+
+    def update(self, data: ModelInputData, config: TrainingConfig) -> TrainingSummary:
+        """
+        Fit params["update_epochs"] epochs on the windows ending in the new rows
+        plus the replay buffer of the last params["replay_windows"] windows, which
+        also supplies the context the first new windows need. No validation split
+        and no callbacks: an update costs a few small epochs.
+
+        A full retrain is flagged as due after params["retrain_every"] updates, or
+        when the update loss exceeds params["retrain_loss_ratio"] times the best
+        training loss of the last full train().
+        """
+        if self.model is None or self._replay is None:
+            raise ValueError("Model must be fully trained before it can be updated")
+        params = config.params
+        new_rows = np.asarray(data.data, dtype=np.float32)
+        self._replay.extend(new_rows)
+        recent = data.to_stage(ModelInputData, data=self._replay.view())
+        try:
+            windows = SlidingWindowSequence(
+                recent,
+                params["sequence_length"],
+                params["batch_size"],
+                horizon=params["horizon"],
+                targets=params["targets"],
+                shuffle=True,
+                seed=params.get("seed"),
+            )
+        except ValueError as e:
+            raise ValueError(
+                f"Not enough rows ({len(self._replay)}) in the replay buffer "
+                f"to update: {e}"
+            ) from e
+        history = self.model.fit(windows, epochs=params["update_epochs"], verbose=0)
+        self._compiled = None
+
+        self._updates += 1
+        self._rows_since_train += len(new_rows)
+        loss = float(history.history["loss"][-1])
+        reasons = []
+        if self._updates >= params["retrain_every"]:
+            reasons.append("update_count")
+        if loss > params["retrain_loss_ratio"] * self._baseline_loss:
+            reasons.append("loss_drift")
+        return TrainingSummary(
+            config=config,
+            observations={
+                "rows": len(new_rows),
+                "windows": windows.n_windows,
+                "loss": loss,
+                "baseline_loss": self._baseline_loss,
+                "updates_since_retrain": self._updates,
+                "rows_since_retrain": self._rows_since_train,
+                "retrain_due": bool(reasons),
+                "retrain_reasons": reasons,
+            },
+        )
+
+    # ------------ Inference ------------
+
+    def prepare_prediction(self, data: ModelInputData) -> PredictionSummary:
+        if self.model is None:
+            raise ValueError("Model is not trained")
+        sequence_length, features = self.model.input_shape[1:]
+        rows = len(data.data)
+        mismatch = np.shape(data.data)[1] != features
+        diagnostics: Dict[str, Any] = {
+            "rows": rows,
+            "windows": max(rows - sequence_length + 1, 0),
+            "feature_mismatch": mismatch,
+        }
+        if self._profile is not None and not mismatch:
+            diagnostics["drift"] = self._profile.compare(data.data, **self._drift)
+        return PredictionSummary(
+            config=PredictionConfig(
+                params={
+                    "sequence_length": sequence_length,
+                    "batch_size": 256,
+                    "compiled": self.overrides.get("compiled", False),
+                    "xla": self.overrides.get("xla", False),
+                }
+            ),
+            diagnostics=diagnostics,
+        )
+
+    def predict(
+        self, data: ModelInputData, config: PredictionConfig
+    ) -> ModelOutputData:
+        windows = SlidingWindowSequence(
+            data,
+            config.params["sequence_length"],
+            config.params["batch_size"],
+            targets=[],
+            shuffle=False,
+        ).windows
+        if config.params.get("compiled"):
+            prediction = self.compiled_predictor(config.params.get("xla", False))(
+                windows
+            )
+        else:
+            prediction = self.model.predict(
+                windows, batch_size=config.params["batch_size"], verbose=0
+            )
+        return data.to_stage(ModelOutputData, data=prediction.astype(np.float32))
+
+    def compiled_predictor(self, xla: bool = False) -> ShapeBucketedPredictor:
+        """
+        The bucketed, traced forward pass of the trained network; built once and
+        reused until the next train().
+        """
+        if self.model is None:
+            raise ValueError("Model is not trained")
+        if self._compiled is None or self._compiled.xla != xla:
+            self._compiled = ShapeBucketedPredictor(
+                self.model, max_batch=self.overrides.get("max_batch", 1024), xla=xla
+            )
+        return self._compiled
+
+    def warm_start(self, previous: IModel) -> bool:
+        """
+        Start the next train() from the weights of a trained KerasForecastModel;
+        ignored at train time if the architectures differ.
+        """
+        if not isinstance(previous, KerasForecastModel) or previous.model is None:
+            return False
+        self._initial_weights = previous.model.get_weights()
+        return True
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _replay_rows(params: Dict[str, Any]) -> int:
+        return (
+            params["replay_windows"] + params["sequence_length"] + params["horizon"] - 1
+        )
+
+    @staticmethod
+    def _split(data: ModelInputData, params: Dict[str, Any]):
+        sequence_length, horizon = params["sequence_length"], params["horizon"]
+        rows = len(data.data)
+        windows = rows - sequence_length - horizon + 1
+        n_val = min(params["validation_len"], windows - 1)
+        boundary = windows - n_val  # first validation window start
+
+        def sequence(start: int, stop: int, shuffle: bool) -> SlidingWindowSequence:
+            part = data.to_stage(ModelInputData, data=data.data[start:stop])
+            return SlidingWindowSequence(
+                part,
+                sequence_length,
+                params["batch_size"],
+                horizon=horizon,
+                targets=params["targets"],
+                shuffle=shuffle,
+                seed=params.get("seed"),
+            )
+
+        train = sequence(0, boundary + sequence_length + horizon - 1, True)
+        val = sequence(boundary, rows, False) if n_val > 0 else None
+        return train, val
+
+    @staticmethod
+    def _build(input_shape, n_targets: int, params: Dict[str, Any]):
+        import keras
+
+        model = keras.Sequential(
+            [
+                keras.Input(shape=input_shape),
+                keras.layers.LSTM(params["units"]),
+                keras.layers.Dense(n_targets),
+            ]
+        )
+        model.compile(
+            optimizer=keras.optimizers.Adam(
+                learning_rate=params["learning_rate"], clipnorm=params["clipnorm"]
+            ),
+            loss=keras.losses.Huber(delta=params["delta"]),
+        )
+        return model
@@ -0,0 +1,3 @@
+from .vectorized_model_adapter import VectorizedModelAdapter
+
+__all__ = ["VectorizedModelAdapter"]
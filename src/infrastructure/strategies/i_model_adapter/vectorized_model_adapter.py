@@ -0,0 +1,362 @@
+# infra/strategies/i_model_adapter/vectorized_model_adapter.py
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.stages.model_output_data import ModelOutputData
+from src.domain.entities.stages.predicted_data import PredictedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.statistics import QuantileSketches
+from domain.interfaces.strategies.i_model_adapter import (
+    IModelAdapter,
+    TransformationConfig,
+    TransformationSummary,
+    InverseConfig,
+    InverseSummary,
+)
+
+SCALINGS = ("standard", "minmax", "robust", "none")
+
+
+class VectorizedModelAdapter(IModelAdapter):
+    """
+    Reference IModelAdapter producing a contiguous float32 matrix.
+
+    prepare_transform computes every column's statistics in one vectorized pass and
+    folds them into a per-column affine map x * scale + offset; categorical columns
+    are ordinal-encoded (unknown categories -> -1) and left unscaled. transform
+    copies the numeric columns, in the feature order of the TransformationConfig,
+    into one float32 buffer with a single bulk conversion (categorical columns are
+    encoded one by one with an index lookup) and applies the map with two
+    in-place ufuncs over the whole matrix. inverse_transform undoes the target
+    columns' map the same way.
+
+    The matrix column order is schema.columns followed by any target not among them
+    (see infrastructure.generators.feature_order). The targets' scale/offset and
+    the row index travel in ModelInputData.metadata so the inverse can be prepared
+    from the model output alone.
+
+    "robust" scaling centres on the median and divides by the interquartile
+    range, both read from per-column KLL sketches (sketch_k bounds the rank
+    error, seed fixes their sampling so equal data gives equal configs) kept in
+    the statistics, so it stays mergeable in update_transform.
+    """
+
+    def __init__(
+        self, scaling: str = "standard", sketch_k: int = 200, seed: int = 0
+    ) -> None:
+        if scaling not in SCALINGS:
+            raise ValueError(f"Unknown scaling '{scaling}'; expected one of {SCALINGS}")
+        self.scaling = scaling
+        self.sketch_k = sketch_k
+        self.seed = seed
+
+    # ------------ Forward ------------
+
+    def prepare_transform(self, data: SelectedData) -> TransformationSummary:
+        frame = self._frame(data)
+        columns, targets = self._columns(data, frame)
+        order = columns + [t for t in targets if t not in columns]
+
+        categorical = [c for c in order if not pd.api.types.is_numeric_dtype(frame[c])]
+        categories = {
+            c: pd.Index(frame[c].dropna().unique()).sort_values().tolist()
+            for c in categorical
+        }
+
+        numeric = [i for i, c in enumerate(order) if c not in categories]
+        stats = self._statistics(frame, [order[i] for i in numeric])
+        return self._summary(order, columns, targets, categories, numeric, stats)
+
+    def update_transform(
+        self,
+        config: TransformationConfig,
+        added: SelectedData,
+        removed: Optional[SelectedData] = None,
+    ) -> TransformationSummary:
+        """
+        Fold rows into (and, for rolling windows, out of) the statistics of a
+        prepared config without revisiting the rows already counted. Moments are
+        merged exactly (Chan et al.) and quantile sketches level by level; min/max
+        and sketches cannot be un-merged, so removing rows is only supported for
+        standard scaling. Category maps stay as prepared.
+        """
+        params = config.params
+        order, numeric = params["feature_order"], params["numeric"]
+        names = [order[i] for i in numeric]
+        stats = self._merge(params["statistics"], self._statistics(added.data, names))
+        if removed is not None:
+            if self.scaling in ("minmax", "robust"):
+                raise NotImplementedError(f"{self.scaling} statistics cannot drop rows")
+            stats = self._unmerge(stats, self._statistics(removed.data, names))
+        return self._summary(
+            order,
+            params["columns"],
+            params["targets"],
+            params["categories"],
+            numeric,
+            stats,
+        )
+
+    def transform(
+        self,
+        data: SelectedData,
+        config: TransformationConfig,
+        out: Optional[np.ndarray] = None,
+    ) -> ModelInputData:
+        """
+        Args:
+            data (SelectedData): DataFrame with (at least) the configured columns, or
+                                 an array already in the configured feature order.
+            config (TransformationConfig): Output of prepare_transform.
+            out (np.ndarray, optional): Caller-owned C-contiguous float32 buffer of
+                                        shape (rows, features), filled in place.
+
+        Returns:
+            ModelInputData: Float32 matrix with the feature order of the config.
+        """
+        params = config.params
+        order: List[str] = params["feature_order"]
+        payload = data.data
+
+        rows = len(payload)
+        matrix = self._buffer(out, rows, len(order))
+        if isinstance(payload, pd.DataFrame):
+            categories = params["categories"]
+            if not categories:
+                np.copyto(matrix, payload[order].to_numpy(np.float32), casting="unsafe")
+            else:
+                numeric = params["numeric"]
+                names = [order[i] for i in numeric]
+                matrix[:, numeric] = payload[names].to_numpy(np.float32)
+                for column, known in categories.items():
+                    # Unknown values (and NaN) map to -1.
+                    codes = pd.Index(known).get_indexer(payload[column])
+                    matrix[:, order.index(column)] = codes
+            index = payload.index
+        else:
+            np.copyto(matrix, np.asarray(payload), casting="unsafe")
+            index = None
+
+        np.multiply(matrix, params["scale"], out=matrix)
+        np.add(matrix, params["offset"], out=matrix)
+
+        target_idx = [order.index(t) for t in params["targets"]]
+        return data.to_stage(
+            ModelInputData,
+            data=matrix,
+            schema=DatasetSchema(
+                columns=list(params["columns"]),
+                targets=list(params["targets"]) or None,
+            ),
+            metadata={
+                **dict(data.metadata or {}),
+                "index": index,
+                "target_scaling": {
+                    "targets": list(params["targets"]),
+                    "scale": params["scale"][target_idx],
+                    "offset": params["offset"][target_idx],
+                },
+            },
+        )
+
+    # ------------ Inverse ------------
+
+    def prepare_inverse(self, output: ModelOutputData) -> InverseSummary:
+        scaling = (output.metadata or {}).get("target_scaling")
+        if scaling is None:
+            targets = list(getattr(output.schema, "targets", None) or [])
+            width = np.asarray(output.data).reshape(len(output.data), -1).shape[1]
+            targets = (
+                targets if len(targets) == width else [f"y{i}" for i in range(width)]
+            )
+            scale = np.ones(width, dtype=np.float32)
+            offset = np.zeros(width, dtype=np.float32)
+        else:
+            targets = list(scaling["targets"])
+            scale = np.asarray(scaling["scale"], dtype=np.float32)
+            offset = np.asarray(scaling["offset"], dtype=np.float32)
+
+        config = InverseConfig(
+            params={
+                "targets": targets,
+                "scale": (1.0 / scale).astype(np.float32),
+                "offset": (-offset / scale).astype(np.float32),
+            }
+        )
+        return InverseSummary(config=config, observations={"targets": targets})
+
+    def inverse_transform(
+        self,
+        data: ModelOutputData,
+        config: InverseConfig,
+        out: Optional[np.ndarray] = None,
+    ) -> PredictedData:
+        """
+        Rescale model output back to target units. Predictions are aligned with the
+        tail of the input index, which covers both row-wise and windowed models.
+        """
+        params = config.params
+        targets: List[str] = params["targets"]
+        values = np.asarray(data.data)
+        values = values.reshape(len(values), -1)
+
+        matrix = self._buffer(out, len(values), len(targets))
+        np.copyto(matrix, values, casting="unsafe")
+        np.multiply(matrix, params["scale"], out=matrix)
+        np.add(matrix, params["offset"], out=matrix)
+
+        index = (data.metadata or {}).get("index")
+        if index is not None and len(index) >= len(matrix):
+            index = index[len(index) - len(matrix) :]
+        else:
+            index = None
+        frame = pd.DataFrame(matrix, index=index, columns=targets, copy=False)
+        return data.to_stage(
+            PredictedData,
+            data=frame,
+            schema=DatasetSchema(columns=list(targets), targets=list(targets)),
+        )
+
+    # ------------ Helpers ------------
+
+    def _summary(
+        self, order, columns, targets, categories, numeric, stats
+    ) -> TransformationSummary:
+        scale = np.ones(len(order), dtype=np.float32)
+        offset = np.zeros(len(order), dtype=np.float32)
+        if numeric and self.scaling != "none":
+            if self.scaling == "standard":
+                center = stats["mean"]
+                spread = np.sqrt(stats["m2"] / np.maximum(stats["count"], 1))
+            elif self.scaling == "robust":
+                q25, center, q75 = QuantileSketches.from_dict(
+                    stats["sketches"]
+                ).quantiles([0.25, 0.5, 0.75])
+                spread = q75 - q25
+            else:
+                center = stats["min"]
+                spread = stats["max"] - center
+            spread = np.where(np.isfinite(spread) & (spread > 0), spread, 1.0)
+            center = np.nan_to_num(center)
+            scale[numeric] = 1.0 / spread
+            offset[numeric] = -center / spread
+
+        config = TransformationConfig(
+            params={
+                "feature_order": order,
+                "columns": columns,
+                "targets": targets,
+                "scale": scale,
+                "offset": offset,
+                "categories": categories,
+                "scaling": self.scaling,
+                "numeric": numeric,
+                "statistics": stats,
+            }
+        )
+        observations = {
+            "n_features": len(order),
+            "rows": int(stats["count"].max()) if numeric else 0,
+            "encoded": list(categories),
+            "constant": [
+                order[i] for i in numeric if scale[i] == 1.0 and offset[i] == 0.0
+            ],
+        }
+        return TransformationSummary(config=config, observations=observations)
+
+    def _statistics(
+        self, frame: pd.DataFrame, names: List[str]
+    ) -> Dict[str, np.ndarray]:
+        values = frame[names].to_numpy(dtype=np.float64)
+        count = np.count_nonzero(~np.isnan(values), axis=0).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(values, axis=0) / count
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        empty = count == 0
+        stats = {
+            "count": count,
+            "mean": np.where(empty, 0.0, mean),
+            "m2": m2,
+            "min": np.where(empty, np.nan, np.nanmin(values, axis=0, initial=np.inf)),
+            "max": np.where(empty, np.nan, np.nanmax(values, axis=0, initial=-np.inf)),
+        }
+        if self.scaling == "robust":
+            sketches = QuantileSketches(names, self.sketch_k, self.seed).update(values)
+            stats["sketches"] = sketches.to_dict()
+        return stats
+
+    @staticmethod
+    def _merge(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]):
+        count = a["count"] + b["count"]
+        safe = np.maximum(count, 1)
+        delta = b["mean"] - a["mean"]
+        merged = {
+            "count": count,
+            "mean": a["mean"] + delta * b["count"] / safe,
+            "m2": a["m2"] + b["m2"] + delta**2 * a["count"] * b["count"] / safe,
+            "min": np.fmin(a["min"], b["min"]),
+            "max": np.fmax(a["max"], b["max"]),
+        }
+        if "sketches" in a and "sketches" in b:
+            sketches = QuantileSketches.from_dict(a["sketches"])
+            merged["sketches"] = sketches.merge(
+                QuantileSketches.from_dict(b["sketches"])
+            ).to_dict()
+        return merged
+
+    @staticmethod
+    def _unmerge(ab: Dict[str, np.ndarray], b: Dict[str, np.ndarray]):
+        count = ab["count"] - b["count"]
+        safe = np.maximum(count, 1)
+        mean = (ab["count"] * ab["mean"] - b["count"] * b["mean"]) / safe
+        delta = b["mean"] - mean
+        m2 = (
+            ab["m2"]
+            - b["m2"]
+            - delta**2 * count * b["count"] / np.maximum(ab["count"], 1)
+        )
+        return {
+            "count": count,
+            "mean": np.where(count > 0, mean, 0.0),
+            "m2": np.maximum(m2, 0.0),
+            "min": np.full_like(mean, np.nan),  # unknown after removal
+            "max": np.full_like(mean, np.nan),
+        }
+
+    @staticmethod
+    def _frame(data: SelectedData) -> pd.DataFrame:
+        if not isinstance(data.data, pd.DataFrame):
+            raise TypeError(
+                f"{VectorizedModelAdapter.__name__}.prepare_transform expects a "
+                f"DataFrame, got {type(data.data).__name__}"
+            )
+        return data.data
+
+    @staticmethod
+    def _columns(data: SelectedData, frame: pd.DataFrame):
+        if data.schema is None:
+            return list(frame.columns), []
+        targets = [t for t in data.schema.targets or [] if t in frame.columns]
+        columns = [c for c in data.schema.columns if c in frame.columns]
+        return columns, targets
+
+    @staticmethod
+    def _buffer(out: Optional[np.ndarray], rows: int, width: int) -> np.ndarray:
+        if out is None:
+            return np.empty((rows, width), dtype=np.float32)
+        if (
+            out.shape != (rows, width)
+            or out.dtype != np.float32
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                f"out must be a C-contiguous float32 buffer of shape {(rows, width)}, "
+                f"got {out.dtype} {out.shape}"
+            )
+        return out
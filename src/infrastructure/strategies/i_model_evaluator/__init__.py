@@ -0,0 +1,3 @@
+from .streaming_evaluator import MetricState, StreamingEvaluator
+
+__all__ = ["MetricState", "StreamingEvaluator"]
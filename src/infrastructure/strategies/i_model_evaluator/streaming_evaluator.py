@@ -0,0 +1,190 @@
+# infra/strategies/i_model_evaluator/streaming_evaluator.py
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.predicted_data import PredictedData
+from src.domain.interfaces.strategies.i_model_evaluator import (
+    IModelEvaluator,
+    EvaluationConfig,
+    EvaluationSummary,
+)
+from src.infrastructure.statistics import (
+    Accumulator,
+    ConfusionCounts,
+    DirectionalAccuracy,
+    ErrorMetrics,
+    Moments,
+)
+
+
+class MetricState:
+    """
+    The accumulators of one evaluation. Built per shard, merged in shard order.
+    """
+
+    def __init__(self, task: str, labels: Optional[Sequence[Any]] = None) -> None:
+        self.targets: List[str] = []
+        self.accumulators: Dict[str, Accumulator] = (
+            {"confusion": ConfusionCounts(labels or [])}
+            if task == "classification"
+            else {
+                "errors": ErrorMetrics(),
+                "residuals": Moments(),
+                "direction": DirectionalAccuracy(),
+            }
+        )
+
+    def update(self, actual: Any, predicted: Any) -> MetricState:
+        for accumulator in self.accumulators.values():
+            accumulator.update(actual, predicted)
+        return self
+
+    def merge(self, other: MetricState) -> MetricState:
+        self.targets = self.targets or other.targets
+        for name, accumulator in self.accumulators.items():
+            accumulator.merge(other.accumulators[name])
+        return self
+
+
+class StreamingEvaluator(IModelEvaluator):
+    """
+    IModelEvaluator over online, mergeable accumulators.
+
+    Regression/forecasting: MAE, RMSE, bias, MAPE, residual mean/std/min/max
+    (Welford) and directional accuracy. Classification: confusion counts, accuracy
+    and macro precision/recall over config.details["labels"].
+
+    config.details:
+        targets: Predicted columns (default: schema.targets, else every column
+                 without the actual suffix).
+        actual_suffix: Suffix of the matching actual columns (default "_actual",
+                       the WalkForwardBacktest prediction layout).
+        task: "regression" (default) or "classification".
+        labels: Class labels, required for classification.
+
+    evaluate() handles one PredictedData; evaluate_stream() folds chunks one at a
+    time in constant memory; evaluate_shards() accumulates shards on worker
+    threads and merges the states in shard order.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers
+
+    # ------------ IModelEvaluator ------------
+
+    def evaluate(
+        self, data: PredictedData, config: EvaluationConfig
+    ) -> EvaluationSummary:
+        return self.evaluate_stream([data], config)
+
+    # ------------ Streaming ------------
+
+    def evaluate_stream(
+        self, chunks: Iterable[PredictedData], config: EvaluationConfig
+    ) -> EvaluationSummary:
+        return self.summarize(self.accumulate(chunks, config), config)
+
+    def evaluate_shards(
+        self, shards: Sequence[Iterable[PredictedData]], config: EvaluationConfig
+    ) -> EvaluationSummary:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            states = list(pool.map(lambda s: self.accumulate(s, config), shards))
+        return self.summarize(reduce(MetricState.merge, states), config)
+
+    def accumulate(
+        self, chunks: Iterable[PredictedData], config: EvaluationConfig
+    ) -> MetricState:
+        details = config.details or {}
+        state = MetricState(details.get("task", "regression"), details.get("labels"))
+        for chunk in chunks:
+            targets = self._resolve_targets(chunk, details)
+            suffix = details.get("actual_suffix", "_actual")
+            frame: pd.DataFrame = chunk.data
+            actual = frame[[f"{t}{suffix}" for t in targets]].to_numpy()
+            predicted = frame[targets].to_numpy()
+            state.update(actual, predicted)
+            state.targets = targets
+        return state
+
+    def summarize(
+        self, state: MetricState, config: EvaluationConfig
+    ) -> EvaluationSummary:
+        """
+        Turn merged accumulators into observations: pooled values plus a
+        per-target breakdown.
+        """
+        targets = state.targets
+        results: Dict[str, np.ndarray] = {}
+        for accumulator in state.accumulators.values():
+            results.update(accumulator.result())
+
+        per_target: Dict[str, Dict[str, Any]] = {}
+        for i, target in enumerate(targets):
+            per_target[target] = {
+                name: (value[i].tolist() if np.ndim(value[i]) else float(value[i]))
+                for name, value in results.items()
+            }
+        observations: Dict[str, Any] = {"targets": targets, "per_target": per_target}
+        observations.update(self._pooled(results))
+        return EvaluationSummary(config=config, observations=observations)
+
+    # ------------ Helpers ------------
+
+    @staticmethod
+    def _resolve_targets(chunk: PredictedData, details: Dict[str, Any]) -> List[str]:
+        if details.get("targets"):
+            return list(details["targets"])
+        suffix = details.get("actual_suffix", "_actual")
+        if chunk.schema is not None and chunk.schema.targets:
+            return list(chunk.schema.targets)
+        return [
+            c
+            for c in chunk.data.columns
+            if not str(c).endswith(suffix) and f"{c}{suffix}" in chunk.data.columns
+        ]
+
+    @staticmethod
+    def _pooled(results: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        if "n" in results:
+            n = results["n"]
+            weight = np.where(n > 0, n, 0)
+            total = weight.sum()
+            pooled = {"n": int(total)}
+            if total:
+                pooled["mae"] = float(np.nansum(results["mae"] * weight) / total)
+                pooled["rmse"] = float(
+                    np.sqrt(np.nansum(results["rmse"] ** 2 * weight) / total)
+                )
+                pooled["bias"] = float(np.nansum(results["bias"] * weight) / total)
+                # Weighted by each target's non-zero actuals, i.e. the pooled
+                # APE sum over the pooled count, as a single-target run would get.
+                n_ape = results["n_ape"]
+                pooled["mape"] = (
+                    float(np.nansum(results["mape"] * n_ape) / n_ape.sum())
+                    if n_ape.sum()
+                    else float("nan")
+                )
+            if "directional_accuracy" in results:
+                steps = results["steps"]
+                pooled["directional_accuracy"] = (
+                    float(
+                        np.nansum(results["directional_accuracy"] * steps) / steps.sum()
+                    )
+                    if steps.sum()
+                    else float("nan")
+                )
+            return pooled
+        if "confusion" in results:
+            confusion = results["confusion"].sum(axis=0)
+            return {
+                "n": int(confusion.sum()),
+                "accuracy": float(np.trace(confusion) / max(confusion.sum(), 1)),
+                "confusion": confusion.tolist(),
+            }
+        return {}
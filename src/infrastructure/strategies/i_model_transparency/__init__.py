@@ -0,0 +1,3 @@
+from .permutation_importance import PermutationImportance
+
+__all__ = ["PermutationImportance"]
@@ -0,0 +1,190 @@
+# infra/strategies/i_model_transparency/permutation_importance.py
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.stages.predicted_data import PredictedData
+from src.domain.interfaces.strategies.i_model import IModel
+from src.domain.interfaces.strategies.i_model_transparency import IModelTransparency
+from src.infrastructure.generators import feature_order
+
+
+class PermutationImportance(IModelTransparency):
+    """
+    Batched permutation feature importance.
+
+    The feature matrix is held once as a read-only float32 base. For every repeat,
+    a row subsample and a row permutation are drawn; each feature group is then
+    scored by replacing its columns with their permuted values. Instead of one
+    prediction pass per group, the permuted variants of many groups are stacked
+    into a single (groups x rows, features) batch of at most batch_rows rows and
+    predicted in one call. Chunks of groups run across worker threads, each
+    reusing its own stacking buffer.
+
+    The importance of a group is the increase in mean squared error against
+    metadata["y_true"] when given, otherwise the mean squared change of the
+    predictions. Repeats give a mean, a standard deviation and a percentile
+    confidence interval per group.
+
+    The model must map each matrix row to one prediction row: either an IModel
+    (predict on ModelInputData) or any object with predict(ndarray).
+    """
+
+    def __init__(
+        self,
+        *,
+        n_repeats: int = 5,
+        max_rows: Optional[int] = 2048,
+        batch_rows: int = 1 << 16,
+        max_workers: Optional[int] = None,
+        groups: Optional[Mapping[str, Sequence[str]]] = None,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.n_repeats = n_repeats
+        self.max_rows = max_rows
+        self.batch_rows = batch_rows
+        self.max_workers = max_workers
+        self.groups = dict(groups) if groups is not None else None
+        self.confidence = confidence
+        self.seed = seed
+
+    # ------------ IModelTransparency ------------
+
+    def feature_importances(self, model: Any, data: PredictedData) -> Dict[str, float]:
+        report = self.importance_report(model, data)
+        return report["importance"].to_dict()
+
+    def local_explanations(
+        self, model: Any, data: PredictedData
+    ) -> Union[Dict[int, Dict[str, float]], Any]:
+        raise NotImplementedError(
+            "Permutation importance is a global measure; use a local explainer."
+        )
+
+    # ------------ Report ------------
+
+    def importance_report(self, model: Any, data: PredictedData) -> pd.DataFrame:
+        """
+        Per-group importance: mean, std and confidence bounds over the repeats,
+        sorted by decreasing importance.
+        """
+        columns = feature_order(data) or [str(i) for i in range(np.shape(data.data)[1])]
+        base = np.ascontiguousarray(np.asarray(data.data), dtype=np.float32)
+        base.setflags(write=False)
+        groups = self._group_indices(columns)
+        y_true = (data.metadata or {}).get("y_true")
+        if y_true is not None:
+            y_true = np.asarray(y_true, dtype=np.float64).reshape(len(base), -1)
+        predict = self._predictor(model, data, base)
+
+        rng = np.random.default_rng(self.seed)
+        scores = np.empty((self.n_repeats, len(groups)), dtype=np.float64)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            buffers = threading.local()  # one stacking buffer per worker thread
+            for repeat in range(self.n_repeats):
+                rows = self._subsample(len(base), rng)
+                sample = base[rows]
+                permuted = sample[rng.permutation(len(sample))]
+                reference = predict(sample)
+                truth = None if y_true is None else y_true[rows]
+                scores[repeat] = self._score_groups(
+                    pool, buffers, predict, sample, permuted, groups, reference, truth
+                )
+
+        alpha = (1 - self.confidence) / 2
+        report = pd.DataFrame(
+            {
+                "importance": scores.mean(axis=0),
+                "std": scores.std(axis=0, ddof=1) if self.n_repeats > 1 else 0.0,
+                "ci_low": np.quantile(scores, alpha, axis=0),
+                "ci_high": np.quantile(scores, 1 - alpha, axis=0),
+            },
+            index=pd.Index(list(groups), name="feature"),
+        )
+        return report.sort_values("importance", ascending=False)
+
+    # ------------ Helpers ------------
+
+    def _score_groups(
+        self,
+        pool: ThreadPoolExecutor,
+        buffers: threading.local,
+        predict: Callable[[np.ndarray], np.ndarray],
+        sample: np.ndarray,
+        permuted: np.ndarray,
+        groups: Dict[str, np.ndarray],
+        reference: np.ndarray,
+        truth: Optional[np.ndarray],
+    ) -> np.ndarray:
+        n = len(sample)
+        per_batch = max(1, self.batch_rows // n)
+        names = list(groups)
+        chunks = [names[i : i + per_batch] for i in range(0, len(names), per_batch)]
+        baseline = 0.0 if truth is None else float(np.mean((reference - truth) ** 2))
+        target = reference if truth is None else truth
+
+        def run(chunk: List[str]) -> np.ndarray:
+            buffer = getattr(buffers, "buffer", None)
+            if buffer is None or buffer.shape != (per_batch * n, sample.shape[1]):
+                buffer = buffers.buffer = np.empty(
+                    (per_batch * n, sample.shape[1]), dtype=np.float32
+                )
+            stacked = buffer[: len(chunk) * n]
+            for k, name in enumerate(chunk):
+                block = stacked[k * n : (k + 1) * n]
+                block[:] = sample
+                cols = groups[name]
+                block[:, cols] = permuted[:, cols]
+            predictions = predict(stacked).reshape(len(chunk), n, -1)
+            errors = ((predictions - target[None]) ** 2).mean(axis=(1, 2))
+            return errors - baseline
+
+        return np.concatenate(list(pool.map(run, chunks)))
+
+    def _group_indices(self, columns: List[str]) -> Dict[str, np.ndarray]:
+        position = {c: i for i, c in enumerate(columns)}
+        if self.groups is None:
+            return {c: np.array([i]) for c, i in position.items()}
+        missing = {c for cols in self.groups.values() for c in cols} - set(position)
+        if missing:
+            raise KeyError(f"Unknown feature(s) in groups: {sorted(missing)}")
+        return {
+            name: np.array([position[c] for c in cols])
+            for name, cols in self.groups.items()
+        }
+
+    def _subsample(self, rows: int, rng: np.random.Generator) -> np.ndarray:
+        if self.max_rows is None or rows <= self.max_rows:
+            return np.arange(rows)
+        return np.sort(rng.choice(rows, size=self.max_rows, replace=False))
+
+    @staticmethod
+    def _predictor(
+        model: Any, data: PredictedData, base: np.ndarray
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        if isinstance(model, IModel):
+            template = ModelInputData(data=base, schema=data.schema)
+            config = model.prepare_prediction(template).config
+
+            def predict(matrix: np.ndarray) -> np.ndarray:
+                output = model.predict(
+                    template.to_stage(ModelInputData, data=matrix), config
+                )
+                values = np.asarray(output.data, dtype=np.float64)
+                return values.reshape(len(matrix), -1)
+
+            return predict
+
+        def predict(matrix: np.ndarray) -> np.ndarray:
+            return np.asarray(model.predict(matrix), dtype=np.float64).reshape(
+                len(matrix), -1
+            )
+
+        return predict
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.value_objects import DatasetSchema
+from src.domain.interfaces.repositories import IScanQuery
+from domain.interfaces.strategies.i_feature_selector import (
+    SelectionConfig,
+    SelectionSummary,
+)
+from src.application.bypasses.data_selector_bypass import DataSelectorBypass
+from src.application.orchestrators.enrichment_flow import EnrichmentFlow
+from src.application.orchestrators.lazy_enrichment_flow import LazyEnrichmentFlow
+from src.application.services.fingerprint import data_fingerprint
+from src.infrastructure.repositories.i_query.raw.csv_raw_store import CsvRawStore
+from src.infrastructure.repositories.stores import PreparedConfigStore
+from src.infrastructure.strategies import VectorizedCleaner
+
+COLUMNS = ["IndBovespa_Close", "IndBovespa_Volume", "BtcUsd_Close", "SELIC_valor"]
+TARGET = "IndBovespa_Close"
+
+
+class KeepTwoSelector(DataSelectorBypass):
+    def prepare(self, data):
+        keep = ["BtcUsd_Close", TARGET]
+        return SelectionSummary(
+            config=SelectionConfig(details={"selected_columns": keep}),
+            observations={},
+        )
+
+    def select(self, data, config=None):
+        selected = super().select(data, config)
+        keep = [c for c in data.data.columns if c in config.details["selected_columns"]]
+        return selected.to_stage(type(selected), data=data.data[keep])
+
+
+class RecordingSource(IScanQuery):
+    def __init__(self, frame):
+        self.frame = frame
+        self.calls = []
+
+    def get_by_id(self, ids):
+        return {"all": self.frame}
+
+    def list_all(self):
+        return list(self.frame.columns)
+
+    def scan(self, columns=None, start=None, end=None):
+        self.calls.append((columns, start, end))
+        frame = self.frame if columns is None else self.frame[list(columns)]
+        return {"all": frame.loc[start:end]}
+
+
+def make_frame():
+    index = pd.bdate_range("2024-01-01", periods=20)
+    values = np.arange(len(index) * len(COLUMNS), dtype="float64")
+    return pd.DataFrame(values.reshape(len(index), -1), index=index, columns=COLUMNS)
+
+
+def test_without_stored_configs_everything_is_loaded():
+    source = RecordingSource(make_frame())
+    lazy = LazyEnrichmentFlow([source], targets=[TARGET])
+    selected = lazy.execute()
+    assert source.calls[0][0] is None
+    assert list(selected.data.columns) == COLUMNS
+
+
+def test_stored_selection_config_projects_the_scan(tmp_path):
+    frame = make_frame()
+    store = PreparedConfigStore(tmp_path)
+    full = RawData(
+        data=frame,
+        schema=DatasetSchema(columns=COLUMNS[1:], targets=[TARGET]),
+    )
+    EnrichmentFlow(selector=KeepTwoSelector(), config_store=store).execute(full)
+
+    source = RecordingSource(frame)
+    flow = EnrichmentFlow(
+        selector=KeepTwoSelector(),
+        config_store=store,
+        config_key=data_fingerprint(full),
+    )
+    start = frame.index[5]
+    lazy = LazyEnrichmentFlow([source], flow, targets=[TARGET], start=start)
+
+    plan = lazy.plan()
+    assert plan.columns == ("BtcUsd_Close", TARGET)
+
+    selected = lazy.execute()
+    assert source.calls[-1][0] == ("BtcUsd_Close", TARGET)
+    assert selected.data.index[0] == start
+    pd.testing.assert_frame_equal(
+        selected.data, frame.loc[start:, ["BtcUsd_Close", "IndBovespa_Close"]]
+    )
+
+
+def test_vectorized_cleaner_runs_on_a_projected_scan(tmp_path):
+    frame = make_frame()
+    frame.iloc[3, 2] = np.nan  # BtcUsd_Close gap to impute
+    store = PreparedConfigStore(tmp_path)
+    full = RawData(
+        data=frame,
+        schema=DatasetSchema(columns=COLUMNS[1:], targets=[TARGET]),
+    )
+
+    def make_flow(**kwargs):
+        return EnrichmentFlow(
+            cleaner=VectorizedCleaner(),
+            selector=KeepTwoSelector(),
+            config_store=store,
+            **kwargs,
+        )
+
+    eager = make_flow().execute(full)
+    source = RecordingSource(frame)
+    lazy = LazyEnrichmentFlow(
+        [source], make_flow(config_key=data_fingerprint(full)), targets=[TARGET]
+    )
+    selected = lazy.execute()
+
+    assert source.calls[-1][0] == ("BtcUsd_Close", TARGET)
+    assert not selected.data.isna().any().any()
+    pd.testing.assert_frame_equal(selected.data, eager.data[selected.data.columns])
+
+
+def test_csv_store_pushes_columns_and_dates(tmp_path):
+    frame = make_frame()
+    path = tmp_path / "raw.csv"
+    frame.rename_axis("Date").to_csv(path)
+
+    store = CsvRawStore(path, chunksize=7)
+    assert store.list_all() == COLUMNS
+
+    result = store.scan(
+        columns=["SELIC_valor", "BtcUsd_Close"],
+        start=frame.index[3],
+        end=frame.index[10],
+    )["raw"]
+    assert list(result.columns) == ["SELIC_valor", "BtcUsd_Close"]
+    assert len(result) == 8
+    np.testing.assert_allclose(
+        result.to_numpy(), frame.iloc[3:11][["SELIC_valor", "BtcUsd_Close"]]
+    )
+
+    by_series = store.get_by_id(["IndBovespa"])["raw"]
+    assert list(by_series.columns) == ["IndBovespa_Close", "IndBovespa_Volume"]
@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.application.bypasses.data_cleaner_bypass import DataCleanerBypass
+from src.domain.entities.value_objects import DatasetSchema
+from src.application.orchestrators.enrichment_flow import EnrichmentFlow
+from src.application.orchestrators.partitioned_enrichment_flow import (
+    PartitionedEnrichmentFlow,
+)
+from src.application.orchestrators.partitioning import (
+    plan_partitions,
+    reassemble,
+    split,
+)
+from src.infrastructure.strategies import VectorizedCleaner
+
+
+class YearSelector:
+    """Would keep a different column in every year it is prepared on."""
+
+    def prepare(self, data):
+        year = data.data.index[0].year
+        return SimpleNamespace(config=year % len(data.data.columns))
+
+    def select(self, data, config=None):
+        return data.to_stage(SelectedData, data=data.data.iloc[:, [config]])
+
+
+def make_raw(dtype="float64"):
+    index = pd.bdate_range("2021-01-01", "2023-12-31")
+    rng = np.random.default_rng(0)
+    columns = [
+        "IndBovespa_Close",
+        "IndBovespa_Volume",
+        "BtcUsd_Close",
+        "SELIC_Anual_valor",
+    ]
+    frame = pd.DataFrame(
+        rng.normal(size=(len(index), len(columns))).astype(dtype),
+        index=index,
+        columns=columns,
+    )
+    schema = DatasetSchema(columns=columns[1:], targets=["IndBovespa_Close"])
+    return RawData(data=frame, schema=schema, lineage_id="run-1")
+
+
+def test_time_partitions_are_yearly_and_ordered():
+    raw = make_raw()
+    specs = plan_partitions(raw.data, by="time")
+    assert [s.label[:4] for s in specs] == ["2021", "2022", "2023"]
+    assert sum(s.rows.stop - s.rows.start for s in specs) == len(raw.data)
+
+
+def test_ticker_partitions_group_by_prefix():
+    raw = make_raw()
+    specs = plan_partitions(raw.data, by="ticker")
+    assert [s.label for s in specs] == ["IndBovespa", "BtcUsd", "SELIC_Anual"]
+    parts = split(raw, specs)
+    assert parts[2].partition_info == "ticker:2:SELIC_Anual"
+    assert parts[0].schema.targets == ["IndBovespa_Close"]
+
+
+def test_reassemble_restores_order():
+    raw = make_raw()
+    parts = split(raw, plan_partitions(raw.data, by="time"))
+    selected = reassemble(list(reversed(parts)), source=raw)
+    pd.testing.assert_frame_equal(selected.data, raw.data)
+
+
+def test_reassemble_rejects_time_parts_with_different_columns():
+    raw = make_raw()
+    parts = split(raw, plan_partitions(raw.data, by="time"))
+    parts[1] = parts[1].to_stage(RawData, data=parts[1].data.iloc[:, 1:])
+    with pytest.raises(ValueError, match="columns"):
+        reassemble(parts, source=raw)
+
+
+@pytest.mark.parametrize("partition_by", ["time", "ticker"])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_parallel_flow_matches_serial_flow(partition_by, dtype):
+    raw = make_raw(dtype)
+    expected = EnrichmentFlow().execute(raw)
+
+    flow = PartitionedEnrichmentFlow(partition_by=partition_by, max_workers=2)
+    selected = flow.execute(raw)
+
+    pd.testing.assert_frame_equal(selected.data[expected.data.columns], expected.data)
+    assert selected.schema.targets == ["IndBovespa_Close"]
+    assert selected.lineage_id == "run-1"
+    assert len(selected.metadata["partitions"]) > 1
+
+
+def test_mixed_dtypes_fall_back_to_pickling():
+    raw = make_raw()
+    frame = raw.data.assign(SELIC_Anual_valor=raw.data["SELIC_Anual_valor"].astype(str))
+    flow = PartitionedEnrichmentFlow(partition_by="ticker", max_workers=2)
+    selected = flow.execute(raw.to_stage(RawData, data=frame))
+    pd.testing.assert_frame_equal(selected.data, frame)
+
+
+def test_results_viewing_the_shared_block_survive_unmapping():
+    raw = make_raw()
+    # The bypass returns the partition it was given, i.e. a view of the block.
+    flow = PartitionedEnrichmentFlow(
+        flow=EnrichmentFlow(cleaner=DataCleanerBypass()), max_workers=2
+    )
+    selected = flow.execute(raw)
+    pd.testing.assert_frame_equal(selected.data, raw.data)
+
+
+def test_cleaning_statistics_come_from_the_whole_payload():
+    raw = make_raw()
+    frame = raw.data.copy()
+    frame.iloc[::7, 1] = np.nan  # gaps in every year, imputed with one fill value
+    raw = raw.to_stage(RawData, data=frame)
+    serial = EnrichmentFlow(cleaner=VectorizedCleaner()).execute(raw)
+
+    flow = PartitionedEnrichmentFlow(
+        flow=EnrichmentFlow(cleaner=VectorizedCleaner()), max_workers=2
+    )
+    selected = flow.execute(raw)
+
+    pd.testing.assert_frame_equal(selected.data, serial.data)
+    assert not selected.data.isna().any().any()
+
+
+def test_selection_is_prepared_once_on_the_reassembled_data():
+    raw = make_raw()
+    flow = PartitionedEnrichmentFlow(
+        flow=EnrichmentFlow(selector=YearSelector()), max_workers=2
+    )
+    selected = flow.execute(raw)
+    assert list(selected.data.columns) == ["IndBovespa_Volume"]  # 2021 % 4
+    assert len(selected.data) == len(raw.data)
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.enums.problem_type import ProblemType
+from src.application.bypasses.data_selector_bypass import DataSelectorBypass
+from src.application.bypasses.model_bypass import ModelBypass
+from src.application.orchestrators.pipeline import Pipeline
+from src.application.orchestrators.train_flow import TrainFlow
+from src.infrastructure.repositories.stores import CheckpointStore
+
+
+def make_raw(offset=0.0):
+    frame = pd.DataFrame({"a_x": [1.0, 2.0, 3.0], "b_x": [4.0, 5.0, 6.0]}) + offset
+    return RawData(data=frame, metadata={"source": "unit"}, lineage_id="run-7")
+
+
+class Recorder:
+    def __init__(self, fail_at=None):
+        self.calls = []
+        self.fail_at = fail_at
+
+    def stage(self, name):
+        def run(entity):
+            self.calls.append(name)
+            if name == self.fail_at:
+                raise RuntimeError(f"{name} failed")
+            return entity.to_stage(
+                CleanedData, data=entity.data + 1, metadata={"last": name}
+            )
+
+        return run
+
+
+class WindowSelector(DataSelectorBypass):
+    def __init__(self, window=5):
+        self.window = window
+
+
+def build(store, recorder, selector=None):
+    pipeline = Pipeline(checkpoint_store=store)
+    for name in ["clean", "select", "adapt"]:
+        strategy = selector if name == "select" else None
+        pipeline.add_stage(recorder.stage(name), name=name, strategy=strategy)
+    return pipeline
+
+
+def test_restart_resumes_after_last_completed_stage(tmp_path):
+    store = CheckpointStore(tmp_path)
+    failing = Recorder(fail_at="adapt")
+    with pytest.raises(RuntimeError):
+        build(store, failing).run(make_raw())
+    assert failing.calls == ["clean", "select", "adapt"]
+
+    retry = Recorder()
+    pipeline = build(store, retry)
+    result = pipeline.run(make_raw())
+    assert retry.calls == ["adapt"]
+    assert pipeline.resumed_from == "select"
+    assert result.metadata["last"] == "adapt"
+    assert result.lineage_id == "run-7"
+    assert (result.data == make_raw().data + 3).all().all()
+
+
+def test_checkpoints_are_not_reused_for_other_inputs(tmp_path):
+    store = CheckpointStore(tmp_path)
+    build(store, Recorder()).run(make_raw())
+
+    other = Recorder()
+    build(store, other).run(make_raw(offset=10.0))
+    assert other.calls == ["clean", "select", "adapt"]
+
+
+def test_changed_strategy_params_invalidate_later_checkpoints(tmp_path):
+    store = CheckpointStore(tmp_path)
+    build(store, Recorder(), WindowSelector(window=5)).run(make_raw())
+
+    same = Recorder()
+    build(store, same, WindowSelector(window=5)).run(make_raw())
+    assert same.calls == []
+
+    changed = Recorder()
+    build(store, changed, WindowSelector(window=10)).run(make_raw())
+    assert changed.calls == ["select", "adapt"]
+
+
+def test_checkpoint_keeps_entity_fields(tmp_path):
+    store = CheckpointStore(tmp_path)
+    build(store, Recorder()).run(make_raw())
+    assert store.list_all() == ["run-7/00-clean", "run-7/01-select", "run-7/02-adapt"]
+
+    restored = store.get_by_id(["run-7/00-clean"])["run-7/00-clean"]
+    assert isinstance(restored, CleanedData)
+    assert restored.metadata["last"] == "clean"
+    assert restored.lineage_id == "run-7"
+
+
+def test_train_flow_resumes_at_model_stage(tmp_path):
+    class FlakyModel(ModelBypass):
+        attempts = 0
+
+        def train(self, problem_type, data, config=None):
+            FlakyModel.attempts += 1
+            if FlakyModel.attempts == 1:
+                raise RuntimeError("out of memory")
+
+    store = CheckpointStore(tmp_path)
+    flow = TrainFlow(model=FlakyModel(), checkpoint_store=store)
+    with pytest.raises(RuntimeError):
+        flow.execute(ProblemType.FORECASTING, make_raw())
+
+    flow.execute(ProblemType.FORECASTING, make_raw())
+    assert FlakyModel.attempts == 2
+    assert len(store.list_all()) == 3
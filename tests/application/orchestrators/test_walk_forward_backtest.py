@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.stages.model_output_data import ModelOutputData
+from src.domain.entities.value_objects import DatasetSchema
+from src.domain.interfaces.strategies.i_model import (
+    IModel,
+    PredictionConfig,
+    PredictionSummary,
+    TrainingConfig,
+    TrainingSummary,
+)
+from src.application.orchestrators import WalkForwardBacktest, plan_folds
+from src.infrastructure.strategies import VectorizedModelAdapter
+
+
+class LeastSquares(IModel):
+    """One-step-ahead linear model on the non-target columns; records warm starts."""
+
+    def __init__(self):
+        self.coef = None
+        self.warm_from = None
+
+    def prepare_training(self, problem_type, data):
+        return TrainingSummary(TrainingConfig(params={}), {})
+
+    def train(self, problem_type, data, config):
+        x, y = data.data[:, :-1], data.data[:, -1]
+        x = np.column_stack([x, np.ones(len(x))])
+        self.coef = np.linalg.lstsq(x[:-1], y[1:], rcond=None)[0]
+
+    def prepare_prediction(self, data):
+        return PredictionSummary(PredictionConfig(params={}), {})
+
+    def predict(self, data, config):
+        x = np.column_stack([data.data[:, :-1], np.ones(len(data.data))])
+        return data.to_stage(ModelOutputData, data=(x @ self.coef)[:, None])
+
+
+class WarmLeastSquares(LeastSquares):
+    def warm_start(self, previous):
+        self.warm_from = previous
+        return True
+
+
+class ShortLeastSquares(LeastSquares):
+    def predict(self, data, config):
+        output = super().predict(data, config)
+        return output.to_stage(ModelOutputData, data=output.data[:5])
+
+
+def make_selected(rows=120):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(rows, 2))
+    y = np.r_[10.0, 3 * x[:-1, 0] - 2 * x[:-1, 1] + 10]  # next-day relation
+    frame = pd.DataFrame(
+        {"a": x[:, 0], "b": x[:, 1], "y": y},
+        index=pd.date_range("2020-01-01", periods=rows, freq="D"),
+    )
+    return SelectedData(data=frame, schema=DatasetSchema(["a", "b"], targets=["y"]))
+
+
+def test_plan_folds_expanding_and_rolling():
+    expanding = plan_folds(100, initial_train=40, step=25)
+    assert [(f.train_start, f.train_end, f.test_end) for f in expanding] == [
+        (0, 40, 65),
+        (0, 65, 90),
+        (0, 90, 100),
+    ]
+    rolling = plan_folds(100, initial_train=40, step=25, window="rolling")
+    assert [(f.train_start, f.train_end) for f in rolling] == [
+        (0, 40),
+        (25, 65),
+        (50, 90),
+    ]
+
+
+@pytest.mark.parametrize("window", ["expanding", "rolling"])
+def test_parallel_folds_recover_exact_relation(window):
+    backtest = WalkForwardBacktest(
+        VectorizedModelAdapter(),
+        LeastSquares,
+        initial_train=60,
+        step=20,
+        window=window,
+        max_workers=3,
+    )
+    result = backtest.execute(make_selected())
+
+    metrics = result.metrics()
+    assert list(metrics.index) == [0, 1, 2]
+    assert (metrics["mae"] < 1e-4).all()
+    assert not metrics["warm_started"].any()
+
+    predictions = result.predictions()
+    assert len(predictions) == 60
+    np.testing.assert_allclose(predictions["y"], predictions["y_actual"], atol=1e-4)
+
+
+def test_warm_start_chains_folds_in_order():
+    backtest = WalkForwardBacktest(
+        VectorizedModelAdapter(), WarmLeastSquares, initial_train=60, step=20
+    )
+    metrics = backtest.execute(make_selected()).metrics()
+    assert list(metrics["warm_started"]) == [False, True, True]
+
+
+def test_warm_start_probe_builds_no_extra_model():
+    built = []
+
+    def factory():
+        built.append(WarmLeastSquares())
+        return built[-1]
+
+    backtest = WalkForwardBacktest(
+        VectorizedModelAdapter(), factory, initial_train=60, step=20
+    )
+    backtest.execute(make_selected())
+    assert len(built) == 3
+    assert built[1].warm_from is built[0]
+
+
+def test_horizon_must_be_positive():
+    with pytest.raises(ValueError, match="horizon"):
+        WalkForwardBacktest(
+            VectorizedModelAdapter(), LeastSquares, initial_train=60, step=20, horizon=0
+        )
+
+
+def test_short_model_output_is_an_error():
+    backtest = WalkForwardBacktest(
+        VectorizedModelAdapter(), ShortLeastSquares, initial_train=60, step=20
+    )
+    with pytest.raises(ValueError, match="returned 5 rows for 20 test rows"):
+        backtest.execute(make_selected())
+
+
+def test_incremental_adapter_stats_match_full_prepare():
+    adapter = VectorizedModelAdapter()
+    data = make_selected()
+    head = data.to_stage(SelectedData, data=data.data.iloc[:60])
+    added = data.to_stage(SelectedData, data=data.data.iloc[60:90])
+    removed = data.to_stage(SelectedData, data=data.data.iloc[:30])
+
+    updated = adapter.update_transform(
+        adapter.prepare_transform(head).config, added, removed
+    ).config
+    full = adapter.prepare_transform(
+        data.to_stage(SelectedData, data=data.data.iloc[30:90])
+    ).config
+    np.testing.assert_allclose(updated.params["scale"], full.params["scale"], rtol=1e-6)
+    np.testing.assert_allclose(
+        updated.params["offset"], full.params["offset"], rtol=1e-5, atol=1e-6
+    )
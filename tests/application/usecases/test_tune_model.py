@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.enums.problem_type import ProblemType
+from src.domain.interfaces.strategies.i_model import (
+    IModel,
+    TrainingConfig,
+    TrainingSummary,
+)
+from src.application.usecases.tune_model import MedianPruner, TuneModel, sample_params
+
+
+class QuadraticModel(IModel):
+    """Validation loss falls with epochs and is lowest at learning_rate=1e-3."""
+
+    def __init__(self, learning_rate: float, **_):
+        self.learning_rate = learning_rate
+
+    def prepare_training(self, problem_type, data):
+        return TrainingSummary(TrainingConfig(params={"epochs": 12}), {})
+
+    def train(self, problem_type, data, config):
+        report = config.params["epoch_callback"]
+        gap = (math.log10(self.learning_rate) + 3) ** 2
+        for epoch in range(config.params["epochs"]):
+            if report(epoch, gap + 1 / (epoch + 1)):
+                return
+
+    def prepare_prediction(self, data):
+        raise NotImplementedError
+
+    def predict(self, data, config):
+        raise NotImplementedError
+
+
+def test_median_pruner_stops_trials_worse_than_peers():
+    pruner = MedianPruner(n_startup_trials=2, n_warmup_epochs=1)
+    for trial, loss in enumerate([1.0, 2.0, 3.0]):
+        pruner.report(trial, 0, loss)
+        pruner.report(trial, 1, loss)
+    assert not pruner.report(3, 0, 10.0)  # still warming up
+    assert pruner.report(3, 1, 10.0)
+    assert not pruner.report(4, 0, 0.5) and not pruner.report(4, 1, 0.5)
+
+
+def test_sample_params_respects_space():
+    rng = np.random.default_rng(0)
+    space = {"lr": (1e-4, 1e-2, "log"), "units": [16, 32], "patience": (2, 4)}
+    for _ in range(50):
+        params = sample_params(space, rng)
+        assert 1e-4 <= params["lr"] <= 1e-2
+        assert params["units"] in (16, 32) and 2 <= params["patience"] <= 4
+
+
+def test_parallel_search_prunes_and_logs_trials(tmp_path, monkeypatch):
+    mlflow = pytest.importorskip("mlflow")
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    tuner = TuneModel(
+        QuadraticModel,
+        {"learning_rate": (1e-5, 1e-1, "log")},
+        n_trials=12,
+        max_workers=3,
+        n_startup_trials=2,
+        n_warmup_epochs=2,
+        seed=7,
+        experiment_name="tune-test",
+        tracking_uri=(tmp_path / "mlruns").as_uri(),
+    )
+    data = ModelInputData(data=np.zeros((4, 2), dtype=np.float32))
+    summary = tuner.execute(ProblemType.FORECASTING, data)
+
+    assert len(summary.trials) == 12
+    assert any(t.pruned for t in summary.trials)
+    assert all(t.epochs < 12 for t in summary.trials if t.pruned)
+    assert summary.best.best_val_loss == min(t.best_val_loss for t in summary.trials)
+
+    mlflow.set_tracking_uri(tuner.tracking_uri)
+    runs = mlflow.search_runs(experiment_names=["tune-test"])
+    assert len(runs) == 12
@@ -85,3 +85,14 @@ def test_missing_rate_metrics_calculated():
     assert status.details["missing_rate"]["a"] == pytest.approx(1 / 3)
     assert status.details["missing_rate"]["b"] == pytest.approx(2 / 3)
     assert "High missing rate" in status.warnings[0]
+
+
+def test_entity_round_trips_through_pickle():
+    import pickle
+
+    entity = BaseDataEntity(data=[{"a": 1}], metadata={"k": "v"}, lineage_id="x")
+    restored = pickle.loads(pickle.dumps(entity))
+    assert restored.metadata["k"] == "v"
+    assert restored.lineage_id == "x"
+    with pytest.raises(TypeError):
+        restored.metadata["k"] = "w"  # still read-only
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from src.infrastructure.calendars import business_days, calendar_between
+
+
+def test_b3_calendar_skips_weekends_and_holidays_and_is_cached():
+    days = business_days("B3", 2024, 2024)
+    assert days is business_days("B3", 2024, 2024)
+    assert (days.dayofweek < 5).all()
+    assert pd.Timestamp("2024-02-12") not in days  # Carnival
+    assert pd.Timestamp("2024-07-04") in days
+    assert pd.Timestamp("2024-07-04") not in business_days("NYSE", 2024, 2024)
+
+
+def test_calendar_between_slices_inclusive_range():
+    days = calendar_between("NYSE", "2024-01-02 15:30", "2024-01-05")
+    assert list(days.day) == [2, 3, 4, 5]  # the start day counts whatever its time
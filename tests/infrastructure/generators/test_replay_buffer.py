@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.generators import ReplayBuffer
+
+
+def test_keeps_most_recent_rows_in_order_across_compactions():
+    buffer = ReplayBuffer(capacity=5, features=2)
+    rows = np.arange(40, dtype=np.float32).reshape(20, 2)
+    for start in range(0, 20, 3):
+        buffer.extend(rows[start : start + 3])
+        stop = min(start + 3, 20)
+        np.testing.assert_array_equal(buffer.view(), rows[max(0, stop - 5) : stop])
+    assert len(buffer) == 5
+    assert not buffer.view().flags.writeable
+
+
+def test_oversized_extend_keeps_tail_and_checks_width():
+    buffer = ReplayBuffer(capacity=3, features=1)
+    buffer.extend(np.arange(10).reshape(-1, 1))
+    np.testing.assert_array_equal(buffer.view().ravel(), [7, 8, 9])
+    with pytest.raises(ValueError):
+        buffer.extend(np.zeros((2, 2)))
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.generators import (
+    SlidingWindowSequence,
+    feature_order,
+    target_indices,
+)
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def make_input(rows=100, features=3):
+    data = np.arange(rows * features, dtype=np.float32).reshape(rows, features)
+    schema = DatasetSchema(columns=["a", "b", "c"], targets=["a"])
+    return ModelInputData(data=data, schema=schema)
+
+
+def test_windows_are_views_over_one_buffer():
+    seq = SlidingWindowSequence(make_input(), sequence_length=32, batch_size=8)
+    assert seq.windows.shape == (100 - 32 - 1 + 1, 32, 3)
+    assert np.shares_memory(seq.windows, seq.buffer)
+    assert seq.windows.base is not None and not seq.windows.flags.writeable
+
+
+def test_batches_have_expected_shape_and_labels():
+    data = make_input()
+    seq = SlidingWindowSequence(data, sequence_length=4, batch_size=5, shuffle=False)
+    x, y = seq[0]
+    assert x.shape == (5, 4, 3) and x.dtype == np.float32
+    np.testing.assert_array_equal(x[2], data.data[2:6])
+    # label is the target one step after the window end
+    np.testing.assert_array_equal(y[:, 0], data.data[4:9, 0])
+
+
+def test_shuffle_permutes_indices_not_data():
+    data = make_input()
+    seq = SlidingWindowSequence(data, sequence_length=4, batch_size=200, seed=1)
+    before = seq.buffer.copy()
+    x, _ = seq[0]
+    seq.on_epoch_end()
+    np.testing.assert_array_equal(seq.buffer, before)
+    starts = x[:, 0, 0] / 3
+    assert sorted(starts) == list(range(seq.n_windows))
+    assert list(starts) != sorted(starts)
+
+
+def test_inference_windows_without_targets():
+    data = make_input()
+    seq = SlidingWindowSequence(
+        data, sequence_length=10, batch_size=16, targets=[], shuffle=False
+    )
+    assert seq.n_windows == 91
+    assert seq[len(seq) - 1].shape == (91 - 16 * 5, 10, 3)
+
+
+def test_too_short_input_is_rejected():
+    with pytest.raises(ValueError):
+        SlidingWindowSequence(make_input(rows=5), sequence_length=32)
+
+
+def test_feature_layout_matches_the_window_labels():
+    data = make_input()
+    assert feature_order(data) == ["a", "b", "c"]
+    assert SlidingWindowSequence(data, 4, 2).targets == target_indices(data) == [0]
+
+
+def test_feature_layout_does_not_import_keras():
+    code = (
+        "import sys\n"
+        "from src.infrastructure.generators import feature_order\n"
+        "assert 'keras' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)])}
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.infrastructure.repositories.stores import PointInTimeFeatureStore
+
+
+def brute_force(records, t):
+    known = records[records["available_time"] <= t]
+    if known.empty:
+        return np.nan
+    best = known.sort_values(["observation_time", "available_time"]).iloc[-1]
+    return best["value"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PointInTimeFeatureStore(tmp_path)
+    # Monthly IPCA, published ten days after the reference month...
+    months = pd.date_range("2024-01-31", periods=6, freq="ME")
+    ipca = pd.Series([0.42, 0.83, 0.16, 0.38, 0.46, 0.21], index=months)
+    store.write("IPCA_valor", ipca, release_lag=pd.Timedelta(days=10))
+    # ...and February revised in mid-April.
+    store.write(
+        "IPCA_valor",
+        pd.Series([0.80], index=[months[1]]),
+        available=[pd.Timestamp("2024-04-15")],
+    )
+    days = pd.bdate_range("2024-01-01", "2024-06-30")
+    bvsp = pd.Series(np.arange(len(days), dtype=float), index=days)
+    store.write("^BVSP", bvsp)
+    return store
+
+
+def test_materializes_point_in_time_values(store):
+    times = pd.date_range("2024-01-01", "2024-07-20", freq="D")
+    raw = store.materialize(times, ["^BVSP", "IPCA_valor"], targets=["^BVSP"])
+
+    assert isinstance(raw, RawData)
+    assert raw.schema.columns == ["IPCA_valor"] and raw.schema.targets == ["^BVSP"]
+    assert raw.data.dtypes.eq(np.float32).all()
+    for series in ("IPCA_valor", "^BVSP"):
+        records = store.get_by_id([series])[series]
+        expected = [brute_force(records, t) for t in times]
+        np.testing.assert_allclose(
+            raw.data[series], np.float32(expected), equal_nan=True
+        )
+
+    ipca = raw.data["IPCA_valor"]
+    assert np.isnan(ipca.loc["2024-02-09"])  # January not released yet
+    assert ipca.loc["2024-03-12"] == np.float32(0.83)  # first print of February
+    # The revision never leaks backwards, and a later month wins once released.
+    assert ipca.loc["2024-04-09"] == np.float32(0.83)
+    assert ipca.loc["2024-04-16"] == np.float32(0.16)
+    observed = raw.metadata["observation_time"]["IPCA_valor"]
+    assert observed.loc["2024-04-16"] == pd.Timestamp("2024-03-31")
+    assert raw.observation_time == pd.Timestamp("2024-07-20")
+
+
+def test_revisions_persist_and_reload(store, tmp_path):
+    reopened = PointInTimeFeatureStore(tmp_path)
+    assert reopened.list_all() == ["IPCA_valor", "^BVSP"]
+    february = pd.Timestamp("2024-02-29")
+
+    history = reopened.get_by_id(["IPCA_valor"])["IPCA_valor"]
+    assert len(history) == 7
+    assert sorted(history.loc[history.observation_time == february, "value"]) == [
+        0.80,
+        0.83,
+    ]
+    # Before March data is out, February is the latest: first print, then revision.
+    reopened.delete("IPCA_valor")
+    reopened.write(
+        "IPCA_valor", history[history.observation_time <= february].reset_index()
+    )
+    values = reopened.as_of("IPCA_valor", ["2024-03-20", "2024-04-20"])
+    assert values.tolist() == [0.83, 0.80]
+    with pytest.raises(KeyError):
+        store.as_of("^BVSP_missing", ["2024-03-20"])
+
+
+def test_max_age_and_validation(store):
+    raw = store.materialize(
+        pd.to_datetime(["2024-07-01", "2024-07-30"]),
+        ["^BVSP"],
+        max_age=pd.Timedelta(days=7),
+    )
+    assert not np.isnan(raw.data["^BVSP"].iloc[0])
+    assert np.isnan(raw.data["^BVSP"].iloc[1])
+    assert pd.isna(raw.metadata["observation_time"]["^BVSP"].iloc[1])
+
+    with pytest.raises(ValueError):
+        store.write(
+            "bad",
+            pd.Series([1.0], index=[pd.Timestamp("2024-01-02")]),
+            available=["2024-01-01"],
+        )
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.repositories.stores import ModelRef, ModelRegistry
+
+
+def populate(root, names=("close_h1", "close_h5"), versions=("1", "2", "10")):
+    registry = ModelRegistry(root)
+    for name in names:
+        for version in versions:
+            registry.save((ModelRef(name, version), {"name": name, "v": version}))
+    return registry
+
+
+def test_latest_version_is_loaded_lazily(tmp_path):
+    populate(tmp_path)
+    registry = ModelRegistry(tmp_path)
+    assert registry.loaded_bytes == 0
+    assert registry.latest("close_h1") == "10"
+    assert registry.get("close_h1") == {"name": "close_h1", "v": "10"}
+    registry.get("close_h1", "10")
+    assert registry.stats["hits"] == 1 and registry.stats["misses"] == 1
+    assert "close_h5/2" in registry.list_all()
+
+
+def test_lru_eviction_respects_model_budget(tmp_path):
+    populate(tmp_path)
+    registry = ModelRegistry(tmp_path, max_models=2)
+    registry.get("close_h1", "1")
+    registry.get("close_h1", "2")
+    registry.get("close_h1", "1")  # refresh: "2" becomes least recently used
+    registry.get("close_h5", "1")
+
+    assert registry.is_loaded(ModelRef("close_h1", "1"))
+    assert not registry.is_loaded(ModelRef("close_h1", "2"))
+    assert registry.stats["evictions"] == 1
+
+
+def test_cold_load_does_not_block_warm_requests(tmp_path):
+    populate(tmp_path)
+    release = threading.Event()
+
+    def slow_loader(path):
+        if "close_h5" in str(path):
+            release.wait(5)
+        return path.parent.name
+
+    registry = ModelRegistry(tmp_path, loader=slow_loader)
+    registry.get("close_h1", "1")
+    [future] = registry.prefetch(["close_h5/2"])
+
+    started = time.perf_counter()
+    assert registry.get("close_h1", "1") == "1"
+    assert time.perf_counter() - started < 1
+    assert not future.done()
+
+    release.set()
+    assert future.result(timeout=5) == "2"
+    assert registry.get("close_h5", "2") == "2"
+    registry.close()
+
+
+def test_unknown_model_raises_key_error(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    with pytest.raises(KeyError):
+        registry.get("missing")
+    with pytest.raises(KeyError):
+        registry.get("missing", "1")
+
+
+def test_save_during_load_does_not_cache_the_old_model(tmp_path):
+    populate(tmp_path, names=("close_h1",), versions=("1",))
+    read, release = threading.Event(), threading.Event()
+
+    def slow_loader(path):
+        model = ModelRegistry._unpickle(path)
+        if not release.is_set():
+            read.set()
+            release.wait(5)
+        return model
+
+    registry = ModelRegistry(tmp_path, loader=slow_loader)
+    [future] = registry.prefetch(["close_h1/1"])
+    assert read.wait(5)
+    registry.save((ModelRef("close_h1", "1"), {"name": "close_h1", "v": "1b"}))
+    release.set()
+
+    assert future.result(timeout=5)["v"] == "1"  # the caller that asked first
+    assert not registry.is_loaded(ModelRef("close_h1", "1"))
+    assert registry.get("close_h1", "1")["v"] == "1b"
+    assert registry.loaded_bytes > 0
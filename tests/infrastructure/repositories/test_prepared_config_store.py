@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.interfaces.repositories import PreparedConfigKey, PreparedConfigRecord
+from domain.interfaces.strategies.i_feature_cleaner import CleaningConfig
+from src.application.bypasses.data_cleaner_bypass import DataCleanerBypass
+from src.application.orchestrators.enrichment_flow import EnrichmentFlow
+from src.application.services.fingerprint import (
+    data_fingerprint,
+    strategy_fingerprint,
+)
+from src.infrastructure.repositories.stores import PreparedConfigStore
+
+
+class CountingCleaner(DataCleanerBypass):
+    version = "1"
+
+    def __init__(self, threshold=1.0):
+        self.threshold = threshold
+        self._prepared = 0
+
+    @property
+    def prepared(self):
+        return self._prepared
+
+    def prepare(self, data):
+        self._prepared += 1
+        return super().prepare(data)
+
+
+@pytest.fixture
+def raw():
+    frame = pd.DataFrame(
+        np.arange(12, dtype="float64").reshape(4, 3), columns=["a_x", "b_x", "c_x"]
+    )
+    return RawData(data=frame)
+
+
+def test_save_load_round_trip(tmp_path):
+    store = PreparedConfigStore(tmp_path)
+    key = PreparedConfigKey("cleaning", "pkg.Cleaner", "1", "abc")
+    store.save(PreparedConfigRecord(key=key, config=CleaningConfig()))
+
+    assert store.load(key) == CleaningConfig()
+    assert store.list_all() == [key.id]
+    assert key.id in store.get_by_id([key.id])
+
+
+def test_version_mismatch_is_a_miss(tmp_path):
+    store = PreparedConfigStore(tmp_path)
+    key = PreparedConfigKey("cleaning", "pkg.Cleaner", "1", "abc")
+    store.save(PreparedConfigRecord(key=key, config=CleaningConfig()))
+
+    bumped = PreparedConfigKey("cleaning", "pkg.Cleaner", "2", "abc")
+    assert store.load(bumped) is None
+
+
+def test_fingerprint_ignores_identity_but_not_content(raw):
+    assert data_fingerprint(raw) == data_fingerprint(raw.to_stage(RawData))
+    changed = raw.to_stage(RawData, data=raw.data.assign(a_x=0.0))
+    assert data_fingerprint(raw) != data_fingerprint(changed)
+
+
+def test_flow_reuses_stored_configs(tmp_path, raw):
+    store = PreparedConfigStore(tmp_path)
+
+    first = CountingCleaner()
+    EnrichmentFlow(cleaner=first, config_store=store).execute(raw)
+    assert first.prepared == 1
+
+    second = CountingCleaner()
+    EnrichmentFlow(cleaner=second, config_store=store).execute(raw)
+    assert second.prepared == 0
+
+
+def test_changed_strategy_params_are_a_miss(tmp_path, raw):
+    store = PreparedConfigStore(tmp_path)
+    EnrichmentFlow(cleaner=CountingCleaner(), config_store=store).execute(raw)
+
+    same = CountingCleaner(threshold=1.0)
+    EnrichmentFlow(cleaner=same, config_store=store).execute(raw)
+    assert same.prepared == 0
+
+    changed = CountingCleaner(threshold=2.0)
+    EnrichmentFlow(cleaner=changed, config_store=store).execute(raw)
+    assert changed.prepared == 1
+
+
+def test_strategy_fingerprint_covers_nested_params():
+    assert strategy_fingerprint(CountingCleaner()) == strategy_fingerprint(
+        CountingCleaner()
+    )
+    outer = EnrichmentFlow(cleaner=CountingCleaner(threshold=1.0))
+    other = EnrichmentFlow(cleaner=CountingCleaner(threshold=3.0))
+    assert strategy_fingerprint(outer) != strategy_fingerprint(other)
+
+
+def test_fixed_config_key_never_prepares(tmp_path, raw):
+    store = PreparedConfigStore(tmp_path)
+    EnrichmentFlow(cleaner=CountingCleaner(), config_store=store).execute(raw)
+    training_key = data_fingerprint(raw)
+
+    cleaner = CountingCleaner()
+    flow = EnrichmentFlow(cleaner=cleaner, config_store=store, config_key=training_key)
+    batch = raw.to_stage(RawData, data=raw.data.iloc[:1])
+    flow.execute(batch)
+    assert cleaner.prepared == 0
+
+    with pytest.raises(KeyError):
+        EnrichmentFlow(
+            cleaner=CountingCleaner(), config_store=store, config_key="unknown"
+        ).execute(batch)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.repositories.stores import NpyAppender, ProcessedArrayStore
+
+
+def make_store(tmp_path):
+    return ProcessedArrayStore(
+        "train", x_path=tmp_path / "X_train.npy", y_path=tmp_path / "Y_train.npy"
+    )
+
+
+def make_input(start, rows):
+    data = np.arange(start * 3, (start + rows) * 3, dtype=np.float32).reshape(rows, 3)
+    schema = DatasetSchema(columns=["a", "b"], targets=["y"])
+    return ModelInputData(data=data, schema=schema)
+
+
+def test_appends_are_readable_with_np_load(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_input(0, 10))
+    store.save(make_input(10, 5))
+
+    x = np.load(tmp_path / "X_train.npy")
+    y = np.load(tmp_path / "Y_train.npy")
+    assert x.shape == (15, 2) and y.shape == (15, 1)
+    np.testing.assert_array_equal(x[12], [36, 37])
+    np.testing.assert_array_equal(y[:, 0], np.arange(15) * 3 + 2)
+
+
+def test_appends_to_files_written_by_np_save(tmp_path):
+    path = tmp_path / "X.npy"
+    np.save(path, np.zeros((4, 2), dtype=np.float32))
+    assert NpyAppender(path).append(np.ones((1000, 2))) == 1004
+    assert np.load(path).shape == (1004, 2)
+
+    with pytest.raises(ValueError):
+        NpyAppender(path).append(np.ones((1, 3)))
+
+
+def test_append_overwrites_bytes_left_by_an_interrupted_append(tmp_path):
+    path = tmp_path / "X.npy"
+    appender = NpyAppender(path)
+    appender.append(np.zeros((3, 2)))
+    with path.open("ab") as f:  # data written, header never updated
+        f.write(np.full((2, 2), 9, dtype=np.float32).tobytes())
+
+    assert appender.append(np.ones((1, 2))) == 4
+    loaded = np.load(path)
+    np.testing.assert_array_equal(loaded, [[0, 0]] * 3 + [[1, 1]])
+    assert path.stat().st_size == 256 + 4 * 2 * 4
+
+
+def test_mismatched_row_counts_write_nothing(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_input(0, 4))
+    with pytest.raises(ValueError, match="4 X rows with 3 Y rows"):
+        store.save((np.ones((4, 2)), np.ones((3, 1))))
+    assert np.load(tmp_path / "X_train.npy").shape == (4, 2)
+    assert np.load(tmp_path / "Y_train.npy").shape == (4, 1)
+
+
+def test_failed_y_append_rolls_x_back(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_input(0, 4))
+    x_bytes = (tmp_path / "X_train.npy").read_bytes()
+
+    with pytest.raises(ValueError):
+        store.save((np.ones((2, 2)), np.ones((2, 5))))  # Y width does not match
+    assert (tmp_path / "X_train.npy").read_bytes() == x_bytes
+
+
+def test_failed_first_save_removes_the_new_files(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+
+    def disk_full(rows):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(store._y_writer, "append", disk_full)
+    with pytest.raises(OSError):
+        store.save(make_input(0, 4))
+    assert store.list_all() == []
+
+
+def test_batches_cover_every_row_once_per_epoch(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_input(0, 103))
+    loader = store.batches(batch_size=10, seed=0, prefetch=3)
+    assert len(loader) == 11
+
+    for _ in range(2):
+        batches = list(loader)
+        xs = np.concatenate([x for x, _ in batches])
+        ys = np.concatenate([y for _, y in batches])
+        assert sorted(xs[:, 0] / 3) == list(range(103))
+        np.testing.assert_array_equal(ys[:, 0], xs[:, 0] + 2)
+
+
+def test_reads_are_memory_mapped(tmp_path):
+    store = make_store(tmp_path)
+    store.save(make_input(0, 8))
+    arrays = store.get_by_id(["X"])
+    assert isinstance(arrays["X_train"], np.memmap)
+    assert store.list_all() == ["X_train", "Y_train"]
+    store.delete("train")
+    assert store.list_all() == []
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.repositories.i_query.raw import yfinance_loader
+from src.infrastructure.repositories.i_query.raw.yfinance_loader import YfinanceLoader
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = []
+
+    def download(ticker, start, end, **kwargs):
+        recorded.append((ticker, start, end))
+        days = pd.date_range(start, end, inclusive="left", name="Date")
+        return pd.DataFrame({"Close": range(len(days))}, index=days)
+
+    monkeypatch.setattr(yfinance_loader.yf, "download", download)
+    return recorded
+
+
+def make_loader():
+    return YfinanceLoader(
+        "2024-01-01",
+        "2024-02-01",
+        sleep_seconds=0,
+        config={"IndBovespa": "^BVSP"},
+    )
+
+
+def test_scan_includes_the_end_day(calls):
+    data = make_loader().scan(
+        ["IndBovespa_Close"], start=datetime(2024, 1, 10), end=datetime(2024, 1, 15)
+    )
+    assert calls == [("^BVSP", "2024-01-10", "2024-01-16")]
+    frame = data["IndBovespa"]
+    assert list(frame.columns) == ["IndBovespa_Close"]
+    assert frame.index[-1] == pd.Timestamp("2024-01-15")
+
+
+def test_scan_keeps_the_loader_range_exclusive_end(calls):
+    loader = make_loader()
+    loader.scan(["IndBovespa_Close"], end=datetime(2024, 3, 1))
+    assert calls == [("^BVSP", "2024-01-01", "2024-02-01")]
+    assert loader.scan(["IndBovespa_Close"], start=datetime(2024, 2, 1)) == {}
@@ -0,0 +1,137 @@
+import http.client
+import json
+import socket
+
+import pytest
+
+from src.application.orchestrators.end2end_prediction_flow import (
+    End2EndPredictionFlow,
+)
+from src.infrastructure.serving import InferenceServer
+
+PAYLOAD = {
+    "columns": ["IndBovespa_Close", "BtcUsd_Close"],
+    "index": ["2024-01-02", "2024-01-03"],
+    "data": [[1.0, 2.0], [3.0, 4.0]],
+}
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+def call(conn, method, path, body=None):
+    conn.request(method, path, body=json.dumps(body) if body is not None else None)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.fixture
+def server():
+    built = []
+
+    def factory(version):
+        built.append(version)
+        return End2EndPredictionFlow()
+
+    srv = InferenceServer(factory, version="v1", port=0, max_concurrency=2)
+    srv.start()
+    srv.built = built
+    yield srv
+    srv.shutdown()
+
+
+def test_predict_health_and_metrics(server):
+    conn = http.client.HTTPConnection(*server.address)
+
+    status, body = call(conn, "POST", "/predict", PAYLOAD)
+    assert status == 200
+    assert body["columns"] == PAYLOAD["columns"]
+    assert body["data"] == PAYLOAD["data"]
+
+    status, health = call(conn, "GET", "/health")
+    assert health == {**health, "status": "ok", "model_version": "v1"}
+
+    status, metrics = call(conn, "GET", "/metrics")
+    assert metrics["requests"] == 1
+    assert metrics["latency_ms"]["p50"] > 0
+
+
+def test_reload_swaps_version(server):
+    conn = http.client.HTTPConnection(*server.address)
+    status, health = call(conn, "POST", "/reload", {"version": "v2"})
+    assert status == 200
+    assert health["model_version"] == "v2"
+    assert server.built == ["v1", "v2"]
+
+
+def test_busy_server_rejects_with_503(server):
+    for _ in range(2):
+        server._slots.acquire()
+    server.queue_timeout = 0.01
+    conn = http.client.HTTPConnection(*server.address)
+    status, _ = call(conn, "POST", "/predict", PAYLOAD)
+    assert status == 503
+    assert server.metrics.rejected == 1
+
+
+def test_malformed_payloads_are_rejected_with_400(server):
+    conn = http.client.HTTPConnection(*server.address)
+    status, body = call(conn, "POST", "/predict", {"columns": ["a"]})
+    assert status == 400 and "data" in body["error"]
+
+    conn.request("POST", "/predict", body="{not json")
+    response = conn.getresponse()
+    assert response.status == 400
+    response.read()
+
+    status, body = call(
+        conn, "POST", "/predict", {"columns": ["a"], "data": [[1.0, 2.0]]}
+    )
+    assert status == 400 and "split frame" in body["error"]
+
+    status, _ = call(conn, "POST", "/reload", ["v2"])
+    assert status == 400
+    assert server.built == ["v1"]
+
+
+class FailingFlow(End2EndPredictionFlow):
+    def execute(self, data):
+        raise ValueError("model input has the wrong shape")
+
+
+def test_flow_and_factory_errors_are_server_errors():
+    def factory(version):
+        if version == "broken":
+            raise ValueError("no such model version")
+        return FailingFlow()
+
+    srv = InferenceServer(factory, port=0)
+    srv.start()
+    try:
+        conn = http.client.HTTPConnection(*srv.address)
+        status, body = call(conn, "POST", "/predict", PAYLOAD)
+        assert status == 500 and "wrong shape" in body["error"]
+
+        status, body = call(conn, "POST", "/reload", {"version": "broken"})
+        assert status == 500 and "no such model version" in body["error"]
+    finally:
+        srv.shutdown()
+
+
+def test_serves_over_unix_socket(tmp_path):
+    path = str(tmp_path / "inference.sock")
+    srv = InferenceServer(lambda v: End2EndPredictionFlow(), unix_socket=path)
+    srv.start()
+    try:
+        status, body = call(_UnixConnection(path), "POST", "/predict", PAYLOAD)
+        assert status == 200
+        assert body["data"] == PAYLOAD["data"]
+    finally:
+        srv.shutdown()
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.serving import TransformPlan
+from src.infrastructure.strategies import VectorizedCleaner, VectorizedModelAdapter
+from domain.interfaces.strategies.i_feature_cleaner import CleaningConfig
+from domain.interfaces.strategies.i_feature_selector import SelectionConfig
+
+
+def make_raw(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "^BVSP": rng.normal(120_000, 3_000, rows),
+            "USDBRL": rng.normal(5, 0.2, rows),
+            "SELIC": rng.normal(11, 1, rows),
+            "noise": rng.normal(size=rows),
+            "regime": rng.choice(["alta", "baixa"], rows),
+        }
+    )
+    frame.loc[rng.random(rows) < 0.1, "USDBRL"] = np.nan
+    frame.loc[:5, "SELIC"] = 40.0  # outliers to clip
+    schema = DatasetSchema(
+        columns=["USDBRL", "SELIC", "noise", "regime"], targets=["^BVSP"]
+    )
+    return RawData(data=frame, schema=schema)
+
+
+def prepared(raw):
+    cleaner = VectorizedCleaner()
+    cleaning = cleaner.prepare(raw).config
+    selection = SelectionConfig(
+        details={"selected_columns": ["SELIC", "regime", "USDBRL", "^BVSP"]}
+    )
+    cleaned = cleaner.clean(raw, cleaning)
+    selected = cleaned.to_stage(
+        SelectedData,
+        data=cleaned.data[selection.details["selected_columns"]],
+        schema=DatasetSchema(columns=["SELIC", "regime", "USDBRL"], targets=["^BVSP"]),
+    )
+    adapter = VectorizedModelAdapter()
+    transformation = adapter.prepare_transform(selected).config
+    return cleaning, selection, transformation, adapter, selected
+
+
+def test_plan_matches_the_dataframe_path():
+    raw = make_raw()
+    cleaning, selection, transformation, adapter, selected = prepared(raw)
+    expected = adapter.transform(selected, transformation).data
+
+    plan = TransformPlan.compile(cleaning, selection, transformation)
+    assert plan.columns == ["SELIC", "regime", "USDBRL", "^BVSP"]
+    assert plan.describe()["categorical"] == ["regime"]
+
+    records = raw.data.to_dict("records")
+    for i in (0, 1, 7, 42):
+        record = {k: (None if pd.isna(v) else v) for k, v in records[i].items()}
+        np.testing.assert_allclose(
+            plan.transform_record(record)[0], expected[i], rtol=1e-5, atol=1e-5
+        )
+
+    batch = plan.transform_records(records[:50])
+    assert batch.shape == (50, 4)
+    np.testing.assert_allclose(batch, expected[:50], rtol=1e-5, atol=1e-5)
+
+
+def test_plan_handles_missing_keys_unknown_categories_and_arrays():
+    raw = make_raw()
+    cleaning, selection, transformation, _, _ = prepared(raw)
+    plan = TransformPlan.compile(cleaning, selection, transformation, max_rows=2)
+
+    row = plan.transform_record({"SELIC": 1e6, "regime": "nova"}).copy()
+    fill = dict(zip(cleaning.params["columns"], cleaning.params["fill"]))
+    upper = dict(zip(cleaning.params["columns"], cleaning.params["upper"]))
+    scale, offset = transformation.params["scale"], transformation.params["offset"]
+    assert row[0, 0] == pytest.approx(upper["SELIC"] * scale[0] + offset[0], abs=1e-5)
+    assert row[0, 1] == -1  # unknown category
+    assert row[0, 2] == pytest.approx(fill["USDBRL"] * scale[2] + offset[2], abs=1e-5)
+
+    values = np.array([[10.0, 1, np.nan, 120_000.0]] * 3)
+    out = plan.transform_array(values)
+    assert out.shape == (3, 4) and out.dtype == np.float32  # buffer grew
+    with pytest.raises(ValueError):
+        plan.transform_array(values[:, :3])
+
+
+def test_cleaning_only_plan_and_rejects_non_columnwise_configs():
+    raw = make_raw()
+    cleaner = VectorizedCleaner()
+    cleaning = cleaner.prepare(raw).config
+    plan = TransformPlan.compile(cleaning)
+    expected = cleaner.clean(raw, cleaning).data[plan.columns].to_numpy()
+    np.testing.assert_allclose(
+        plan.transform_array(raw.data[plan.columns].to_numpy()), expected, rtol=1e-6
+    )
+    with pytest.raises(ValueError):
+        TransformPlan.compile(CleaningConfig(params={"plan": {}}))
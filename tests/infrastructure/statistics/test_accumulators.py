@@ -0,0 +1,83 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.infrastructure.statistics import (
+    ConfusionCounts,
+    DirectionalAccuracy,
+    ErrorMetrics,
+    Moments,
+)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(3)
+    actual = np.cumsum(rng.normal(size=(1000, 2)), axis=0)
+    predicted = actual + rng.normal(scale=0.5, size=actual.shape)
+    predicted[5, 0] = np.nan
+    return actual, predicted
+
+
+def chunked(accumulator_type, actual, predicted, size=128):
+    acc = accumulator_type()
+    for start in range(0, len(actual), size):
+        acc.update(actual[start : start + size], predicted[start : start + size])
+    return acc
+
+
+def test_chunked_error_metrics_match_one_pass(series):
+    actual, predicted = series
+    result = chunked(ErrorMetrics, actual, predicted).result()
+    error = predicted - actual
+    np.testing.assert_allclose(result["mae"], np.nanmean(np.abs(error), axis=0))
+    np.testing.assert_allclose(result["rmse"], np.sqrt(np.nanmean(error**2, axis=0)))
+
+
+def test_welford_merge_matches_numpy(series):
+    actual, predicted = series
+    left = chunked(Moments, actual[:300], predicted[:300], size=50)
+    right = pickle.loads(pickle.dumps(chunked(Moments, actual[300:], predicted[300:])))
+    result = left.merge(right).result()
+    residual = actual - predicted
+    np.testing.assert_allclose(result["mean"], np.nanmean(residual, axis=0))
+    np.testing.assert_allclose(result["std"], np.nanstd(residual, axis=0, ddof=1))
+
+
+def test_directional_accuracy_counts_shard_boundaries(series):
+    actual, predicted = series
+    whole = DirectionalAccuracy().update(actual, predicted).result()
+    shards = [
+        chunked(DirectionalAccuracy, actual[a:b], predicted[a:b], size=33)
+        for a, b in [(0, 250), (250, 600), (600, 1000)]
+    ]
+    merged = shards[0].merge(shards[1]).merge(shards[2]).result()
+    np.testing.assert_array_equal(merged["steps"], whole["steps"])
+    np.testing.assert_allclose(
+        merged["directional_accuracy"], whole["directional_accuracy"]
+    )
+
+
+def test_confusion_counts_merge():
+    labels = ["down", "flat", "up"]
+    a = ConfusionCounts(labels).update(["up", "down", "up"], ["up", "up", "up"])
+    b = ConfusionCounts(labels).update(["flat", "other"], ["flat", "flat"])
+    result = a.merge(b).result()
+    assert result["confusion"][0].sum() == 4
+    assert result["accuracy"][0] == pytest.approx(3 / 4)
+
+
+def test_confusion_counts_match_labels_of_any_type():
+    labels = [0, 1, "up", None]
+    counts = ConfusionCounts(labels).update(
+        np.array([[0, "up"], [1, None], [2, "up"]], dtype=object),
+        np.array([[0, "up"], [0, None], [1, "down"]], dtype=object),
+    )
+    confusion = counts.result()["confusion"]
+    assert confusion[0].sum() == 2 and confusion[0][0, 0] == 1
+    assert confusion[1][2, 2] == 1 and confusion[1][3, 3] == 1
+    assert confusion[1].sum() == 2
+
+    with pytest.raises(ValueError, match="unique"):
+        ConfusionCounts(["a", "a"])
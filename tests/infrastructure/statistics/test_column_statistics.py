@@ -0,0 +1,40 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.infrastructure.statistics import ColumnStatistics
+
+
+def make_block(rows, seed):
+    block = np.random.default_rng(seed).normal(3, 2, size=(rows, 3))
+    block[::7, 1] = np.nan
+    block[:, 2] = np.nan
+    return block
+
+
+def test_partitions_merge_to_the_full_scan():
+    full = make_block(300, 0)
+    parts = [ColumnStatistics(["a", "b", "c"]).update(p) for p in np.split(full, 3)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).result()
+    expected = ColumnStatistics(["a", "b", "c"]).update(full).result()
+
+    for key in ("nulls", "count", "mean", "std", "min", "max"):
+        np.testing.assert_allclose(merged[key], expected[key], equal_nan=True)
+    np.testing.assert_allclose(merged["mean"][:2], np.nanmean(full[:, :2], axis=0))
+    np.testing.assert_allclose(
+        merged["std"][:2], np.nanstd(full[:, :2], axis=0, ddof=1)
+    )
+    assert merged["nulls"][2] == 300 and np.isnan(merged["mean"][2])
+
+
+def test_state_round_trips_through_plain_lists_and_pickle():
+    stats = ColumnStatistics(["a", "b", "c"]).update(make_block(50, 1))
+    restored = ColumnStatistics.from_dict(stats.to_dict())
+    assert restored.to_dict() == stats.to_dict()
+    assert pickle.loads(pickle.dumps(stats)).to_dict() == stats.to_dict()
+
+    empty = ColumnStatistics.from_dict(ColumnStatistics(["a"]).to_dict())
+    assert empty.update(np.ones((2, 1))).rows == 2
+    with pytest.raises(ValueError):
+        empty.merge(ColumnStatistics(["b"]))
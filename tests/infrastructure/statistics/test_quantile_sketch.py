@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.statistics import KLLSketch, QuantileSketches
+
+Q = np.linspace(0.01, 0.99, 99)
+
+
+def rank_error(sketch, values):
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantile(Q)) / len(ordered)
+    return np.abs(ranks - Q).max()
+
+
+def test_rank_error_is_bounded_and_memory_fixed():
+    values = np.random.default_rng(0).lognormal(size=500_000)
+    small = KLLSketch(k=200, seed=1).update(values[:5_000])
+    sketch = KLLSketch(k=200, seed=1).update(values)
+    assert rank_error(sketch, values) < 0.02
+    assert sketch.size < 3 * 200
+    assert small.size < 3 * 200
+    assert sketch.quantile([0.0, 1.0]).tolist() == [values.min(), values.max()]
+
+
+def test_streamed_and_merged_sketches_agree_with_the_data():
+    values = np.random.default_rng(1).normal(size=100_000)
+    streamed = KLLSketch(k=128, seed=2)
+    for chunk in np.array_split(values, 500):
+        streamed.update(chunk)
+    parts = [
+        KLLSketch(k=128, seed=i).update(p)
+        for i, p in enumerate(np.array_split(values, 8))
+    ]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert merged.n == streamed.n == len(values)
+    assert rank_error(streamed, values) < 0.03
+    assert rank_error(merged, values) < 0.03
+    assert abs(merged.rank(0.0) - 0.5) < 0.03
+    with pytest.raises(ValueError):
+        merged.merge(KLLSketch(k=64))
+
+
+def test_serialization_round_trip_and_nan_handling():
+    sketch = KLLSketch(k=32, seed=0).update([np.nan, 1.0, 2.0, np.inf, 3.0])
+    restored = KLLSketch.from_dict(sketch.to_dict())
+    assert restored.n == 3
+    np.testing.assert_array_equal(restored.quantile(Q), sketch.quantile(Q))
+    assert np.isnan(KLLSketch().quantile(0.5))
+
+
+def test_column_sketches_update_merge_and_serialize():
+    block = np.random.default_rng(3).normal(size=(20_000, 3)) * [1, 10, 100]
+    a = QuantileSketches(["a", "b", "c"], k=200, seed=0).update(block[:10_000])
+    b = QuantileSketches(["a", "b", "c"], k=200, seed=1).update(block[10_000:])
+    merged = QuantileSketches.from_dict(a.merge(b).to_dict())
+    medians = merged.quantiles([0.5])[0]
+    error = np.abs(medians - np.median(block, axis=0))
+    assert (error < 0.05 * np.array([1, 10, 100])).all()
+
+
+def test_column_sketches_are_reproducible_through_serialization():
+    block = np.random.default_rng(4).normal(size=(50_000, 2))
+    first = QuantileSketches(["a", "b"]).update(block)
+    second = QuantileSketches(["a", "b"]).update(block)
+    np.testing.assert_array_equal(first.quantiles(Q), second.quantiles(Q))
+
+    # Restored sketches continue with the same sampling, not fresh draws.
+    a = QuantileSketches.from_dict(first.to_dict()).update(block[:20_000])
+    b = QuantileSketches.from_dict(second.to_dict()).update(block[:20_000])
+    np.testing.assert_array_equal(a.quantiles(Q), b.quantiles(Q))
+
+
+def test_update_ingests_strided_input_in_batches():
+    block = np.random.default_rng(5).normal(size=(10_000, 3))
+    block[::7, 1] = np.nan
+    sketch = KLLSketch(k=64, batch_size=1_000, seed=0).update(block[:, 1])
+    assert sketch.n == np.isfinite(block[:, 1]).sum()
+    assert sketch.min == np.nanmin(block[:, 1])
+    assert KLLSketch(k=64, batch_size=4).update([np.nan] * 8 + [1.0]).n == 1
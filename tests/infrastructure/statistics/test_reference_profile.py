@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.statistics import ReferenceProfile
+
+
+def make_block(rows, shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    block = np.column_stack(
+        [
+            rng.normal(shift, 1.0, rows),
+            rng.exponential(1.0, rows),
+            rng.integers(0, 3, rows).astype(float),  # heavy ties
+        ]
+    ).astype(np.float32)
+    block[rng.random(rows) < 0.05, 1] = np.nan
+    return block
+
+
+def test_same_distribution_does_not_drift():
+    profile = ReferenceProfile.fit(make_block(50_000), ["a", "b", "c"], seed=0)
+    report = profile.compare(make_block(2_000, seed=1))
+
+    assert profile.edges.shape == (3, 9)
+    assert report["drifted"] == []
+    assert max(report["psi"].values()) < 0.02
+    assert abs(report["missing_shift"]["b"]) < 0.02
+    for column in ("a", "b", "c"):
+        assert report["ks"][column] < report["ks_critical"][column]
+
+
+def test_large_batches_are_not_flagged_on_sketch_error():
+    profile = ReferenceProfile.fit(make_block(400_000), ["a", "b", "c"], k=100)
+    report = profile.compare(make_block(200_000, seed=1), chunk_rows=50_000)
+
+    # The plain two-sample critical value (~0.004) is below the sketch error.
+    assert min(report["ks_critical"].values()) == pytest.approx(1.7 / 100)
+    assert report["drifted"] == []
+    assert ReferenceProfile.from_dict(profile.to_dict()).k == 100
+
+
+def test_flags_shifted_features_against_exact_statistics():
+    train = make_block(50_000)
+    profile = ReferenceProfile.fit(train, ["a", "b", "c"], seed=0)
+    batch = make_block(2_000, shift=0.5, seed=1)
+    report = profile.compare(batch, chunk_rows=300)
+
+    assert report["drifted"] == ["a"]
+    assert report["psi"]["a"] > 0.1
+
+    # Binned KS is a lower bound of the exact two-sample statistic.
+    a, b = np.sort(train[:, 0]), np.sort(batch[:, 0])
+    grid = np.concatenate([a, b])
+    exact = np.abs(
+        np.searchsorted(a, grid, "right") / len(a)
+        - np.searchsorted(b, grid, "right") / len(b)
+    ).max()
+    assert report["ks"]["a"] <= exact + 0.02
+    assert report["ks"]["a"] > 0.5 * exact
+
+
+def test_round_trips_and_validates_width():
+    profile = ReferenceProfile.fit(make_block(5_000), n_bins=5, seed=0)
+    restored = ReferenceProfile.from_dict(profile.to_dict())
+    batch = make_block(500, seed=3)
+
+    assert restored.columns == ["0", "1", "2"]
+    assert restored.n_bins == 5
+    assert restored.compare(batch) == profile.compare(batch)
+    with pytest.raises(ValueError):
+        profile.compare(batch[:, :2])
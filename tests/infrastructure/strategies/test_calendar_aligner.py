@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.calendars import calendar_between
+from src.infrastructure.strategies import CalendarAligner
+
+
+def make_raw():
+    b3 = calendar_between("B3", "2024-01-01", "2024-03-31")
+    nyse = calendar_between("NYSE", "2024-01-01", "2024-03-31")
+    monthly = pd.DatetimeIndex(["2024-01-10", "2024-02-09", "2024-03-08"])
+    bvsp = pd.Series(np.arange(len(b3), dtype=float), index=b3)
+    spx = pd.Series(np.arange(len(nyse), dtype=float) + 1000, index=nyse)
+    ipca = pd.Series([0.4, 0.8, 0.2], index=monthly)
+    frame = pd.concat({"^BVSP": bvsp, "^GSPC": spx, "IPCA": ipca}, axis=1)
+    frame["note"] = "x"
+    schema = DatasetSchema(columns=["^GSPC", "IPCA", "note"], targets=["^BVSP"])
+    return RawData(data=frame, schema=schema)
+
+
+def test_aligns_as_of_onto_target_calendar():
+    raw = make_raw()
+    aligner = CalendarAligner("B3")
+    summary = aligner.prepare(raw)
+    cleaned = aligner.clean(raw, summary.config)
+    frame = cleaned.data
+
+    assert isinstance(cleaned, CleanedData)
+    assert frame.index.equals(calendar_between("B3", "2024-01-02", "2024-03-29"))
+    assert cleaned.schema.columns == ["^GSPC", "IPCA"]
+    assert cleaned.schema.targets == ["^BVSP"]
+    assert summary.issues["dropped"] == ["note"]
+
+    # 2024-02-19 is a US holiday but a B3 trading day: carry the 16th forward.
+    spx = raw.data["^GSPC"].dropna()
+    assert frame.loc["2024-02-19", "^GSPC"] == spx.loc["2024-02-16"]
+    # Monthly release: missing before the first print, then as-of.
+    assert np.isnan(frame.loc["2024-01-09", "IPCA"])
+    assert frame.loc["2024-02-08", "IPCA"] == 0.4
+    assert frame.loc["2024-02-09", "IPCA"] == 0.8
+    assert summary.issues["leading_missing"]["IPCA"] > 0
+
+
+def test_flags_and_optionally_drops_stale_values():
+    raw = make_raw()
+    frame = raw.data.copy()
+    frame.loc["2024-02-01":, "^GSPC"] = np.nan  # series stops updating
+    raw = raw.to_stage(RawData, data=frame)
+
+    aligner = CalendarAligner("B3", max_age={"^GSPC": 3}, drop_stale=True)
+    summary = aligner.prepare(raw)
+    assert summary.config.params["max_age"]["^GSPC"] == 3
+    assert summary.config.params["max_age"]["IPCA"] > 20  # inferred from gaps
+    cleaned = aligner.clean(raw, summary.config)
+
+    stale = cleaned.metadata["stale"]["^GSPC"]
+    assert not stale.loc[:"2024-02-05"].any()
+    assert stale.loc["2024-02-06":].all()
+    assert cleaned.data.loc["2024-02-06":, "^GSPC"].isna().all()
+    assert cleaned.metadata["age"].loc["2024-02-05", "^GSPC"] == 3
+    assert summary.issues["stale_rate"]["^GSPC"] > 0
+
+
+def test_rejects_empty_frame():
+    with pytest.raises(ValueError):
+        CalendarAligner().prepare(
+            RawData(data=pd.DataFrame({"a": []}, index=pd.DatetimeIndex([])))
+        )
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.strategies.i_model import (
+    ShapeBucketedPredictor,
+    benchmark_latency,
+    power_of_two_buckets,
+)
+
+keras = pytest.importorskip("keras")
+
+
+def make_model():
+    keras.utils.set_random_seed(0)
+    return keras.Sequential(
+        [keras.Input(shape=(6, 3)), keras.layers.LSTM(4), keras.layers.Dense(2)]
+    )
+
+
+def test_power_of_two_buckets_end_at_max_batch():
+    assert power_of_two_buckets(8) == [1, 2, 4, 8]
+    assert power_of_two_buckets(12) == [1, 2, 4, 8, 12]
+
+
+@pytest.mark.parametrize("xla", [False, True])
+def test_padded_buckets_match_plain_predict(xla):
+    model = make_model()
+    predictor = ShapeBucketedPredictor(model, max_batch=16, xla=xla)
+    rng = np.random.default_rng(0)
+    for size in (1, 3, 16, 37):
+        batch = rng.normal(size=(size, 6, 3)).astype(np.float32)
+        expected = model.predict(batch, verbose=0)
+        np.testing.assert_allclose(predictor(batch), expected, atol=1e-5)
+    assert predictor.traced_buckets == [1, 4, 8, 16]  # 37 rows: 16 + 16 + 5 -> 8
+    with pytest.raises(ValueError):
+        predictor(np.zeros((2, 5, 3), dtype=np.float32))
+
+
+def test_outputs_do_not_alias_reused_buffers():
+    predictor = ShapeBucketedPredictor(make_model(), max_batch=4)
+    first = predictor(np.ones((2, 6, 3), dtype=np.float32))
+    kept = first.copy()
+    predictor(np.zeros((2, 6, 3), dtype=np.float32))
+    np.testing.assert_array_equal(first, kept)
+
+
+def test_benchmark_reports_each_batch_size():
+    report = benchmark_latency(make_model(), batch_sizes=(1, 8), repeats=2, xla=False)
+    assert list(report.index) == [1, 8]
+    assert {"predict_ms", "compiled_ms", "compiled_speedup"} <= set(report.columns)
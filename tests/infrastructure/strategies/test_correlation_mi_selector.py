@@ -0,0 +1,115 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import CorrelationMISelector
+from src.infrastructure.strategies.i_feature_selector import binned_mutual_information
+from tests.domain.contracts.test_data_selector_contract import DataSelectorContract
+
+
+def make_cleaned(rows=500, noise=True):
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=rows)
+    frame = pd.DataFrame(
+        {
+            "signal": signal,
+            "signal_copy": signal * 2 + 0.001 * rng.normal(size=rows),
+            "other": rng.normal(size=rows),
+        }
+    )
+    frame["^BVSP"] = np.sin(signal) + 0.5 * frame["other"] + 0.1 * rng.normal(size=rows)
+    if noise:
+        frame["flat"] = 1.0
+        frame["noise"] = rng.normal(size=rows)
+        frame["sector"] = "fin"
+    schema = DatasetSchema(
+        columns=[c for c in frame.columns if c != "^BVSP"], targets=["^BVSP"]
+    )
+    return CleanedData(data=frame, schema=schema)
+
+
+class TestCorrelationMISelectorContract(DataSelectorContract):
+    @pytest.fixture
+    def selector_factory(self):
+        return lambda: CorrelationMISelector(min_mi=0.05)
+
+    @pytest.fixture
+    def sample_cleaned_data(self):
+        return make_cleaned()
+
+    @pytest.fixture
+    def valid_cleaned_data(self):
+        return make_cleaned(noise=False)
+
+    @pytest.fixture
+    def selection_preserving_checker(self):
+        def check(selected: SelectedData, original: CleanedData) -> bool:
+            return len(selected.data) == len(original.data) and "^BVSP" in (
+                selected.data.columns
+            )
+
+        return check
+
+    def test_idempotent_selection(self, selector_factory, valid_cleaned_data):
+        # Entities carry fresh identities, so compare the selected payloads.
+        selector = selector_factory()
+        config = selector.prepare(valid_cleaned_data).config
+        first = selector.select(valid_cleaned_data, config)
+        second = selector.select(first, config)
+        pd.testing.assert_frame_equal(first.data, second.data)
+
+
+def test_drops_with_reasons_and_keeps_targets():
+    summary = CorrelationMISelector(min_mi=0.05, block_size=2).prepare(make_cleaned())
+    details = summary.config.details
+    assert details["selected_columns"] == ["signal", "other", "^BVSP"]
+    dropped = details["dropped"]
+    assert dropped["flat"] == "constant"
+    assert dropped["sector"] == "non_numeric"
+    assert dropped["noise"].startswith("low_mutual_information")
+    assert (
+        dropped["signal_copy"].startswith("correlated")
+        and "signal" in dropped["signal_copy"]
+    )
+    assert summary.observations["selected"] == 2
+
+
+def test_select_projects_columns_and_schema():
+    cleaned = make_cleaned()
+    selector = CorrelationMISelector(min_mi=0.05, max_features=1)
+    config = selector.prepare(cleaned).config
+    selected = selector.select(cleaned, config)
+    assert list(selected.data.columns) == ["signal", "^BVSP"]
+    assert selected.schema.columns == ["signal"]
+    assert selected.schema.targets == ["^BVSP"]
+    assert config.details["dropped"]["other"] == "max_features"
+    assert selector.required_columns(config) == ["signal", "^BVSP"]
+
+
+def test_mutual_information_of_independent_and_identical_columns():
+    codes = np.tile(np.arange(4), 250)
+    rng = np.random.default_rng(1)
+    mi = binned_mutual_information(
+        np.stack([codes, rng.permutation(codes)], axis=1), codes, 4, False
+    )
+    assert mi[0] == pytest.approx(np.log(4))
+    assert mi[1] < 0.05
+
+
+def test_thousands_of_features_finish_quickly():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(1000, 50))
+    lagged = np.concatenate(
+        [base + 0.01 * rng.normal(size=base.shape) for _ in range(40)], axis=1
+    )
+    frame = pd.DataFrame(lagged, columns=[f"f{i}" for i in range(lagged.shape[1])])
+    frame["^BVSP"] = base[:, 0] + 0.1 * rng.normal(size=1000)
+    started = time.perf_counter()
+    summary = CorrelationMISelector().prepare(CleanedData(data=frame))
+    assert time.perf_counter() - started < 20
+    assert summary.observations["selected"] <= 60  # near-duplicates collapse
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import DtypeOptimizer, VectorizedCleaner
+
+
+def make_raw(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=rows)
+    close = np.round(100_000 + np.cumsum(rng.normal(0, 500, rows)), 2)
+    volume = rng.integers(0, 30_000, rows).astype(np.float64)
+    volume[[3, 7]] = np.nan  # outer join leaves holes in an integer series
+    frame = pd.DataFrame(
+        {
+            "^BVSP": close,
+            "Volume": volume,
+            "SELIC_valor": [f"{v:.2f}" for v in rng.uniform(10, 14, rows)],
+            "ratio": rng.normal(size=rows) / 3,
+            "regime": rng.choice(["alta", "baixa", "lateral"], rows),
+            "note": [f"id-{i}" for i in range(rows)],
+        },
+        index=index,
+    )
+    frame["ratio"] *= 1e-40  # below float32 precision: must stay float64
+    schema = DatasetSchema(
+        columns=["Volume", "SELIC_valor", "ratio", "regime", "note"],
+        targets=["^BVSP"],
+    )
+    return RawData(data=frame, schema=schema)
+
+
+def test_infers_narrow_dtypes_and_reports_savings():
+    raw = make_raw()
+    optimizer = DtypeOptimizer()
+    summary = optimizer.prepare(raw)
+    cleaned = optimizer.clean(raw, summary.config)
+    frame = cleaned.data
+
+    assert isinstance(cleaned, CleanedData)
+    assert summary.issues["dtypes"] == {
+        "^BVSP": "float32",
+        "Volume": "Int16",
+        "SELIC_valor": "float32",
+        "regime": "category",
+    }
+    assert summary.issues["parsed"] == ["SELIC_valor"]
+    assert frame["ratio"].dtype == np.float64
+    assert frame["note"].dtype == raw.data["note"].dtype
+    assert frame["Volume"].isna().sum() == 2
+
+    # Values survive at their printed precision.
+    np.testing.assert_array_equal(
+        np.round(frame["^BVSP"].to_numpy(np.float64), 2), raw.data["^BVSP"]
+    )
+    np.testing.assert_array_equal(
+        np.round(frame["SELIC_valor"].to_numpy(np.float64), 2),
+        raw.data["SELIC_valor"].astype(float),
+    )
+
+    memory = cleaned.metadata["memory"]
+    assert memory["memory_saved"] > 0
+    assert memory["memory_after"] == frame.memory_usage(deep=True).sum()
+    assert summary.issues["memory_saved"] == memory["memory_saved"]
+    assert cleaned.schema.feature_types["Volume"] == "Int16"
+    assert cleaned.schema.feature_types["regime"] == "category"
+    assert cleaned.schema.targets == ["^BVSP"]
+
+
+def test_prepared_dtypes_apply_to_new_frames():
+    raw = make_raw()
+    optimizer = DtypeOptimizer()
+    config = optimizer.prepare(raw).config
+
+    later = make_raw(rows=20, seed=1)
+    frame = later.data.copy()
+    frame.loc[frame.index[0], "regime"] = "nova"
+    cleaned = optimizer.clean(later.to_stage(RawData, data=frame), config)
+
+    assert cleaned.data.dtypes.equals(optimizer.clean(raw, config).data.dtypes)
+    assert pd.isna(cleaned.data["regime"].iloc[0])  # unseen category
+
+
+def test_clean_widens_integers_that_outgrow_the_prepared_dtype():
+    frame = pd.DataFrame({"Volume": [1.0, 50.0, 100.0, np.nan]})
+    raw = RawData(data=frame, schema=DatasetSchema(columns=["Volume"]))
+    optimizer = DtypeOptimizer()
+    config = optimizer.prepare(raw).config
+    assert config.params["dtypes"] == {"Volume": "Int8"}
+
+    def clean(values):
+        later = raw.to_stage(RawData, data=pd.DataFrame({"Volume": values}))
+        return optimizer.clean(later, config)
+
+    wider = clean([3.0, 300.0, np.nan])
+    assert wider.data["Volume"].dtype == "Int16"
+    assert wider.data["Volume"].tolist()[:2] == [3, 300]
+    assert wider.schema.feature_types["Volume"] == "Int16"
+
+    fractional = clean([2.5, 7.0]).data["Volume"]
+    assert fractional.dtype == np.float64  # never rounded
+    assert fractional.tolist() == [2.5, 7.0]
+    assert clean([1e20]).data["Volume"].dtype == np.float64
+
+
+@pytest.mark.filterwarnings("error")
+def test_unseen_categories_become_nan_without_warnings():
+    raw = make_raw()
+    optimizer = DtypeOptimizer()
+    config = optimizer.prepare(raw).config
+
+    frame = raw.data.iloc[:4].copy()
+    frame["regime"] = ["alta", "nova", None, "baixa"]
+    regime = optimizer.clean(raw.to_stage(RawData, data=frame), config).data["regime"]
+    assert regime.dtype == "category"
+    assert list(regime.cat.categories) == ["alta", "baixa", "lateral"]
+    assert regime.isna().tolist() == [False, True, True, False]
+
+
+def test_downstream_cleaner_keeps_float32():
+    raw = make_raw()
+    optimizer = DtypeOptimizer()
+    narrowed = optimizer.clean(raw, optimizer.prepare(raw).config)
+    narrowed = narrowed.to_stage(RawData, data=narrowed.data.drop(columns="ratio"))
+
+    cleaner = VectorizedCleaner()
+    cleaned = cleaner.clean(narrowed, cleaner.prepare(narrowed).config)
+
+    assert cleaned.data["^BVSP"].dtype == np.float32
+    assert cleaned.data["Volume"].dtype == np.float32
+    assert cleaned.data["regime"].dtype == "category"
+    assert not cleaned.data["Volume"].isna().any()
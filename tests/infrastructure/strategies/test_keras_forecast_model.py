@@ -0,0 +1,120 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.value_objects import DatasetSchema
+from src.domain.enums.problem_type import ProblemType
+from src.infrastructure.strategies import KerasForecastModel
+from domain.interfaces.strategies.i_model import TrainingConfig
+
+
+def make_input(rows=120):
+    t = np.arange(rows, dtype=np.float32)
+    data = np.stack([np.sin(t / 5), np.cos(t / 5)], axis=1).astype(np.float32)
+    return ModelInputData(
+        data=data, schema=DatasetSchema(columns=["sin", "cos"], targets=["sin"])
+    )
+
+
+def test_prepare_training_reads_yaml_defaults_and_overrides():
+    model = KerasForecastModel(sequence_length=8, validation_len=10)
+    summary = model.prepare_training(ProblemType.FORECASTING, make_input())
+    assert summary.config.params["sequence_length"] == 8
+    assert summary.config.params["targets"] == [0]
+    assert "learning_rate" in summary.config.params
+    assert summary.observations["windows"] == 120 - 8
+    with pytest.raises(ValueError):
+        model.prepare_training(ProblemType.CLASSIFICATION, make_input())
+
+
+def test_train_reports_epochs_and_predicts_every_window():
+    pytest.importorskip("keras")
+    model = KerasForecastModel(
+        sequence_length=8, batch_size=16, units=4, epochs=3, validation_len=10, seed=0
+    )
+    data = make_input()
+    summary = model.prepare_training(ProblemType.FORECASTING, data)
+    reported = []
+    config = type(summary.config)(
+        params={
+            **summary.config.params,
+            "epoch_callback": lambda e, loss: reported.append(loss) or e >= 1,
+        }
+    )
+    model.train(ProblemType.FORECASTING, data, config)
+    assert len(reported) == 2  # stopped by the callback after the second epoch
+
+    prediction = model.prepare_prediction(data)
+    drift = prediction.diagnostics["drift"]
+    assert set(drift["psi"]) == {"sin", "cos"} and drift["drifted"] == []
+    shifted = data.to_stage(ModelInputData, data=data.data + np.float32(2.0))
+    assert model.prepare_prediction(shifted).diagnostics["drift"]["drifted"] == [
+        "sin",
+        "cos",
+    ]
+    output = model.predict(data, prediction.config)
+    assert output.data.shape == (120 - 8 + 1, 1) and output.data.dtype == np.float32
+
+    compiled = model.predict(
+        data,
+        type(prediction.config)(params={**prediction.config.params, "compiled": True}),
+    )
+    np.testing.assert_allclose(compiled.data, output.data, atol=1e-5)
+
+
+def test_update_fits_new_rows_and_flags_retrain():
+    pytest.importorskip("keras")
+    model = KerasForecastModel(
+        sequence_length=8,
+        batch_size=16,
+        units=4,
+        epochs=2,
+        validation_len=10,
+        replay_windows=20,
+        update_epochs=1,
+        retrain_every=2,
+        seed=0,
+    )
+    history = make_input(150)
+    initial = history.to_stage(ModelInputData, data=history.data[:120])
+    summary = model.prepare_training(ProblemType.FORECASTING, initial)
+    with pytest.raises(ValueError):
+        model.update(initial, summary.config)
+    model.train(ProblemType.FORECASTING, initial, summary.config)
+
+    first = model.update(
+        history.to_stage(ModelInputData, data=history.data[120:135]), summary.config
+    )
+    assert first.observations["rows"] == 15
+    assert first.observations["windows"] == 20  # replay capped at replay_windows
+    assert not first.observations["retrain_due"] or (
+        first.observations["retrain_reasons"] == ["loss_drift"]
+    )
+    second = model.update(
+        history.to_stage(ModelInputData, data=history.data[135:]), summary.config
+    )
+    assert second.observations["rows_since_retrain"] == 30
+    assert "update_count" in second.observations["retrain_reasons"]
+    longer = TrainingConfig(params={**summary.config.params, "sequence_length": 500})
+    with pytest.raises(ValueError, match="replay buffer"):
+        model.update(history.to_stage(ModelInputData, data=history.data[-5:]), longer)
+
+    model.train(ProblemType.FORECASTING, history, summary.config)
+    assert model._updates == 0
+
+
+def test_strategies_package_defers_the_keras_import():
+    root = Path(__file__).resolve().parents[3]
+    code = (
+        "import sys\n"
+        "import src.infrastructure.strategies as strategies\n"
+        "assert 'keras' not in sys.modules\n"
+        "assert strategies.KerasForecastModel.__name__ == 'KerasForecastModel'\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(root / "src"), str(root)])}
+    subprocess.run([sys.executable, "-c", code], cwd=root, env=env, check=True)
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import FeatureSpec, LagFeatureGenerator
+from src.infrastructure.strategies.i_feature_cleaner.lag_feature_generator import (
+    rolling_extreme,
+)
+
+
+def make_raw(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=rows)
+    bvsp = 100_000 + np.cumsum(rng.normal(0, 500, rows))
+    usd = 5 + np.cumsum(rng.normal(0, 0.02, rows))
+    usd[[i for i in (10, 11, 50, 120) if i < rows]] = np.nan
+    frame = pd.DataFrame({"^BVSP": bvsp, "USDBRL": usd}, index=index)
+    schema = DatasetSchema(columns=["USDBRL"], targets=["^BVSP"])
+    return RawData(data=frame, schema=schema)
+
+
+def test_matches_pandas_rolling_and_shift():
+    raw = make_raw()
+    spec = FeatureSpec(
+        lags=(1, 5),
+        windows=(3, 21),
+        statistics=("mean", "std", "min", "max", "return"),
+    )
+    generator = LagFeatureGenerator(spec)
+    summary = generator.prepare(raw)
+    cleaned = generator.clean(raw, summary.config)
+    frame = cleaned.data
+
+    assert isinstance(cleaned, CleanedData)
+    assert summary.issues["features"] == 2 * (2 + 2 * 5)
+    for series in ("^BVSP", "USDBRL"):
+        source = raw.data[series]
+        for lag in (1, 5):
+            expected = source.shift(lag)
+            np.testing.assert_allclose(
+                frame[f"{series}_lag{lag}"], expected, rtol=1e-6, equal_nan=True
+            )
+        for window in (3, 21):
+            rolling = source.rolling(window)
+            expected = {
+                "mean": rolling.mean(),
+                "std": rolling.std(),
+                "min": rolling.min(),
+                "max": rolling.max(),
+                "return": source / source.shift(window) - 1,
+            }
+            for stat, values in expected.items():
+                np.testing.assert_allclose(
+                    frame[f"{series}_{stat}{window}"],
+                    values,
+                    rtol=1e-5,
+                    atol=1e-6,
+                    equal_nan=True,
+                    err_msg=f"{series}_{stat}{window}",
+                )
+
+    generated = summary.config.params["features"]
+    assert (frame[generated].dtypes == np.float32).all()
+    assert cleaned.schema.columns == ["USDBRL"] + generated
+    assert cleaned.schema.targets == ["^BVSP"]
+    assert cleaned.schema.feature_types["^BVSP_mean21"] == "numeric"
+
+
+def test_shift_min_periods_and_source_selection():
+    raw = make_raw(rows=60)
+    spec = FeatureSpec(series=("^BVSP",), windows=(5,), statistics=("mean",), shift=1)
+    generator = LagFeatureGenerator(
+        [spec, FeatureSpec(series=("USDBRL",), windows=(4,), statistics=("max",))],
+        keep_source=False,
+        min_periods=2,
+    )
+    summary = generator.prepare(raw)
+    cleaned = generator.clean(raw, summary.config)
+
+    assert list(cleaned.data.columns) == ["^BVSP", "^BVSP_mean5_s1", "USDBRL_max4"]
+    source = raw.data["^BVSP"]
+    expected = source.rolling(5, min_periods=2).mean().shift(1)
+    np.testing.assert_allclose(
+        cleaned.data["^BVSP_mean5_s1"], expected, rtol=1e-6, equal_nan=True
+    )
+    usd = raw.data["USDBRL"].rolling(4, min_periods=2).max()
+    np.testing.assert_allclose(
+        cleaned.data["USDBRL_max4"], usd, rtol=1e-6, equal_nan=True
+    )
+    assert generator.required_columns(summary.config, ["USDBRL_max4", "^BVSP"]) == [
+        "^BVSP",
+        "USDBRL",
+    ]
+
+
+def test_rolling_extreme_handles_any_window():
+    values = np.random.default_rng(1).normal(size=37)
+    for window in (1, 2, 5, 36, 37, 40):
+        expected = pd.Series(values).rolling(window, min_periods=1).max()
+        np.testing.assert_array_equal(rolling_extreme(values, window, True), expected)
+        expected = pd.Series(values).rolling(window, min_periods=1).min()
+        np.testing.assert_array_equal(rolling_extreme(values, window, False), expected)
+
+
+def test_rejects_unknown_statistics_and_name_clashes():
+    with pytest.raises(ValueError):
+        FeatureSpec(windows=(5,), statistics=("median",))
+    raw = make_raw(rows=20)
+    generator = LagFeatureGenerator([FeatureSpec(lags=(1,)), FeatureSpec(lags=(1,))])
+    with pytest.raises(ValueError):
+        generator.prepare(raw)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from src.domain.entities.stages.predicted_data import PredictedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import PermutationImportance
+
+
+class Linear:
+    """Row-wise model that records the size of every predict call."""
+
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.calls = []
+
+    def predict(self, matrix):
+        self.calls.append(len(matrix))
+        return matrix @ self.weights
+
+
+def make_data(rows=500, with_truth=False):
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(rows, 4)).astype(np.float32)
+    metadata = {"y_true": matrix @ np.array([4, 2, 0, 0])} if with_truth else {}
+    schema = DatasetSchema(columns=["strong", "weak", "unused", "noise"])
+    return PredictedData(data=matrix, schema=schema, metadata=metadata)
+
+
+@pytest.mark.parametrize("with_truth", [False, True])
+def test_ranks_features_by_contribution(with_truth):
+    model = Linear([4, 2, 0, 0])
+    explainer = PermutationImportance(n_repeats=4, max_rows=200, seed=0)
+    report = explainer.importance_report(model, make_data(with_truth=with_truth))
+
+    assert list(report.index[:2]) == ["strong", "weak"]
+    assert report.loc["unused", "importance"] == pytest.approx(0, abs=1e-9)
+    assert (report["ci_low"] <= report["importance"]).all()
+    assert (report["importance"] <= report["ci_high"]).all()
+
+
+def test_permuted_variants_are_stacked_into_large_batches():
+    model = Linear([4, 2, 0, 0])
+    explainer = PermutationImportance(n_repeats=2, max_rows=100, batch_rows=400)
+    explainer.feature_importances(model, make_data())
+    # per repeat: one reference pass, then all 4 groups in a single batch
+    assert model.calls == [100, 400, 100, 400]
+
+
+def test_groups_are_permuted_jointly():
+    explainer = PermutationImportance(
+        n_repeats=2, groups={"signal": ["strong", "weak"], "rest": ["unused", "noise"]}
+    )
+    scores = explainer.feature_importances(Linear([4, 2, 0, 0]), make_data())
+    assert set(scores) == {"signal", "rest"} and scores["rest"] == 0
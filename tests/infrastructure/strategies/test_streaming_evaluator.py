@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.predicted_data import PredictedData
+from src.domain.interfaces.strategies.i_model_evaluator import EvaluationConfig
+from src.infrastructure.strategies import StreamingEvaluator
+
+
+def make_chunks(rows=600, size=100):
+    rng = np.random.default_rng(0)
+    actual = np.cumsum(rng.normal(size=rows))
+    frame = pd.DataFrame({"y": actual + rng.normal(size=rows), "y_actual": actual})
+    return frame, [
+        PredictedData(data=frame.iloc[i : i + size]) for i in range(0, rows, size)
+    ]
+
+
+def test_stream_and_shards_match_single_pass():
+    frame, chunks = make_chunks()
+    evaluator = StreamingEvaluator(max_workers=3)
+    config = EvaluationConfig(details={})
+
+    whole = evaluator.evaluate(PredictedData(data=frame), config).observations
+    stream = evaluator.evaluate_stream(iter(chunks), config).observations
+    shards = evaluator.evaluate_shards(
+        [chunks[:2], chunks[2:4], chunks[4:]], config
+    ).observations
+
+    assert whole["targets"] == ["y"] and whole["n"] == 600
+    for key in ("mae", "rmse", "bias", "directional_accuracy"):
+        assert stream[key] == pytest.approx(whole[key])
+        assert shards[key] == pytest.approx(whole[key])
+    error = frame["y"] - frame["y_actual"]
+    assert whole["mae"] == pytest.approx(error.abs().mean())
+
+
+def test_pooled_mape_weights_targets_by_nonzero_actuals():
+    frame = pd.DataFrame(
+        {
+            "a": [2.0, 2.0, 2.0, 2.0],
+            "a_actual": [1.0, 1.0, 1.0, 1.0],  # APE 1.0 on 4 rows
+            "b": [1.0, 0.0, 0.0, 0.0],
+            "b_actual": [2.0, 0.0, 0.0, 0.0],  # APE 0.5 on 1 non-zero row
+        }
+    )
+    config = EvaluationConfig(details={"targets": ["a", "b"]})
+    observations = StreamingEvaluator().evaluate(PredictedData(data=frame), config)
+    observations = observations.observations
+    assert observations["per_target"]["b"]["mape"] == pytest.approx(0.5)
+    assert observations["mape"] == pytest.approx((4 * 1.0 + 0.5) / 5)
+
+
+def test_classification_summary():
+    frame = pd.DataFrame({"label": ["a", "b", "b"], "label_actual": ["a", "b", "a"]})
+    config = EvaluationConfig(details={"task": "classification", "labels": ["a", "b"]})
+    observations = StreamingEvaluator().evaluate(PredictedData(data=frame), config)
+    assert observations.observations["accuracy"] == pytest.approx(2 / 3)
+    assert observations.observations["confusion"] == [[1, 1], [0, 1]]
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.raw_data import RawData
+from src.domain.entities.stages.cleaned_data import CleanedData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import VectorizedCleaner
+from tests.domain.contracts.test_data_cleaner_contract import DataCleanerContract
+
+
+def make_raw(rows=200, issues=True):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "a": rng.normal(0, 1, rows),
+            "b": rng.normal(10, 2, rows).astype(np.float32),
+            "label": rng.choice(["x", "y"], rows),
+            "y": rng.normal(100, 5, rows),
+        }
+    )
+    if issues:
+        frame.loc[[3, 7], "a"] = np.nan
+        frame.loc[5, "a"] = 50.0
+        frame.loc[9, "y"] = 1e6
+    schema = DatasetSchema(columns=["a", "b", "label"], targets=["y"])
+    return RawData(data=frame, schema=schema)
+
+
+class TestVectorizedCleanerContract(DataCleanerContract):
+    @pytest.fixture
+    def cleaner_factory(self):
+        return VectorizedCleaner
+
+    @pytest.fixture
+    def sample_raw_data(self):
+        return make_raw()
+
+    @pytest.fixture
+    def valid_raw_data(self):
+        return make_raw(issues=False)
+
+    @pytest.fixture
+    def schema_preserving_checker(self):
+        def check(cleaned: CleanedData, original: RawData) -> bool:
+            return list(cleaned.data.columns) == list(original.data.columns) and len(
+                cleaned.data
+            ) == len(original.data)
+
+        return check
+
+    def test_idempotency_of_clean(self, cleaner_factory, sample_raw_data):
+        # Entities carry fresh identities, so compare the cleaned payloads.
+        cleaner = cleaner_factory()
+        config = cleaner.prepare(sample_raw_data).config
+        first = cleaner.clean(sample_raw_data, config)
+        second = cleaner.clean(first, config)
+        pd.testing.assert_frame_equal(first.data, second.data)
+
+
+def test_statistics_match_pandas():
+    raw = make_raw()
+    summary = VectorizedCleaner().prepare(raw)
+    stats = summary.issues["statistics"]
+    a = raw.data["a"]
+    assert stats["a"]["nulls"] == 2
+    assert stats["a"]["min"] == pytest.approx(a.min())
+    assert stats["a"]["max"] == pytest.approx(50.0)
+    assert stats["a"]["mean"] == pytest.approx(a.mean())
+    assert stats["a"]["std"] == pytest.approx(a.std())
+    for q in (0.01, 0.25, 0.5, 0.99):
+        assert stats["a"][f"q{q:g}"] == pytest.approx(a.quantile(q))
+    assert summary.issues["missing_rate"] == {"a": 2 / 200}
+    assert summary.issues["outliers"]["a"] >= 1 and "label" not in stats
+
+
+def test_clean_imputes_median_and_clips_features_only():
+    raw = make_raw()
+    cleaner = VectorizedCleaner(chunk_bytes=1)  # one column per chunk
+    summary = cleaner.prepare(raw)
+    cleaned = cleaner.clean(raw, summary.config).data
+    stats = summary.issues["statistics"]["a"]
+
+    assert not cleaned["a"].isna().any()
+    assert cleaned.loc[3, "a"] == pytest.approx(stats["q0.5"])
+    assert cleaned.loc[5, "a"] == pytest.approx(summary.config.params["upper"][0])
+    assert cleaned.loc[9, "y"] == 1e6  # targets are not clipped by default
+    assert cleaned["b"].dtype == np.float64  # mixed block: float64
+    assert list(cleaned["label"]) == list(raw.data["label"])
+    assert raw.data.loc[5, "a"] == 50.0  # input untouched
+
+
+def test_float32_block_and_zscore():
+    raw = make_raw()
+    frame = raw.data[["b"]].copy()
+    frame.loc[0, "b"] = np.float32(1e4)
+    raw = RawData(data=frame)
+    cleaner = VectorizedCleaner(outliers="zscore", z_threshold=3, impute="mean")
+    summary = cleaner.prepare(raw)
+    cleaned = cleaner.clean(raw, summary.config).data
+    assert summary.config.params["dtype"] == "float32"
+    assert cleaned["b"].dtype == np.float32
+    assert cleaned.loc[0, "b"] < 1e4
+    with pytest.raises(ValueError):
+        VectorizedCleaner(outliers="mad")
+
+
+def test_update_prepare_matches_full_rescan():
+    raw = make_raw(300)
+    head = raw.to_stage(RawData, data=raw.data.iloc[:200])
+    tail = raw.to_stage(RawData, data=raw.data.iloc[200:])
+    cleaner = VectorizedCleaner(outliers="zscore", impute="mean")
+
+    updated = cleaner.update_prepare(cleaner.prepare(head).config, tail)
+    full = cleaner.prepare(raw)
+    for key in ("fill", "lower", "upper"):
+        np.testing.assert_allclose(
+            updated.config.params[key], full.config.params[key], rtol=1e-9
+        )
+    assert updated.issues["rows"] == 300 and updated.issues["added_rows"] == 100
+    assert updated.issues["missing_rate"] == full.issues["missing_rate"]
+
+    with pytest.raises(NotImplementedError):
+        VectorizedCleaner().update_prepare(full.config, tail)
+
+
+def test_sketch_quantiles_approximate_exact_and_update_incrementally():
+    raw = make_raw(2000)
+    exact = VectorizedCleaner().prepare(raw)
+    sketch = VectorizedCleaner(quantile_method="sketch", sketch_k=256)
+    summary = sketch.prepare(raw)
+    spread = (
+        exact.issues["statistics"]["a"]["q0.75"]
+        - exact.issues["statistics"]["a"]["q0.25"]
+    )
+    for key in ("fill", "lower", "upper"):
+        np.testing.assert_allclose(
+            summary.config.params[key][:2],
+            exact.config.params[key][:2],
+            atol=0.1 * spread,
+        )
+    again = VectorizedCleaner(quantile_method="sketch", sketch_k=256).prepare(raw)
+    for key in ("fill", "lower", "upper"):
+        np.testing.assert_array_equal(
+            again.config.params[key], summary.config.params[key]
+        )
+
+    head = raw.to_stage(RawData, data=raw.data.iloc[:1500])
+    tail = raw.to_stage(RawData, data=raw.data.iloc[1500:])
+    updated = sketch.update_prepare(sketch.prepare(head).config, tail)
+    np.testing.assert_allclose(
+        updated.config.params["fill"][:2],
+        exact.config.params["fill"][:2],
+        atol=0.1 * spread,
+    )
+    assert updated.issues["rows"] == 2000
+    with pytest.raises(ValueError):
+        VectorizedCleaner(quantile_method="tdigest")
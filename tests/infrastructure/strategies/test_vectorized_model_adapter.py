@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.stages.selected_data import SelectedData
+from src.domain.entities.stages.model_input_data import ModelInputData
+from src.domain.entities.stages.model_output_data import ModelOutputData
+from src.domain.entities.value_objects import DatasetSchema
+from src.infrastructure.strategies import VectorizedModelAdapter
+from tests.domain.contracts.test_data_adapter_contract import DataAdapterContract
+
+
+def make_selected(rows=50):
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2024-01-01", periods=rows, freq="D")
+    frame = pd.DataFrame(
+        {
+            "x": rng.normal(5, 2, rows),
+            "regime": rng.choice(["bull", "bear"], rows),
+            "y": rng.normal(100, 10, rows),
+        },
+        index=index,
+    )
+    schema = DatasetSchema(columns=["x", "regime"], targets=["y"])
+    return SelectedData(data=frame, schema=schema)
+
+
+class TestVectorizedModelAdapterContract(DataAdapterContract):
+    @pytest.fixture
+    def adapter_factory(self):
+        return VectorizedModelAdapter
+
+    @pytest.fixture
+    def sample_selected_data(self):
+        return make_selected()
+
+    @pytest.fixture
+    def valid_selected_data(self):
+        return make_selected()
+
+    @pytest.fixture
+    def model_output_data(self):
+        return ModelOutputData(data=np.zeros((5, 1), dtype=np.float32))
+
+    @pytest.fixture
+    def forward_preserving_checker(self):
+        def check(model_input: ModelInputData, selected: SelectedData) -> bool:
+            return model_input.data.shape == (len(selected.data), 3)
+
+        return check
+
+    @pytest.fixture
+    def inverse_preserving_checker(self):
+        return lambda predicted, output: len(predicted.data) == len(output.data)
+
+
+def test_transform_is_float32_in_config_order():
+    adapter = VectorizedModelAdapter()
+    selected = make_selected()
+    config = adapter.prepare_transform(selected).config
+    shuffled = selected.to_stage(SelectedData, data=selected.data[["y", "regime", "x"]])
+
+    matrix = adapter.transform(shuffled, config).data
+    assert matrix.dtype == np.float32 and matrix.flags.c_contiguous
+    assert config.params["feature_order"] == ["x", "regime", "y"]
+    np.testing.assert_allclose(matrix[:, [0, 2]].mean(axis=0), 0, atol=1e-5)
+    np.testing.assert_allclose(matrix[:, [0, 2]].std(axis=0), 1, atol=1e-5)
+    assert set(np.unique(matrix[:, 1])) == {0.0, 1.0}
+
+
+@pytest.mark.filterwarnings("error")
+def test_transform_encodes_unknown_and_missing_categories_as_minus_one():
+    adapter = VectorizedModelAdapter()
+    selected = make_selected()
+    config = adapter.prepare_transform(selected).config
+    frame = selected.data.iloc[:3].copy()
+    frame["regime"] = ["bull", "sideways", None]
+
+    matrix = adapter.transform(selected.to_stage(SelectedData, data=frame), config)
+    assert matrix.data[:, 1].tolist() == [1.0, -1.0, -1.0]
+
+    numeric = selected.to_stage(SelectedData, data=selected.data[["x", "y"]])
+    numeric_config = adapter.prepare_transform(numeric).config
+    assert numeric_config.params["categories"] == {}
+    np.testing.assert_allclose(
+        adapter.transform(numeric, numeric_config).data,
+        np.delete(adapter.transform(selected, config).data, 1, axis=1),
+        rtol=1e-6,
+    )
+
+
+def test_transform_fills_caller_buffer_in_place():
+    adapter = VectorizedModelAdapter(scaling="minmax")
+    selected = make_selected()
+    config = adapter.prepare_transform(selected).config
+    out = np.empty((50, 3), dtype=np.float32)
+
+    assert adapter.transform(selected, config, out=out).data is out
+    np.testing.assert_allclose([out[:, 0].min(), out[:, 0].max()], [0, 1], atol=1e-6)
+    with pytest.raises(ValueError):
+        adapter.transform(selected, config, out=np.empty((50, 3)))
+
+
+def test_inverse_restores_target_units_and_index():
+    adapter = VectorizedModelAdapter()
+    selected = make_selected()
+    model_input = adapter.transform(
+        selected, adapter.prepare_transform(selected).config
+    )
+
+    # an identity "model" that echoes the scaled target of the last 10 rows
+    output = model_input.to_stage(ModelOutputData, data=model_input.data[-10:, 2:])
+    predicted = adapter.inverse_transform(
+        output, adapter.prepare_inverse(output).config
+    )
+
+    assert list(predicted.data.columns) == ["y"]
+    pd.testing.assert_index_equal(predicted.data.index, selected.data.index[-10:])
+    np.testing.assert_allclose(
+        predicted.data["y"].to_numpy(), selected.data["y"].to_numpy()[-10:], rtol=1e-5
+    )
+
+
+def test_robust_scaling_uses_sketched_median_and_iqr_and_merges():
+    adapter = VectorizedModelAdapter(scaling="robust")
+    selected = make_selected(400)
+    config = adapter.prepare_transform(selected).config
+    x = selected.data["x"]
+    iqr = x.quantile(0.75) - x.quantile(0.25)
+    assert 1 / config.params["scale"][0] == pytest.approx(iqr, rel=0.05)
+    assert -config.params["offset"][0] / config.params["scale"][0] == pytest.approx(
+        x.median(), abs=0.05 * iqr
+    )
+    again = VectorizedModelAdapter(scaling="robust").prepare_transform(selected)
+    np.testing.assert_array_equal(again.config.params["scale"], config.params["scale"])
+
+    head = selected.to_stage(SelectedData, data=selected.data.iloc[:250])
+    tail = selected.to_stage(SelectedData, data=selected.data.iloc[250:])
+    updated = adapter.update_transform(
+        adapter.prepare_transform(head).config, tail
+    ).config
+    np.testing.assert_allclose(
+        updated.params["scale"], config.params["scale"], rtol=0.05
+    )
+    with pytest.raises(NotImplementedError):
+        adapter.update_transform(updated, tail, removed=head)